@@ -1,11 +1,15 @@
 #! /usr/bin/env python
-"""Generate the numeric hex list of unicode numerals."""
+"""Generate the numeric hex list and tables of unicode numerals."""
 
 from __future__ import annotations
 
 import pathlib
 import sys
 import unicodedata
+from typing import TYPE_CHECKING, TextIO
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
 
 # This is intended to be called from project root. Enforce this.
 this_file = pathlib.Path(__file__).absolute()
@@ -15,30 +19,92 @@ desired_this_file = cwd / "dev" / this_base
 if this_file != desired_this_file:
     sys.exit(this_base + " must be called from project root")
 
+
+def escape(chars: str) -> str:
+    """Write characters as unicode escapes so the file stays ASCII."""
+    return "".join(
+        f"\\u{ord(c):04x}" if ord(c) <= 0xFFFF else f"\\U{ord(c):08x}"  # noqa: PLR2004
+        for c in chars
+    )
+
+
+def ranges(chars: str) -> Iterator[str]:
+    """Collapse runs of consecutive characters into regex ranges like "a-z"."""
+    codes = sorted(map(ord, chars))
+    i = 0
+    while i < len(codes):
+        j = i
+        while j + 1 < len(codes) and codes[j + 1] == codes[j] + 1:
+            j += 1
+        if j - i >= 2:  # noqa: PLR2004
+            yield f"{escape(chr(codes[i]))}-{escape(chr(codes[j]))}"
+        else:
+            yield escape("".join(map(chr, codes[i : j + 1])))
+        i = j + 1
+
+
+def write_string(name: str, parts: list[str], fl: TextIO, per_line: int) -> None:
+    """Write a string constant, wrapping the escaped parts over several lines."""
+    print(f"{name} = (", file=fl)
+    for i in range(0, len(parts), per_line):
+        print(f'    "{"".join(parts[i : i + per_line])}"', file=fl)
+    print(")", file=fl)
+
+
+# Find the non-ASCII numerals known to this version of Python.
+numeric_chars = []
+for i in range(0x110000):
+    a = chr(i)
+    if a in "0123456789":
+        continue
+    if unicodedata.numeric(a, None) is not None:
+        numeric_chars.append(a)
+numeric = "".join(numeric_chars)
+digits = "".join([a for a in numeric if unicodedata.digit(a, None) is not None])
+decimals = "".join([a for a in numeric if unicodedata.decimal(a, None) is not None])
+digits_no_decimals = "".join([x for x in digits if x not in decimals])
+numeric_no_decimals = "".join([x for x in numeric if x not in decimals])
+
 # We will write the new numeric hex collection to a natsort package file.
 target = cwd / "natsort" / "unicode_numeric_hex.py"
 with target.open("w") as fl:
     print(
-        '''# -*- coding: utf-8 -*-
-"""
-Contains all possible non-ASCII unicode numbers.
-"""
+        f'''"""Contains all possible non-ASCII unicode numbers."""
+
+from __future__ import annotations
 
 # Rather than determine what unicode characters are numeric on the fly which
 # would incur a startup runtime penalty, the hex values are hard-coded below.
+# This file is generated by dev/generate_new_unicode_numbers.py.
+
+# The version of the unicode database the values below were generated from.
+unicode_version = "{unicodedata.unidata_version}"
+
 numeric_hex = (''',
         file=fl,
     )
 
     # Write out each individual hex value.
-    for i in range(0x110000):
-        try:
-            a = chr(i)
-        except ValueError:
-            break
-        if a in "0123456789":
-            continue
-        if unicodedata.numeric(a, None) is not None:
-            print(f"    0x{i:X},", file=fl)
-
+    for a in numeric_chars:
+        print(f"    0x{ord(a):X},", file=fl)
     print(")", file=fl)
+
+    # Write out the characters as strings, in the same order as numeric_hex.
+    for name, chars in (
+        ("numeric", numeric),
+        ("digits", digits),
+        ("decimals", decimals),
+        ("digits_no_decimals", digits_no_decimals),
+        ("numeric_no_decimals", numeric_no_decimals),
+    ):
+        print(file=fl)
+        write_string(name, [escape(c) for c in chars], fl, 7)
+
+    # Write out the characters that are not decimals as regular expression
+    # character classes, with consecutive characters collapsed to ranges.
+    for name, chars in (
+        ("digits_no_decimals_class", digits_no_decimals),
+        ("numeric_no_decimals_class", numeric_no_decimals),
+    ):
+        print(file=fl)
+        write_string(name, list(ranges(chars)), fl, 3)
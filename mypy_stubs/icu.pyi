@@ -1,9 +1,9 @@
-from typing import overload
-
-@overload
-def Locale() -> str: ...
-@overload
-def Locale(x: str) -> str: ...
+class Locale:
+    def __init__(self, x: str = ...) -> None: ...
+    @staticmethod
+    def getAvailableLocales() -> dict[str, Locale]: ...
+    def getLanguage(self) -> str: ...
+    def isBogus(self) -> bool: ...
 
 class UCollAttribute:
     NUMERIC_COLLATION: int
@@ -14,11 +14,11 @@ class UCollAttributeValue:
 class DecimalFormatSymbols:
     kGroupingSeparatorSymbol: int
     kDecimalSeparatorSymbol: int
-    def __init__(self, locale: str) -> None: ...
+    def __init__(self, locale: Locale) -> None: ...
     def getSymbol(self, symbol: int) -> str: ...
 
 class Collator:
     @classmethod
-    def createInstance(cls, locale: str) -> Collator: ...
+    def createInstance(cls, locale: Locale) -> Collator: ...
     def getSortKey(self, source: str) -> bytes: ...
     def setAttribute(self, attr: int, value: int) -> None: ...
@@ -9,55 +9,130 @@ try:
 except ImportError:
     __version__ = "unknown version"
     __version_tuple__ = (0, 0, "unknown version")
-from natsort.natsort import (
-    NatsortKeyType,
-    OSSortKeyType,
-    as_ascii,
-    as_utf8,
-    decoder,
-    humansorted,
-    index_humansorted,
-    index_natsorted,
-    index_realsorted,
-    natsort_key,
-    natsort_keygen,
-    natsorted,
-    numeric_regex_chooser,
-    order_by_index,
-    os_sort_key,
-    os_sort_keygen,
-    os_sorted,
-    realsorted,
-)
-from natsort.ns_enum import NSType, ns
-from natsort.utils import KeyType, NatsortInType, NatsortOutType, chain_functions
+import importlib
+
+# Importing typing is comparatively slow, and is only needed by type-checkers.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from natsort.natsort import (
+        NatsortKeyType,
+        OSSortKeyType,
+        Profile,
+        as_ascii,
+        as_utf8,
+        decoder,
+        humansorted,
+        humansorted_locales,
+        index_humansorted,
+        index_natsorted,
+        index_realsorted,
+        natsort_key,
+        natsort_keygen,
+        natsorted,
+        natsorted_items,
+        numeric_regex_chooser,
+        order_by_index,
+        os_sort_key,
+        os_sort_keygen,
+        os_sorted,
+        profile,
+        realsorted,
+    )
+    from natsort.ns_enum import NSType, ns
+    from natsort.utils import (
+        KeyStats,
+        KeyType,
+        NatsortInType,
+        NatsortOutType,
+        chain_functions,
+    )
 
 __all__ = [
+    "KeyStats",
     "KeyType",
     "NSType",
     "NatsortInType",
     "NatsortKeyType",
     "NatsortOutType",
     "OSSortKeyType",
+    "Profile",
     "as_ascii",
     "as_utf8",
     "chain_functions",
     "decoder",
     "humansorted",
+    "humansorted_locales",
     "index_humansorted",
     "index_natsorted",
     "index_realsorted",
     "natsort_key",
     "natsort_keygen",
     "natsorted",
+    "natsorted_items",
     "ns",
     "numeric_regex_chooser",
     "order_by_index",
     "os_sort_key",
     "os_sort_keygen",
     "os_sorted",
+    "profile",
     "realsorted",
 ]
 
-# Add the ns keys to this namespace for convenience.
-globals().update(dict(ns.__members__.items()))
+# Importing the sorting functions is comparatively slow (e.g. it checks
+# for PyICU and builds the unicode number tables), so the module that
+# defines each public name is only imported the first time it is used.
+# The ns keys are also available in this namespace for convenience.
+_modules = {
+    "KeyStats": "natsort.utils",
+    "KeyType": "natsort.utils",
+    "NSType": "natsort.ns_enum",
+    "NatsortInType": "natsort.utils",
+    "NatsortOutType": "natsort.utils",
+    "chain_functions": "natsort.utils",
+    "ns": "natsort.ns_enum",
+}
+_submodules = {
+    "compat",
+    "fs",
+    "natsort",
+    "ns_enum",
+    "numpy",
+    "pandas",
+    "unicode_numbers",
+    "unicode_numeric_hex",
+    "utils",
+}
+
+
+# Type-checkers see the explicit imports above instead, so that they still
+# report names that do not exist.
+if not TYPE_CHECKING:
+
+    def __getattr__(name: str) -> Any:  # noqa: ANN401
+        """Import the public names and submodules on first use."""
+        if name in _submodules:
+            return importlib.import_module(f"{__name__}.{name}")
+        if name in __all__:
+            module = importlib.import_module(_modules.get(name, "natsort.natsort"))
+            value = getattr(module, name)
+        elif name.isupper():
+            # Only the ns keys are upper case, so the ns enum does not need to
+            # be imported for other names (e.g. those checked by "import from").
+            ns = importlib.import_module("natsort.ns_enum").ns
+            if name not in ns.__members__:
+                msg = f"module {__name__!r} has no attribute {name!r}"
+                raise AttributeError(msg)
+            value = ns[name]
+        else:
+            msg = f"module {__name__!r} has no attribute {name!r}"
+            raise AttributeError(msg)
+        globals()[name] = value
+        return value
+
+    def __dir__() -> list[str]:
+        """Include the names that have not been imported yet."""
+        ns = importlib.import_module("natsort.ns_enum").ns
+        return sorted(set(globals()) | set(__all__) | set(ns.__members__))
@@ -0,0 +1,44 @@
+"""
+Benchmarks for natsort.
+
+Run the benchmark suite with ``python -m natsort.bench run``, optionally
+writing the results as JSON to compare them between commits. Only the
+standard library is needed, so the suite can be run offline.
+
+``python -m natsort.bench compare`` runs the key benchmarks and fails
+if any is slower than the baseline stored with natsort, after normalizing
+for the speed of the machine. Use ``--update`` to store a new baseline.
+
+The corpora the benchmarks are run on can be generated with
+``python -m natsort.bench corpus``, to reproduce a performance report.
+"""
+
+from __future__ import annotations
+
+from natsort.bench.compare import (
+    BASELINE,
+    KEY_BENCHMARKS,
+    Comparison,
+    compare_results,
+)
+from natsort.bench.corpora import CORPORA
+from natsort.bench.suite import (
+    BENCHMARKS,
+    Benchmark,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+
+__all__ = [
+    "BASELINE",
+    "BENCHMARKS",
+    "CORPORA",
+    "KEY_BENCHMARKS",
+    "Benchmark",
+    "Comparison",
+    "compare_results",
+    "load_results",
+    "run_benchmarks",
+    "write_results",
+]
@@ -0,0 +1,238 @@
+"""Run the natsort benchmark suite from the command line."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import TYPE_CHECKING
+
+from natsort.bench.compare import BASELINE, KEY_BENCHMARKS, compare_results
+from natsort.bench.corpora import CORPORA
+from natsort.bench.suite import (
+    BENCHMARKS,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+
+if TYPE_CHECKING:
+    from natsort.bench.compare import Comparison
+    from natsort.bench.suite import Result
+
+
+def format_result(result: Result) -> str:
+    """Format the result of a single benchmark as a line of text."""
+    name = f"{result['name']:<45}"
+    if "skipped" in result:
+        return f"{name} skipped ({result['skipped']})"
+    stats = result["stats"]
+    if "bytes_per_item" in stats:
+        return f"{name} {stats['bytes_per_item']:12.1f} bytes/item"
+    median = stats["median"]
+    unit, scale = next(
+        (unit, scale)
+        for unit, scale in (("s ", 1.0), ("ms", 1e-3), ("us", 1e-6), ("ns", 1e-9))
+        if median >= scale or unit == "ns"
+    )
+    return (
+        f"{name} {median / scale:9.3f} {unit}"
+        f" {stats['items_per_second']:14,.0f} items/s"
+        f" (+/- {100 * stats['stddev'] / stats['mean']:.1f}%)"
+    )
+
+
+def format_comparison(comparison: Comparison, threshold: float) -> str:
+    """Format the comparison of a benchmark with the baseline as a line of text."""
+    status = "REGRESSED" if comparison.change > threshold else "ok"
+    return f"{comparison.name:<45} {comparison.change:+8.1f}%  {status}"
+
+
+def print_result(result: Result) -> None:
+    """Print the result of a benchmark as soon as it is done."""
+    print(format_result(result), flush=True)  # noqa: T201
+
+
+def timing_options(repeat: int, min_time: float) -> argparse.ArgumentParser:
+    """Make the options that control how the benchmarks are timed."""
+    timing = argparse.ArgumentParser(add_help=False)
+    timing.add_argument(
+        "-n",
+        "--size",
+        type=int,
+        default=10000,
+        help="The number of items in each corpus. The default is %(default)s.",
+    )
+    timing.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=repeat,
+        help="The number of timed rounds. The default is %(default)s.",
+    )
+    timing.add_argument(
+        "--min-time",
+        type=float,
+        default=min_time,
+        help="The minimum duration of each round in seconds. "
+        "The default is %(default)s.",
+    )
+    timing.add_argument(
+        "-o",
+        "--json",
+        metavar="FILE",
+        help="Also write the results as JSON to FILE.",
+    )
+    return timing
+
+
+def main(*arguments: str) -> None:
+    """
+    Run the natsort benchmarks.
+
+    Arguments are read from sys.argv.
+    """
+    parser = argparse.ArgumentParser(prog="python -m natsort.bench")
+    commands = parser.add_subparsers(dest="command", required=True)
+    run = commands.add_parser(
+        "run",
+        parents=[timing_options(repeat=5, min_time=0.1)],
+        help="Run the benchmarks and report the results.",
+    )
+    run.add_argument(
+        "-k",
+        "--select",
+        action="append",
+        default=[],
+        metavar="TEXT",
+        help="Only run the benchmarks whose name contains TEXT. "
+        "May be given more than once.",
+    )
+    compare = commands.add_parser(
+        "compare",
+        # More and longer rounds make the comparison reliable on a busy machine.
+        parents=[timing_options(repeat=10, min_time=0.2)],
+        help="Run the key benchmarks and fail if they are slower than the baseline.",
+    )
+    compare.add_argument(
+        "-b",
+        "--benchmark",
+        action="append",
+        choices=[bench.name for bench in BENCHMARKS],
+        metavar="NAME",
+        help="Compare the benchmark NAME instead of the key benchmarks. "
+        "May be given more than once.",
+    )
+    compare.add_argument(
+        "--baseline",
+        default=BASELINE,
+        metavar="FILE",
+        help="The results to compare with. The default is the baseline "
+        "stored with natsort.",
+    )
+    compare.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=20.0,
+        metavar="PERCENT",
+        help="Fail if a benchmark is more than PERCENT slower than the baseline, "
+        "after normalizing for the speed of the machine. "
+        "The default is %(default)s.",
+    )
+    compare.set_defaults(select=[])
+    compare.add_argument(
+        "--update",
+        action="store_true",
+        help="Store the results as the new baseline instead of comparing them.",
+    )
+    corpus = commands.add_parser(
+        "corpus", help="Print a corpus the benchmarks are run on, one item per line."
+    )
+    corpus.add_argument("kind", choices=sorted(CORPORA), help="The corpus to print.")
+    corpus.add_argument(
+        "-n",
+        "--size",
+        type=int,
+        default=10000,
+        help="The number of items to print. The default is %(default)s.",
+    )
+    corpus.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="The seed of the corpus. The default is %(default)s.",
+    )
+    corpus.add_argument(
+        "--duplicates",
+        type=float,
+        default=0.0,
+        help="The fraction of the items that repeat an earlier item. "
+        "The default is %(default)s.",
+    )
+    args = parser.parse_args(arguments or None)
+
+    if args.command == "corpus":
+        try:
+            items = CORPORA[args.kind](
+                args.size, seed=args.seed, duplicates=args.duplicates
+            )
+        except ValueError as e:
+            parser.error(str(e))
+        sys.stdout.writelines(f"{item}\n" for item in items)
+        return
+
+    benchmarks = BENCHMARKS
+    if args.command == "compare":
+        names = args.benchmark or KEY_BENCHMARKS
+        benchmarks = tuple(bench for bench in BENCHMARKS if bench.name in names)
+    results = run_benchmarks(
+        benchmarks,
+        size=args.size,
+        repeat=args.repeat,
+        min_time=args.min_time,
+        select=args.select,
+        calibrate=args.command == "compare",
+        progress=print_result,
+    )
+    if args.json is not None:
+        write_results(results, args.json)
+    if args.command == "compare":
+        compare_with_baseline(
+            results, args.baseline, args.threshold, update=args.update
+        )
+
+
+def compare_with_baseline(
+    results: Result, baseline: str, threshold: float, *, update: bool
+) -> None:
+    """
+    Compare results with the baseline, or store them as the new baseline.
+
+    Exit with an error if any benchmark regressed by more than *threshold*
+    percent, or if the baseline was run in a different environment.
+    """
+    if update:
+        write_results(results, baseline)
+        return
+    try:
+        comparisons = compare_results(load_results(baseline), results)
+    except ValueError as e:
+        sys.exit(f"Cannot compare with the baseline {baseline}, {e}")
+    if not comparisons:
+        sys.exit(f"No benchmarks in common with the baseline {baseline}")
+    print(f"\nCompared with {baseline}:")  # noqa: T201
+    for comparison in comparisons:
+        print(format_comparison(comparison, threshold))  # noqa: T201
+    regressed = [c.name for c in comparisons if c.change > threshold]
+    if regressed:
+        sys.exit(
+            f"Slower than the baseline by more than {threshold}%: "
+            + ", ".join(regressed)
+        )
+
+
+if __name__ == "__main__":
+    try:
+        main()
+    except KeyboardInterrupt:
+        sys.exit(1)
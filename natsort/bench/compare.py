@@ -0,0 +1,117 @@
+"""
+Compare benchmark results with a stored baseline.
+
+The fastest time of each benchmark is divided by the fastest time of a
+calibration workload that does not use natsort, measured in the same run.
+The fastest time is used as it is the least affected by other processes,
+and the calibration is the median of several measurements, so that a
+single slow one does not skew all the benchmarks. If the calibration was
+also timed right after each round of a benchmark, the median ratio of
+the rounds to their calibrations is used instead, which is much less
+affected by a machine that is slower for a while. This normalized time
+mostly depends on natsort itself and not on the speed of the machine,
+so that results can be compared with a baseline that was recorded on
+another machine. They are only compared if they were run with the same
+Python version and optional libraries, as those change what natsort does.
+"""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import TYPE_CHECKING, NamedTuple
+
+if TYPE_CHECKING:
+    from natsort.bench.suite import Result
+
+# The baseline stored with natsort.
+BASELINE = Path(__file__).with_name("baseline.json")
+
+# The benchmarks that are compared with the baseline by default.
+KEY_BENCHMARKS = (
+    "natsorted[filenames]",
+    "realsorted[floats]",
+    "natsorted[paths, PATH]",
+    "humansorted[words]",
+    "os_sorted[filenames]",
+)
+
+
+# The parts of the machine info that change which code natsort runs.
+_ENVIRONMENT = ("python_implementation", "python_version", "fastnumbers", "icu")
+
+
+class Comparison(NamedTuple):
+    """The normalized times of a benchmark in the baseline and the current run."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def change(self) -> float:
+        """How much slower the current run is than the baseline, in percent."""
+        return 100 * (self.current / self.baseline - 1)
+
+
+def _normalized_times(results: Result) -> dict[tuple[str, int], float]:
+    """Return the normalized time of each timed benchmark by name and size."""
+    calibration = results["machine_info"]["calibration"]
+    return {
+        (bench["name"], bench["params"]["size"]): bench["stats"].get(
+            "calibrated", bench["stats"]["min"] / calibration
+        )
+        for bench in results["benchmarks"]
+        if "min" in bench.get("stats", {})
+    }
+
+
+def _environment(results: Result) -> dict[str, object]:
+    """Return what the results were run with, ignoring the Python patch version."""
+    info = results["machine_info"]
+    environment = {name: info.get(name) for name in _ENVIRONMENT}
+    version = environment["python_version"]
+    if isinstance(version, str):
+        environment["python_version"] = ".".join(version.split(".")[:2])
+    return environment
+
+
+def compare_results(baseline: Result, current: Result) -> list[Comparison]:
+    """
+    Compare the timed benchmarks that are in both results.
+
+    Parameters
+    ----------
+    baseline : dict
+        The results to compare with, as returned by :func:`run_benchmarks`.
+    current : dict
+        The results of the current run, as returned by :func:`run_benchmarks`.
+
+    Returns
+    -------
+    out : list of Comparison
+        The normalized time of each benchmark in both results, in the
+        order they were run in the current results. A benchmark is
+        only compared if it was run with the same size in both.
+
+    Raises
+    ------
+    ValueError
+        If the results were run with a different Python implementation,
+        Python minor version, or with and without fastnumbers or PyICU.
+
+    """
+    baseline_env, current_env = _environment(baseline), _environment(current)
+    differences = [
+        f"{name} {baseline_env[name]!r} != {current_env[name]!r}"
+        for name in _ENVIRONMENT
+        if baseline_env[name] != current_env[name]
+    ]
+    if differences:
+        msg = "the results were run in different environments: "
+        raise ValueError(msg + ", ".join(differences))
+    baseline_times = _normalized_times(baseline)
+    return [
+        Comparison(name, baseline_times[name, size], time)
+        for (name, size), time in _normalized_times(current).items()
+        if (name, size) in baseline_times
+    ]
@@ -0,0 +1,199 @@
+"""
+Deterministic synthetic corpora for benchmarking natsort.
+
+Each corpus is a function that takes the number of items to generate,
+a seed, and the fraction of the items that repeat an earlier item.
+The same arguments always give the same corpus, so a performance
+report can be reproduced by quoting them.
+
+Examples
+--------
+>>> from natsort.bench import corpora
+>>> corpora.versions(3, seed=1)
+['1.18.97-alpha.8', '3.12.26-alpha.7', '0.14.34']
+>>> len(set(corpora.filenames(100, duplicates=0.75)))
+25
+
+"""
+
+from __future__ import annotations
+
+import random
+from typing import Any, Callable
+
+from natsort.unicode_numbers import decimals, numeric_no_decimals
+
+Corpus = Callable[..., list[Any]]
+
+_WORDS = (
+    "apple",
+    "Banana",
+    "cherry",
+    "Zebra",
+    "zoo",
+    "item",
+    "Item",
+    "ITEM",
+    "éclair",
+    "Äpfel",
+    "Ärger",
+    "straße",
+    "café",
+    "naïve",
+    "ﬁle",
+)
+
+
+def _generate(
+    make: Callable[[random.Random], Any],
+    size: int,
+    seed: int,
+    duplicates: float,
+) -> list[Any]:
+    """Make *size* items, of which a fraction *duplicates* are repeats."""
+    if not 0 <= duplicates < 1:
+        msg = f"duplicates must be at least 0 and less than 1, got {duplicates}"
+        raise ValueError(msg)
+    rng = random.Random(seed)
+    distinct = [make(rng) for _ in range(size - int(size * duplicates))]
+    if len(distinct) == size:
+        return distinct
+    # Repeat random items, then shuffle so the repeats are not all at the end.
+    items = distinct + rng.choices(distinct, k=size - len(distinct))
+    rng.shuffle(items)
+    return items
+
+
+def filenames(size: int, *, seed: int = 0, duplicates: float = 0.0) -> list[str]:
+    """Make file names like "IMG_1042.jpg" or "Scan (3).pdf"."""
+
+    def make(rng: random.Random) -> str:
+        prefix = rng.choice(("IMG_", "img", "Report ", "photo-", "a", "Scan ("))
+        suffix = ")" if prefix == "Scan (" else ""
+        extension = rng.choice((".jpg", ".png", ".txt", ".tar.gz", ".JPG", ".pdf"))
+        return f"{prefix}{rng.randrange(10000)}{suffix}{extension}"
+
+    return _generate(make, size, seed, duplicates)
+
+
+def image_sequences(size: int, *, seed: int = 0, duplicates: float = 0.0) -> list[str]:
+    """Make the frames of image sequences like "shot010_v002.1001.exr"."""
+
+    def make(rng: random.Random) -> str:
+        shot = rng.randrange(0, 500, 10)
+        version = rng.randrange(1, 20)
+        frame = rng.randrange(1001, 1001 + max(size, 1))
+        extension = rng.choice((".exr", ".dpx", ".png"))
+        return f"shot{shot:03d}_v{version:03d}.{frame:04d}{extension}"
+
+    return _generate(make, size, seed, duplicates)
+
+
+def versions(size: int, *, seed: int = 0, duplicates: float = 0.0) -> list[str]:
+    """Make semantic version strings like "1.10.2-rc.1+build.5"."""
+
+    def make(rng: random.Random) -> str:
+        version = f"{rng.randrange(5)}.{rng.randrange(20)}.{rng.randrange(100)}"
+        if rng.random() < 0.25:  # noqa: PLR2004
+            tag = rng.choice(("alpha", "beta", "rc"))
+            version += f"-{tag}.{rng.randrange(1, 10)}"
+        if rng.random() < 0.1:  # noqa: PLR2004
+            version += f"+build.{rng.randrange(1000)}"
+        return version
+
+    return _generate(make, size, seed, duplicates)
+
+
+def paths(size: int, *, seed: int = 0, duplicates: float = 0.0) -> list[str]:
+    """Make deeply nested POSIX paths like "/data/dir3/dir12/shot_4/take 2.tar.gz"."""
+
+    def make(rng: random.Random) -> str:
+        directories = [f"dir{rng.randrange(20)}" for _ in range(rng.randrange(1, 12))]
+        name = f"take {rng.randrange(100)}{rng.choice(('.tar.gz', '.txt', ''))}"
+        return "/".join(["", "data", *directories, f"shot_{rng.randrange(1000)}", name])
+
+    return _generate(make, size, seed, duplicates)
+
+
+def words(size: int, *, seed: int = 0, duplicates: float = 0.0) -> list[str]:
+    """Make mixed-case and accented words with numbers, like "Äpfel 12 zoo.txt"."""
+
+    def make(rng: random.Random) -> str:
+        first, second = rng.choice(_WORDS), rng.choice(_WORDS)
+        return f"{first} {rng.randrange(1000)} {second}.txt"
+
+    return _generate(make, size, seed, duplicates)
+
+
+def unicode_digits(size: int, *, seed: int = 0, duplicates: float = 0.0) -> list[str]:
+    """
+    Make words followed by numbers written in the digits of any script.
+
+    The digits are taken from :mod:`natsort.unicode_numbers`, and some
+    numbers are numerals that are not decimals, like "½" or "Ⅻ".
+    """
+    # The decimals of each script are stored as a run from zero to nine.
+    scripts = ["0123456789"] + [
+        decimals[i : i + 10] for i in range(0, len(decimals), 10)
+    ]
+
+    def make(rng: random.Random) -> str:
+        word = rng.choice(_WORDS)
+        if rng.random() < 0.1:  # noqa: PLR2004
+            return f"{word} {rng.choice(numeric_no_decimals)}"
+        script = rng.choice(scripts)
+        number = "".join(rng.choice(script) for _ in range(rng.randrange(1, 6)))
+        return f"{word} {number}"
+
+    return _generate(make, size, seed, duplicates)
+
+
+def floats(size: int, *, seed: int = 0, duplicates: float = 0.0) -> list[str]:
+    """Make strings with signed floats and exponents, like "x-1.52e+02"."""
+
+    def make(rng: random.Random) -> str:
+        if rng.random() < 0.05:  # noqa: PLR2004
+            return f"x{rng.choice(('nan', 'inf', '-inf'))}"
+        value = rng.uniform(-1000, 1000) * 10.0 ** rng.randrange(-10, 10)
+        if rng.random() < 0.5:  # noqa: PLR2004
+            return f"x{value:.{rng.randrange(5)}e}"
+        return f"x{value:.{rng.randrange(5)}f}"
+
+    return _generate(make, size, seed, duplicates)
+
+
+def mixed(size: int, *, seed: int = 0, duplicates: float = 0.0) -> list[Any]:
+    """Make a mix of int, float, str, NaN and None values."""
+    makers: tuple[Callable[[random.Random], Any], ...] = (
+        lambda rng: rng.randrange(1000),
+        lambda rng: rng.uniform(0, 1000),
+        lambda rng: f"item {rng.randrange(1000)}",
+        lambda _: None,
+        lambda _: float("nan"),
+    )
+    return _generate(lambda rng: rng.choice(makers)(rng), size, seed, duplicates)
+
+
+def long_numbers(size: int, *, seed: int = 0, duplicates: float = 0.0) -> list[str]:
+    """Make strings with numbers more than a thousand digits long."""
+
+    def make(rng: random.Random) -> str:
+        return f"id{rng.randrange(max(size, 1)):05d}" + "8" * rng.randrange(1000, 1100)
+
+    return _generate(make, size, seed, duplicates)
+
+
+CORPORA: dict[str, Corpus] = {
+    corpus.__name__: corpus
+    for corpus in (
+        filenames,
+        image_sequences,
+        versions,
+        paths,
+        words,
+        unicode_digits,
+        floats,
+        mixed,
+        long_numbers,
+    )
+}
@@ -0,0 +1,462 @@
+"""
+The natsort benchmark suite.
+
+Each benchmark times one operation on a corpus of a given size. The
+results use the same statistics and JSON layout as pytest-benchmark,
+so that they can be read by the tools that already understand it.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import datetime as dt
+import io
+import json
+import locale
+import os
+import platform
+import re
+import statistics
+import subprocess
+import sys
+import timeit
+import tracemalloc
+from functools import partial, reduce
+from importlib.util import find_spec
+from operator import or_
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+
+import natsort
+from natsort import __main__ as natsort_cli
+from natsort.bench.corpora import (
+    filenames,
+    floats,
+    image_sequences,
+    long_numbers,
+    mixed,
+    paths,
+    unicode_digits,
+    versions,
+    words,
+)
+from natsort.ns_enum import ns
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Sequence
+
+    from natsort.bench.corpora import Corpus
+    from natsort.ns_enum import NSType
+
+Timed = Callable[[], object]
+Result = dict[str, Any]
+
+
+class Benchmark(NamedTuple):
+    """A benchmark, and how to prepare what it times."""
+
+    group: str
+    name: str
+    # Given the corpus size, prepare the inputs and return what to time.
+    setup: Callable[[int], Timed]
+    # If True, the memory held by the result is measured instead of time.
+    memory: bool = False
+    # If False, each call handles a single item regardless of the size.
+    scaled: bool = True
+    # A module that must be installed to run the benchmark.
+    requires: str | None = None
+
+
+def _alg(name: str) -> NSType:
+    """Return the ns flags named like "FLOAT|SIGNED"."""
+    return reduce(or_, (ns[x] for x in name.split("|")), ns.DEFAULT)
+
+
+def _keygen(alg: str, locale_name: str | None = None) -> Callable[[int], Timed]:
+    return lambda _: partial(natsort.natsort_keygen, alg=_alg(alg), locale=locale_name)
+
+
+def _keys(alg: str, corpus: Corpus) -> Callable[[int], Timed]:
+    def setup(size: int) -> Timed:
+        key = natsort.natsort_keygen(alg=_alg(alg))
+        data = corpus(size)
+        return lambda: list(map(key, data))
+
+    return setup
+
+
+def _sort(
+    func: Callable[..., object],
+    corpus: Corpus,
+    **kwargs: Any,  # noqa: ANN401
+) -> Callable[[int], Timed]:
+    return lambda size: partial(func, corpus(size), **kwargs)
+
+
+def _cli(*options: str) -> Callable[[int], Timed]:
+    def setup(size: int) -> Timed:
+        arguments = [*options, *filenames(size)]
+
+        def run() -> None:
+            with contextlib.redirect_stdout(io.StringIO()):
+                natsort_cli.main(*arguments)
+
+        return run
+
+    return setup
+
+
+def _cli_startup(_: int) -> Timed:
+    command = [sys.executable, "-m", "natsort", "a10", "a2", "a1"]
+    return partial(subprocess.run, command, check=True, stdout=subprocess.DEVNULL)
+
+
+def _memory(alg: str, corpus: Corpus) -> Benchmark:
+    name = f"memory[{alg}, {corpus.__name__}]"
+    return Benchmark("memory", name, _keys(alg, corpus), memory=True)
+
+
+BENCHMARKS: tuple[Benchmark, ...] = (
+    # Creating a key.
+    Benchmark("keygen", "keygen[DEFAULT]", _keygen("DEFAULT"), scaled=False),
+    Benchmark("keygen", "keygen[REAL|PATH]", _keygen("REAL|PATH"), scaled=False),
+    Benchmark("keygen", "keygen[LOCALE]", _keygen("LOCALE"), scaled=False),
+    Benchmark(
+        "keygen",
+        "keygen[LOCALE, de_DE]",
+        _keygen("LOCALE", "de_DE"),
+        scaled=False,
+        requires="icu",
+    ),
+    # Generating keys for each family of ns flags.
+    *(
+        Benchmark("key", f"key[{alg}, {corpus.__name__}]", _keys(alg, corpus))
+        for alg, corpus in (
+            ("DEFAULT", filenames),
+            ("SIGNED", floats),
+            ("FLOAT", floats),
+            ("REAL", floats),
+            ("FLOAT|NOEXP", floats),
+            ("FLOAT|NANLAST", floats),
+            ("DEFAULT", long_numbers),
+            ("DEFAULT", mixed),
+            ("PATH", paths),
+            ("IGNORECASE", words),
+            ("LOWERCASEFIRST", words),
+            ("GROUPLETTERS", words),
+            ("CAPITALFIRST|UNGROUPLETTERS", words),
+            ("NUMAFTER", filenames),
+            ("COMPATIBILITYNORMALIZE", unicode_digits),
+            ("DEFAULT", unicode_digits),
+            ("LOCALEALPHA", words),
+            ("LOCALENUM", floats),
+            ("LOCALE", words),
+        )
+    ),
+    # Sorting realistic corpora.
+    Benchmark("sort", "natsorted[filenames]", _sort(natsort.natsorted, filenames)),
+    Benchmark("sort", "natsorted[versions]", _sort(natsort.natsorted, versions)),
+    Benchmark(
+        "sort", "natsorted[paths, PATH]", _sort(natsort.natsorted, paths, alg=ns.PATH)
+    ),
+    Benchmark("sort", "natsorted[mixed]", _sort(natsort.natsorted, mixed)),
+    Benchmark(
+        "sort", "natsorted[unicode_digits]", _sort(natsort.natsorted, unicode_digits)
+    ),
+    Benchmark(
+        "sort", "natsorted[image_sequences]", _sort(natsort.natsorted, image_sequences)
+    ),
+    Benchmark(
+        "sort",
+        "natsorted[image_sequences, TEMPLATE]",
+        _sort(natsort.natsorted, image_sequences, alg=ns.TEMPLATE),
+    ),
+    Benchmark("sort", "realsorted[floats]", _sort(natsort.realsorted, floats)),
+    Benchmark("sort", "humansorted[words]", _sort(natsort.humansorted, words)),
+    Benchmark(
+        "sort",
+        "humansorted[words, de_DE]",
+        _sort(natsort.humansorted, words, locale="de_DE"),
+        requires="icu",
+    ),
+    Benchmark(
+        "sort",
+        "humansorted_locales[words]",
+        _sort(natsort.humansorted_locales, words, locales=["de_DE", "sv_SE", "en_US"]),
+        requires="icu",
+    ),
+    Benchmark(
+        "sort", "index_natsorted[filenames]", _sort(natsort.index_natsorted, filenames)
+    ),
+    Benchmark(
+        "sort", "index_natsorted[versions]", _sort(natsort.index_natsorted, versions)
+    ),
+    Benchmark("sort", "os_sorted[filenames]", _sort(natsort.os_sorted, filenames)),
+    Benchmark("sort", "os_sorted[paths]", _sort(natsort.os_sorted, paths)),
+    # Sorting inputs with repeated elements, keying each element or each
+    # distinct element.
+    *(
+        Benchmark(
+            "dedupe",
+            f"natsorted[filenames, {duplicates:.0%} repeated{suffix}]",
+            _sort(
+                natsort.natsorted,
+                partial(filenames, duplicates=duplicates),
+                alg=alg,
+            ),
+        )
+        for duplicates in (0.0, 0.5, 0.9, 0.99)
+        for alg, suffix in ((ns.DEFAULT, ""), (ns.DEDUPE, ", DEDUPE"))
+    ),
+    # Memory held by each key.
+    _memory("DEFAULT", filenames),
+    _memory("PATH", paths),
+    _memory("REAL", floats),
+    _memory("LOCALE", words),
+    # The command line interface.
+    Benchmark("cli", "cli[filenames]", _cli()),
+    Benchmark("cli", "cli[filenames, --paths --locale]", _cli("--paths", "--locale")),
+    Benchmark("cli", "cli[startup]", _cli_startup, scaled=False),
+)
+
+
+# How many times the calibration workload is timed before the benchmarks.
+_CALIBRATION_RUNS = 3
+
+
+def _iterations(timer: timeit.Timer, min_time: float) -> int:
+    """Return how many calls of *timer* last at least *min_time*."""
+    number = 1
+    while timer.timeit(number) < min_time:
+        number *= 2
+    return number
+
+
+def _measure_time(
+    func: Timed,
+    items: int,
+    repeat: int,
+    min_time: float,
+    *,
+    calibration: Timed | None = None,
+) -> Result:
+    """
+    Time *func*, calling it enough times for each round to last *min_time*.
+
+    With a *calibration* workload, it is also timed right after each round,
+    and the median ratio of the rounds to their calibrations is added to
+    the stats as "calibrated". A slowdown of the machine that lasts longer
+    than a round affects both alike, so this ratio varies much less than
+    the times themselves.
+    """
+    timer = timeit.Timer(func)
+    number = _iterations(timer, min_time)
+    if calibration is not None:
+        calibration_timer = timeit.Timer(calibration)
+        calibration_number = _iterations(calibration_timer, min_time)
+    times = []
+    ratios = []
+    for _ in range(repeat):
+        times.append(timer.timeit(number) / number)
+        if calibration is not None:
+            calibration_time = calibration_timer.timeit(calibration_number)
+            ratios.append(times[-1] / (calibration_time / calibration_number))
+    mean = statistics.mean(times)
+    stats: Result = {
+        "min": min(times),
+        "max": max(times),
+        "mean": mean,
+        "median": statistics.median(times),
+        "stddev": statistics.stdev(times) if len(times) > 1 else 0.0,
+        "rounds": repeat,
+        "iterations": number,
+        "ops": 1 / mean,
+        "items_per_second": items / statistics.median(times),
+    }
+    if ratios:
+        stats["calibrated"] = statistics.median(ratios)
+    return stats
+
+
+def _measure_memory(func: Timed, items: int) -> Result:
+    """Measure the memory that is held by the result of *func*."""
+    # Fill any caches first so that only the memory of the result is counted.
+    func()
+    tracemalloc.start()
+    try:
+        result = func()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del result
+    return {"bytes": size, "bytes_per_item": size / max(items, 1)}
+
+
+def _calibration() -> Timed:
+    """
+    Prepare a workload that does not use natsort to measure the machine speed.
+
+    Like natsort, it splits strings with a regular expression, converts
+    numbers and sorts tuples, so its speed varies with the machine and
+    the version of Python in a similar way.
+    """
+    split = re.compile(r"(\d+)").split
+    data = [f"file{i % 97}_{i * 7919 % 10007}.txt" for i in range(1000)]
+
+    def run() -> list[tuple[str | int, ...]]:
+        return sorted(
+            tuple(int(x) if x.isdigit() else x.casefold() for x in split(s))
+            for s in data
+        )
+
+    return run
+
+
+def _machine_info() -> Result:
+    """Describe what the benchmarks ran on."""
+    return {
+        "machine": platform.machine(),
+        "processor": platform.processor(),
+        "system": platform.system(),
+        "release": platform.release(),
+        "cpu_count": os.cpu_count(),
+        "python_implementation": platform.python_implementation(),
+        "python_version": platform.python_version(),
+        "locale": locale.setlocale(locale.LC_COLLATE),
+        "fastnumbers": find_spec("fastnumbers") is not None,
+        "icu": find_spec("icu") is not None,
+    }
+
+
+def _commit_info() -> Result:
+    """Identify the commit that was benchmarked, if run from a git checkout."""
+    info: Result = {}
+    source = Path(natsort.__file__).parent
+    if not (source.parent / ".git").exists():
+        return info
+    for key, command in (
+        ("id", ["git", "rev-parse", "HEAD"]),
+        ("dirty", ["git", "status", "--porcelain", "--untracked-files=no"]),
+    ):
+        try:
+            output = subprocess.run(  # noqa: S603
+                command,
+                cwd=source,
+                capture_output=True,
+                check=True,
+                text=True,
+            ).stdout.strip()
+        except (OSError, subprocess.CalledProcessError):
+            return {}
+        info[key] = output if key == "id" else bool(output)
+    return info
+
+
+def run_benchmarks(  # noqa: PLR0913
+    benchmarks: Iterable[Benchmark] = BENCHMARKS,
+    *,
+    size: int = 10000,
+    repeat: int = 5,
+    min_time: float = 0.1,
+    select: Sequence[str] = (),
+    calibrate: bool = False,
+    progress: Callable[[Result], object] | None = None,
+) -> Result:
+    """
+    Run benchmarks and collect their results.
+
+    Parameters
+    ----------
+    benchmarks : iterable of Benchmark, optional
+        The benchmarks to run. The default is the whole suite.
+    size : int, optional
+        The number of items in each corpus. The default is 10000.
+    repeat : int, optional
+        The number of timed rounds of each benchmark. The default is 5.
+    min_time : float, optional
+        The minimum duration of each round in seconds. The benchmark is
+        called as many times as needed in each round. The default is 0.1.
+    select : sequence of str, optional
+        Only run the benchmarks whose name contains one of these strings.
+        By default all benchmarks are run.
+    calibrate : bool, optional
+        If True, also time the calibration workload right after each
+        round of each timed benchmark, and add the median ratio of the
+        rounds to their calibrations to its stats as "calibrated". This
+        compensates much better for a machine whose speed varies, e.g.
+        one shared with other jobs. It takes about twice as long. The
+        default is False.
+    progress : callable, optional
+        Called with the result of each benchmark as soon as it is done.
+
+    Returns
+    -------
+    out : dict
+        The results, in the same layout as the JSON output of
+        pytest-benchmark. Each benchmark that could not be run
+        because a module is not installed has a "skipped" reason
+        instead of "stats". The machine info includes the fastest time
+        of a calibration workload that does not use natsort, to compare
+        results from different machines. It is the median of the
+        "calibrations" measured before and after the benchmarks.
+
+    """
+    # Calibrate several times and use the median, in case the machine
+    # was busy with something else for a while.
+    workload = _calibration()
+    measure_calibration = partial(_measure_time, workload, 1, repeat, min_time)
+    calibrations = [measure_calibration()["min"] for _ in range(_CALIBRATION_RUNS)]
+    results = []
+    for bench in benchmarks:
+        if select and not any(s in bench.name for s in select):
+            continue
+        result: Result = {
+            "group": bench.group,
+            "name": bench.name,
+            "params": {"size": size if bench.scaled else 1},
+        }
+        if bench.requires is not None and find_spec(bench.requires) is None:
+            result["skipped"] = f"requires {bench.requires}"
+        else:
+            func = bench.setup(size)
+            items = size if bench.scaled else 1
+            if bench.memory:
+                result["stats"] = _measure_memory(func, items)
+            else:
+                result["stats"] = _measure_time(
+                    func,
+                    items,
+                    repeat,
+                    min_time,
+                    calibration=workload if calibrate else None,
+                )
+        results.append(result)
+        if progress is not None:
+            progress(result)
+
+    calibrations.append(measure_calibration()["min"])
+    return {
+        "machine_info": {
+            "calibration": statistics.median(calibrations),
+            "calibrations": calibrations,
+            **_machine_info(),
+        },
+        "commit_info": _commit_info(),
+        "datetime": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "version": natsort.__version__,
+        "benchmarks": results,
+    }
+
+
+def write_results(results: Result, path: str | os.PathLike[str]) -> None:
+    """Write the output of :func:`run_benchmarks` as JSON."""
+    with Path(path).open("w", encoding="utf-8") as fl:
+        json.dump(results, fl, indent=2, ensure_ascii=False)
+        fl.write("\n")
+
+
+def load_results(path: str | os.PathLike[str]) -> Result:
+    """Read results that were written by :func:`write_results`."""
+    with Path(path).open(encoding="utf-8") as fl:
+        results: Result = json.load(fl)
+    return results
@@ -7,7 +7,8 @@ Makes uniform API to either local or PyICU.
 from __future__ import annotations
 
 import sys
-from typing import Callable, Union
+from functools import cache, lru_cache
+from typing import Callable, NamedTuple, Union
 
 StrOrBytes = Union[str, bytes]
 TrxfmFunc = Callable[[str], StrOrBytes]
@@ -37,31 +38,86 @@ try:
     # You would need some odd data to come after that.
     null_string_locale_max = b"x7f" * 50
 
-    def dumb_sort() -> bool:
+    def dumb_sort(loc: str | None = None) -> bool:  # noqa: ARG001
         """Determine if the locale backend is not collating correctly."""
         return False
 
+    @cache
+    def _icu_languages() -> frozenset[str]:
+        """Return the languages that ICU has locale data for."""
+        available = icu.Locale.getAvailableLocales()
+        languages = {icu.Locale(name).getLanguage() for name in available}
+        # "C" and "POSIX" name the root locale, as they do for setlocale.
+        return frozenset(languages | {"", "c", "posix"})
+
     # If using icu, get the locale from the current global locale,
-    def get_icu_locale() -> str:
-        """Return the current locale as understood by ICU."""
+    # unless a locale is given explicitly.
+    def get_icu_locale(loc: str | None = None) -> icu.Locale:
+        """Return the given or current locale as understood by ICU."""
+        if loc is not None:
+            # ICU silently falls back to the root locale for any locale it
+            # has no data for, which would hide a typo in the name.
+            icu_locale = icu.Locale(loc)
+            if icu_locale.isBogus() or icu_locale.getLanguage() not in _icu_languages():
+                msg = f"unknown locale {loc!r}"
+                raise ValueError(msg)
+            return icu_locale
         language_code, encoding = getlocale()
         if language_code is None or encoding is None:  # pragma: no cover
             return icu.Locale()
         return icu.Locale(f"{language_code}.{encoding}")
 
-    def get_strxfrm() -> TrxfmFunc:
+    # Creating and configuring a collator is expensive, so those of the
+    # most recently used locales and options are kept. Once configured, a
+    # collator is only used through its const methods, which ICU documents
+    # as thread-safe, so they can be shared between threads. The global
+    # locale is part of the cache key, so nothing needs to be invalidated
+    # when it changes.
+    @lru_cache(maxsize=32)
+    def _collator(
+        loc: str | None,
+        global_locale: object,  # noqa: ARG001
+        *,
+        numeric: bool,
+    ) -> icu.Collator:
+        """Create a collator, *global_locale* is only part of the cache key."""
+        collator = icu.Collator.createInstance(get_icu_locale(loc))
+        if numeric:
+            collator.setAttribute(
+                icu.UCollAttribute.NUMERIC_COLLATION,
+                icu.UCollAttributeValue.ON,
+            )
+        return collator
+
+    def get_icu_collator(
+        loc: str | None = None,
+        *,
+        numeric: bool = False,
+    ) -> icu.Collator:
+        """Return a collator for the given or current locale, created only once."""
+        return _collator(loc, getlocale() if loc is None else None, numeric=numeric)
+
+    def get_strxfrm(loc: str | None = None) -> TrxfmFunc:
         """Return a strxfrm function."""
-        return icu.Collator.createInstance(get_icu_locale()).getSortKey
+        return get_icu_collator(loc).getSortKey
+
+    def _global_locale() -> object:
+        """Identify the global locale settings used by the ICU backend."""
+        return getlocale()
 
-    def get_thousands_sep() -> str:
+    def _clear_collators() -> None:
+        """Forget the cached collators."""
+        _collator.cache_clear()
+
+    def get_thousands_sep(loc: str | None = None) -> str:
         """Return the appropriate thousands seperator for this locale."""
         sep = icu.DecimalFormatSymbols.kGroupingSeparatorSymbol
-        return icu.DecimalFormatSymbols(get_icu_locale()).getSymbol(sep)
+        return icu.DecimalFormatSymbols(get_icu_locale(loc)).getSymbol(sep)
 
-    def get_decimal_point() -> str:
+    def get_decimal_point(loc: str | None = None) -> str:
         """Return the appropriate decimal point for this locale."""
         sep = icu.DecimalFormatSymbols.kDecimalSeparatorSymbol
-        return icu.DecimalFormatSymbols(get_icu_locale()).getSymbol(sep)
+        return icu.DecimalFormatSymbols(get_icu_locale(loc)).getSymbol(sep)
 
 except ImportError:
     import locale
@@ -70,18 +126,38 @@ except ImportError:
     null_string_locale = null_string
     null_string_locale_max = null_string_max
 
+    # The locale library only knows the global locale.
+    def _require_global_locale(loc: str | None) -> None:
+        if loc is not None:
+            msg = f"sorting with the explicit locale {loc!r} requires PyICU"
+            raise ValueError(msg)
+
     # On some systems, locale is broken and does not sort in the expected
     # order. We will try to detect this and compensate.
-    def dumb_sort() -> bool:
+    def dumb_sort(loc: str | None = None) -> bool:
         """Determine if the locale backend is not collating correctly."""
+        _require_global_locale(loc)
         return strxfrm("A") < strxfrm("a")
 
-    def get_strxfrm() -> TrxfmFunc:
+    def get_strxfrm(loc: str | None = None) -> TrxfmFunc:
         """Return a strxfrm function."""
+        _require_global_locale(loc)
         return strxfrm
 
-    def get_thousands_sep() -> str:
+    def _clear_collators() -> None:
+        """Do nothing, collators are only used by the ICU backend."""
+
+    def _global_locale() -> object:
+        """Identify the global locale settings used by the locale backend."""
+        # Calling setlocale without a locale only queries the setting.
+        return tuple(
+            locale.setlocale(category)
+            for category in (locale.LC_CTYPE, locale.LC_COLLATE, locale.LC_NUMERIC)
+        )
+
+    def get_thousands_sep(loc: str | None = None) -> str:
         """Return the appropriate thousands seperator for this locale."""
+        _require_global_locale(loc)
         sep = locale.localeconv()["thousands_sep"]
         # If this locale library is broken, some of the thousands separator
         # characters are incorrectly blank. Here is a lookup table of the
@@ -129,6 +205,48 @@ except ImportError:
             }.get(loc, sep)
         return sep
 
-    def get_decimal_point() -> str:
+    def get_decimal_point(loc: str | None = None) -> str:
         """Return the appropriate decimal point for this locale."""
+        _require_global_locale(loc)
         return locale.localeconv()["decimal_point"]
+
+
+class LocaleState(NamedTuple):
+    """The properties of a locale that are needed to generate sort keys."""
+
+    dumb_sort: bool
+    thousands_sep: str
+    decimal_point: str
+
+
+# Looking up the locale properties is comparatively slow, so they are
+# looked up once for each locale, and kept for the most recently used.
+# Because the global locale settings are part of the cache key, calling
+# setlocale does not need to invalidate anything.
+@lru_cache(maxsize=32)
+def _locale_state(
+    loc: str | None,
+    global_locale: object,  # noqa: ARG001
+) -> LocaleState:
+    return LocaleState(
+        dumb_sort=dumb_sort(loc),
+        thousands_sep=get_thousands_sep(loc),
+        decimal_point=get_decimal_point(loc),
+    )
+
+
+def get_locale_state(loc: str | None = None) -> LocaleState:
+    """Return the properties of the given or current locale."""
+    return _locale_state(loc, _global_locale() if loc is None else None)
+
+
+def clear_locale_cache() -> None:
+    """
+    Forget the cached properties of all locales.
+
+    This is only needed if the definition of a locale has changed
+    while the program is running, e.g. after installing a new
+    version of the locale data.
+    """
+    _locale_state.cache_clear()
+    _clear_collators()
@@ -0,0 +1,365 @@
+"""
+Natural sorting of directory listings.
+
+These functions are built on :func:`os.scandir` so that the file type
+information cached on each :class:`os.DirEntry` is used instead of
+making additional calls to :func:`os.stat`.
+"""
+
+from __future__ import annotations
+
+import heapq
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatch
+from functools import partial
+from itertools import count
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Optional, Union
+
+from natsort.natsort import natsort_keygen, os_sort_keygen
+from natsort.ns_enum import ns
+
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+    from natsort.ns_enum import NSType
+    from natsort.utils import NatsortOutType
+
+DirEntry = os.DirEntry[str]
+DirEntryKey = Callable[[DirEntry], Any]
+PathLike = Union[str, "os.PathLike[str]"]
+ScanResult = tuple[list[DirEntry], list[DirEntry]]
+ScanFn = Callable[[], ScanResult]
+WalkResult = tuple[str, list[DirEntry], list[DirEntry]]
+OnError = Callable[[OSError], Any]
+GlobNode = Optional[tuple[int, bool]]
+GlobItem = tuple[Any, str, int, GlobNode]
+
+_magic_check = re.compile("[*?[]")
+
+
+def _entry_keygen(alg: NSType | None) -> Callable[[DirEntry], NatsortOutType]:
+    """Return a key that sorts directory entries by name."""
+    if alg is None:
+        return os_sort_keygen(key=attrgetter("name"))
+    return natsort_keygen(key=attrgetter("name"), alg=alg)
+
+
+def _is_dir(entry: DirEntry) -> bool:
+    """Like DirEntry.is_dir, but an error means the entry is not a directory."""
+    try:
+        return entry.is_dir()
+    except OSError:
+        return False
+
+
+def _scan(path: PathLike, key: DirEntryKey, reverse: bool) -> ScanResult:  # noqa: FBT001
+    """Return the sorted directories and files in *path*."""
+    with os.scandir(path) as it:
+        entries = sorted(it, key=key, reverse=reverse)
+    dirs: list[DirEntry] = []
+    files: list[DirEntry] = []
+    for entry in entries:
+        (dirs if _is_dir(entry) else files).append(entry)
+    return dirs, files
+
+
+def natscandir(
+    path: PathLike = ".",
+    *,
+    alg: NSType | None = None,
+    reverse: bool = False,
+    dirs_first: bool = False,
+) -> list[DirEntry]:
+    """
+    Return the entries of a directory in natural order.
+
+    Parameters
+    ----------
+    path : str | os.PathLike, optional
+        The directory to list. The default is the current directory.
+
+    alg : ns enum, optional
+        How to sort the entry names, see :class:`ns` for details.
+        If not given, entries are sorted in the same order as your
+        operating system's file browser, like :func:`os_sorted`.
+
+    reverse : {{True, False}}, optional
+        Return the entries in reversed sorted order. The default is
+        `False`.
+
+    dirs_first : {{True, False}}, optional
+        Place the directories before the other entries. The default is
+        `False`.
+
+    Returns
+    -------
+    out : list of os.DirEntry
+        The sorted entries of *path*.
+
+    See Also
+    --------
+    natwalk
+    os_sorted
+
+    Examples
+    --------
+    Use the cached information on each :class:`os.DirEntry`::
+
+        >>> from natsort.fs import natscandir
+        >>> names = [entry.name for entry in natscandir(".")]
+
+    """
+    key = _entry_keygen(alg)
+    if dirs_first:
+        dirs, files = _scan(path, key, reverse)
+        return dirs + files
+    with os.scandir(path) as it:
+        return sorted(it, key=key, reverse=reverse)
+
+
+def natwalk(  # noqa: PLR0913
+    top: PathLike,
+    *,
+    alg: NSType | None = None,
+    reverse: bool = False,
+    followlinks: bool = False,
+    onerror: OnError | None = None,
+    max_workers: int | None = None,
+) -> Iterator[WalkResult]:
+    """
+    Walk a directory tree, visiting each directory in natural order.
+
+    This is like :func:`os.walk` with ``topdown=True``, except that
+    the directories and files are sorted and are given as
+    :class:`os.DirEntry` objects instead of names. As with
+    :func:`os.walk`, the directory list may be modified in-place to
+    control which subdirectories are visited.
+
+    Parameters
+    ----------
+    top : str | os.PathLike
+        The root of the directory tree.
+
+    alg : ns enum, optional
+        How to sort the entry names, see :class:`ns` for details.
+        If not given, entries are sorted in the same order as your
+        operating system's file browser, like :func:`os_sorted`.
+
+    reverse : {{True, False}}, optional
+        Visit the entries in reversed sorted order. The default is
+        `False`.
+
+    followlinks : {{True, False}}, optional
+        Visit directories pointed to by symlinks. The default is `False`.
+
+    onerror : callable, optional
+        Called with the :class:`OSError` if a directory cannot be listed.
+        By default the error is ignored.
+
+    max_workers : int, optional
+        If given, subdirectories are listed concurrently in a thread pool
+        with this many workers. The order in which the directories are
+        visited does not change.
+
+    Yields
+    ------
+    out : tuple
+        The path of the directory, a list of its subdirectories, and
+        a list of its other entries.
+
+    See Also
+    --------
+    natscandir
+
+    """
+    key = _entry_keygen(alg)
+    if max_workers is None:
+        yield from _walk(
+            top, lambda p: partial(_scan, p, key, reverse), followlinks, onerror
+        )
+        return
+
+    with ThreadPoolExecutor(max_workers) as pool:
+        try:
+            yield from _walk(
+                top,
+                lambda p: pool.submit(_scan, p, key, reverse).result,
+                followlinks,
+                onerror,
+            )
+        finally:
+            pool.shutdown(cancel_futures=True)
+
+
+def _walk(
+    top: PathLike,
+    submit: Callable[[PathLike], ScanFn],
+    followlinks: bool,  # noqa: FBT001
+    onerror: OnError | None,
+) -> Iterator[WalkResult]:
+    """Walk a directory tree, listing each directory with *submit*."""
+    top = os.fspath(top)
+    stack = [(top, submit(top))]
+    while stack:
+        path, pending = stack.pop()
+        try:
+            dirs, files = pending()
+        except OSError as err:
+            if onerror is not None:
+                onerror(err)
+            continue
+        yield path, dirs, files
+
+        # Only list the directories that remain after the caller had
+        # a chance to prune them, and visit them in sorted order.
+        visit = [d.path for d in dirs if followlinks or not d.is_symlink()]
+        stack.extend((p, submit(p)) for p in reversed(visit))
+
+
+def natglob(
+    pattern: str,
+    *,
+    alg: NSType = ns.PATH,
+    recursive: bool = False,
+) -> Iterator[str]:
+    """
+    Return an iterator of the paths matching a pattern in natural order.
+
+    This matches the same paths as :func:`glob.iglob`, and yields them
+    in the same order as :func:`natsorted` would with ``ns.PATH``.
+    Unlike sorting the output of :func:`glob.glob`, the matches are
+    yielded as soon as they are found, one directory at a time,
+    so the first results are available immediately and only the
+    directories that have not been visited yet are held in memory.
+
+    Parameters
+    ----------
+    pattern : str
+        A shell-style wildcard pattern, as for :func:`glob.glob`.
+
+    alg : ns enum, optional
+        How to sort the paths, see :class:`ns` for details.
+        ``ns.PATH`` is always added. The default is ``ns.PATH``.
+
+    recursive : {{True, False}}, optional
+        If `True`, the pattern "``**``" matches any files and zero or
+        more directories and subdirectories. The default is `False`.
+
+    Yields
+    ------
+    out : str
+        The paths that match *pattern*.
+
+    See Also
+    --------
+    natsorted
+    natwalk
+
+    Examples
+    --------
+    Consume only the first few matches::
+
+        >>> from itertools import islice
+        >>> from natsort.fs import natglob
+        >>> first = list(islice(natglob("**/*.py", recursive=True), 5))
+
+    """
+    key = natsort_keygen(alg=alg | ns.PATH)
+    root, segments, dirs_only = _split_pattern(pattern, recursive=recursive)
+    tiebreak = count()
+    heap: list[GlobItem] = []
+
+    def push_dir(path: str, i: int, *, top: bool = True) -> None:
+        if i == len(segments):
+            path = os.path.join(path, "") if dirs_only else path
+            heapq.heappush(heap, (key(path), path, next(tiebreak), None))
+            return
+        # The key of every path under this directory begins with the
+        # key of the directory, so the directory is ordered by that
+        # shared prefix. The base name "_" is only there to be removed.
+        prefix = key(os.path.join(path, "_"))[:-1]
+        heapq.heappush(heap, (prefix, path, next(tiebreak), (i, top)))
+
+    push_dir(root, 0)
+    while heap:
+        _, path, _, node = heapq.heappop(heap)
+        if node is None:
+            yield path
+        else:
+            for child, i, top in _glob_children(path, *node, segments, dirs_only):
+                push_dir(child, i, top=top)
+
+
+def _glob_children(
+    path: str,
+    i: int,
+    top: bool,  # noqa: FBT001
+    segments: list[str],
+    dirs_only: bool,  # noqa: FBT001
+) -> Iterator[tuple[str, int, bool]]:
+    """Yield the paths under *path* matching the *i*-th pattern component."""
+    last = i + 1 == len(segments)
+    if segments[i] == "**":
+        yield from _glob_recursive(path, i, top, last=last, dirs_only=dirs_only)
+    elif not _magic_check.search(segments[i]):
+        child = os.path.join(path, segments[i])
+        if os.path.isdir(child) or (last and not dirs_only and os.path.lexists(child)):
+            yield child, i + 1, True
+    else:
+        hidden = segments[i].startswith(".")
+        for entry in _iter_dir(path, hidden=hidden):
+            if fnmatch(entry.name, segments[i]) and (
+                (last and not dirs_only) or _is_dir(entry)
+            ):
+                yield os.path.join(path, entry.name), i + 1, True
+
+
+def _glob_recursive(
+    path: str,
+    i: int,
+    top: bool,  # noqa: FBT001
+    *,
+    last: bool,
+    dirs_only: bool,
+) -> Iterator[tuple[str, int, bool]]:
+    """Match zero directories, then every directory below *path*, for "**"."""
+    if not last:
+        yield path, i + 1, True
+    elif top and path:
+        yield os.path.join(path, ""), i + 1, True
+    for entry in _iter_dir(path, hidden=False):
+        child = os.path.join(path, entry.name)
+        is_dir = _is_dir(entry) and not entry.is_symlink()
+        if last and (is_dir or not dirs_only):
+            yield child, i + 1, True
+        if is_dir:
+            yield child, i, False
+
+
+def _split_pattern(pattern: str, *, recursive: bool) -> tuple[str, list[str], bool]:
+    """Split a glob pattern into its root, its components, and if it ends in a sep."""
+    seps = os.sep + (os.altsep or "")
+    drive, rest = os.path.splitdrive(pattern)
+    relative = rest.lstrip(seps)
+    root = drive + rest[: len(rest) - len(relative)]
+    segments: list[str] = []
+    for segment in re.split(f"[{re.escape(seps)}]", relative):
+        if not segment or (segment == "**" and segments[-1:] == ["**"]):
+            continue
+        # Without recursive, "**" is the same as "*".
+        segments.append(segment if recursive or segment != "**" else "*")
+    return root, segments, relative.endswith(tuple(seps))
+
+
+def _iter_dir(path: str, *, hidden: bool) -> Iterator[DirEntry]:
+    """Yield the entries of *path*, or nothing if it cannot be listed."""
+    try:
+        with os.scandir(path or os.curdir) as it:
+            for entry in it:
+                if hidden or not entry.name.startswith("."):
+                    yield entry
+    except OSError:
+        return
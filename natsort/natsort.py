@@ -7,7 +7,11 @@ The majority of the "work" is defined in utils.py.
 from __future__ import annotations
 
 import platform
-from functools import partial
+import sys
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache, partial
 from operator import itemgetter
 from pathlib import PurePath
 from typing import (
@@ -24,10 +28,14 @@ from natsort.ns_enum import NS_DUMB, NSType, ns
 from natsort.utils import NatsortInType, NatsortOutType
 
 if TYPE_CHECKING:
-    from collections.abc import Iterable, Iterator, Sequence
+    from collections.abc import Iterable, Iterator, Mapping, Sequence
+
+    from natsort.compat.locale import StrOrBytes
 
 # Common input and output types
 T = TypeVar("T")
+K = TypeVar("K")
+V = TypeVar("V")
 NatsortInTypeT = TypeVar("NatsortInTypeT", bound=NatsortInType)
 
 # The type that natsort_key returns
@@ -125,9 +133,15 @@ def as_utf8(s: Any) -> Any:  # noqa: ANN401
     return utils.do_decoding(s, "utf-8")
 
 
-def natsort_keygen(
+def natsort_keygen(  # noqa: PLR0913
     key: Callable[[Any], NatsortInType] | None = None,
     alg: NSType = ns.DEFAULT,
+    *,
+    locale: str | None = None,
+    stats: utils.KeyStats | None = None,
+    max_length: int | None = None,
+    on_truncate: Callable[[str], object] | None = None,
+    engine: str = "auto",
 ) -> Callable[[Any], NatsortOutType]:
     """
     Generate a key to sort strings and numbers naturally.
@@ -151,12 +165,49 @@ def natsort_keygen(
         uses when sorting. For details into these options, please see
         the :class:`ns` class documentation. The default is `ns.INT`.
 
+    locale : str, optional
+        The locale to sort with when `alg` includes ``ns.LOCALE``, for
+        example ``"de_DE"``. The global locale set by
+        :func:`locale.setlocale` is then neither used nor changed, so keys
+        for different locales can be used at the same time in different
+        threads. This requires PyICU. If not given, the current global
+        locale is used.
+
+    stats : KeyStats, optional
+        If given, the key records the number of calls and the time spent
+        in each stage of parsing strings in this object, to find out what
+        makes sorting slow. Keys that are made without it do not pay for
+        this. See :class:`KeyStats`.
+
+    max_length : int, optional
+        If given, only the first `max_length` characters of longer strings
+        are parsed, which bounds the time taken by very long strings (e.g.
+        pasted logs). Strings that are the same up to `max_length` are
+        then ordered after any that have a number at that position, and
+        among themselves by their remaining characters compared as plain
+        text. With ``ns.PATH``, this applies to each part of a path.
+        By default strings are parsed completely.
+
+    on_truncate : callable, optional
+        Called with each string that is longer than `max_length`, for
+        example to count or log them.
+
+    engine : {{"auto", "unicode", "ascii"}}, optional
+        How strings are split into numbers and non-numbers. "unicode"
+        finds all Unicode numeric characters. "ascii" is faster, but
+        only finds ASCII numbers, so it should only be used if all input
+        is known to be ASCII. "auto" uses "ascii" for each string that is
+        ASCII, and otherwise "unicode". The default is "auto".
+
     Returns
     -------
     out : function
         A function that parses input for natural sorting that is
         suitable for passing as the `key` argument to functions
-        such as `sorted`.
+        such as `sorted`. With ``ns.LOCALE``, it remembers the locale
+        transformation of recently seen words, and its ``cache_info``
+        attribute reports how often they were reused, as for
+        :func:`functools.lru_cache`.
 
     See Also
     --------
@@ -173,45 +224,49 @@ def natsort_keygen(
         >>> a
         ['num-3', 'num2', 'num5.10', 'num5.3']
 
+    Only parse the beginning of very long strings, and count them::
+
+        >>> truncated = []
+        >>> key = natsort_keygen(max_length=6, on_truncate=truncated.append)
+        >>> sorted(["log 10 " + "x" * 10**6, "log 9", "log 10"], key=key)[0]
+        'log 9'
+        >>> len(truncated)
+        1
+
     """
     try:
         ns.DEFAULT | alg
     except TypeError:
         msg = "natsort_keygen: 'alg' argument must be from the enum 'ns'"
         raise ValueError(msg + f", got {alg!s}") from None
+    if max_length is not None and max_length < 1:
+        msg = "natsort_keygen: 'max_length' argument must be at least 1"
+        raise ValueError(msg + f", got {max_length}")
+    if engine not in ("auto", "unicode", "ascii"):
+        msg = "natsort_keygen: 'engine' argument must be 'auto', 'unicode' or 'ascii'"
+        raise ValueError(msg + f", got {engine!r}")
 
-    # Add the NS_DUMB option if the locale library is broken.
-    if alg & ns.LOCALEALPHA and natsort.compat.locale.dumb_sort():
-        alg |= NS_DUMB
-
-    # Set some variables that will be passed to the factory functions
-    if alg & ns.NUMAFTER:
-        if alg & ns.LOCALEALPHA:
-            sep = natsort.compat.locale.null_string_locale_max
-        else:
-            sep = natsort.compat.locale.null_string_max
-        pre_sep = natsort.compat.locale.null_string_max
-    else:
-        if alg & ns.LOCALEALPHA:
-            sep = natsort.compat.locale.null_string_locale
-        else:
-            sep = natsort.compat.locale.null_string
-        pre_sep = natsort.compat.locale.null_string
-    regex = utils.regex_chooser(alg)
+    alg, sep, pre_sep = _keygen_setup(alg, locale=locale)
 
     # Create the functions that will be used to split strings.
-    input_transform = utils.input_string_transform_factory(alg)
-    component_transform = utils.string_component_transform_factory(alg)
+    input_transform = utils.input_string_transform_factory(alg, locale=locale)
+    component_transform = utils.string_component_transform_factory(
+        alg,
+        locale=locale,
+    )
     final_transform = utils.final_data_transform_factory(alg, sep, pre_sep)
 
     # Create the high-level parsing functions for strings, bytes, and numbers.
     string_func = utils.parse_string_factory(
         alg,
         sep,
-        regex.split,
+        utils.string_splitter_factory(alg, engine),
         input_transform,
         component_transform,
         final_transform,
+        stats=stats,
+        max_length=max_length,
+        on_truncate=on_truncate,
     )
     if alg & ns.PATH:
         string_func = utils.parse_path_factory(string_func)
@@ -219,13 +274,64 @@ def natsort_keygen(
     num_func = utils.parse_number_or_none_factory(alg, sep, pre_sep)
 
     # Return the natsort key with the parsing path pre-chosen.
-    return partial(
+    sort_key = partial(
         utils.natsort_key,
         key=key,
         string_func=string_func,
         bytes_func=bytes_func,
         num_func=num_func,
     )
+    cache_info = getattr(component_transform, "cache_info", None)
+    if cache_info is not None:
+        sort_key.cache_info = cache_info  # type: ignore[attr-defined]
+    return sort_key
+
+
+def _keygen_setup(
+    alg: NSType,
+    *,
+    locale: str | None = None,
+) -> tuple[NSType, StrOrBytes, str]:
+    """Return *alg* adjusted for the locale library and the separators to use."""
+    # Add the NS_DUMB option if the locale library is broken.
+    get_locale_state = natsort.compat.locale.get_locale_state
+    if alg & ns.LOCALEALPHA and get_locale_state(locale).dumb_sort:
+        alg |= NS_DUMB
+
+    # Set some variables that will be passed to the factory functions
+    sep: StrOrBytes
+    if alg & ns.NUMAFTER:
+        if alg & ns.LOCALEALPHA:
+            sep = natsort.compat.locale.null_string_locale_max
+        else:
+            sep = natsort.compat.locale.null_string_max
+        pre_sep = natsort.compat.locale.null_string_max
+    else:
+        if alg & ns.LOCALEALPHA:
+            sep = natsort.compat.locale.null_string_locale
+        else:
+            sep = natsort.compat.locale.null_string
+        pre_sep = natsort.compat.locale.null_string
+    return alg, sep, pre_sep
+
+
+def _natsort_batch_keygen(
+    alg: NSType,
+    *,
+    locale: str | None = None,
+) -> utils.StrBatchParser:
+    """Return a function that generates the natsort keys for a list of str."""
+    alg, sep, pre_sep = _keygen_setup(alg, locale=locale)
+    return utils.parse_string_batch_factory(
+        alg,
+        sep,
+        batch_splitter=utils.string_batch_splitter_factory(alg),
+        input_transform=utils.input_string_transform_factory(alg, locale=locale),
+        component_transform=utils.string_component_transform_factory(
+            alg, locale=locale
+        ),
+        final_transform=utils.final_data_transform_factory(alg, sep, pre_sep),
+    )
 
 
 # Exposed for simplicity if one needs the default natsort key.
@@ -248,6 +354,8 @@ def natsorted(
     key: Callable[[T], NatsortInType] | None = None,
     reverse: bool = False,
     alg: NSType = ns.DEFAULT,
+    *,
+    locale: str | None = None,
 ) -> list[T]:
     """
     Sort an iterable naturally.
@@ -271,6 +379,10 @@ def natsorted(
         uses when sorting. For details into these options, please see
         the :class:`ns` class documentation. The default is `ns.INT`.
 
+    locale : str, optional
+        The locale to sort with when `alg` includes ``ns.LOCALE``.
+        See :func:`natsort_keygen` for details.
+
     Returns
     -------
     out: list
@@ -295,7 +407,85 @@ def natsorted(
     """
     if alg & ns.PRESORT:
         seq = sorted(seq, reverse=reverse, key=str)
-    return sorted(seq, reverse=reverse, key=natsort_keygen(key, alg))
+    seq = list(seq)
+    if _profiles.get():
+        natkey = natsort_keygen(key, alg, locale=locale)
+        return [seq[i] for i in _profiled_order(seq, natkey, reverse)]
+    # Apply the key only once, however many strategies are tried.
+    values = seq if key is None else [key(x) for x in seq]
+    order = None
+    if alg & ns.DEDUPE:
+        order = _dedupe_order(values, reverse, alg, locale=locale)
+    if order is None and alg & ns.TEMPLATE:
+        order = _template_order(values, reverse, alg, locale=locale)
+    if order is None and key is None and len(seq) < _BATCH_MINIMUM:
+        # Short inputs are sorted directly, without an order of indexes.
+        return sorted(seq, reverse=reverse, key=natsort_keygen(alg=alg, locale=locale))
+    if order is None:
+        order = _keyed_order(values, reverse, alg, locale=locale)
+    return [seq[i] for i in order]
+
+
+def natsorted_items(
+    mapping: Mapping[K, V],
+    by: str = "key",
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+) -> list[tuple[K, V]]:
+    """
+    Sort the items of a mapping naturally.
+
+    Parameters
+    ----------
+    mapping : mapping
+        The mapping (e.g. a `dict`) whose items will be sorted.
+
+    by : {{"key", "value"}}, optional
+        Sort the items by their key or by their value. When sorting by
+        key, items with equivalent keys (e.g. "a1" and "a01") stay in the
+        order of the mapping. When sorting by value, items with equivalent
+        values are sorted by their key. The default is "key".
+
+    reverse : {{True, False}}, optional
+        Return the list in reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    Returns
+    -------
+    out : list
+        The sorted (key, value) pairs.
+
+    Raises
+    ------
+    ValueError
+        If `by` is not "key" or "value".
+
+    See Also
+    --------
+    natsorted
+
+    Examples
+    --------
+    Use `natsorted_items` to sort a `dict` by key or by value::
+
+        >>> a = {"num3": "b10", "num5": "b2", "num2": "b1"}
+        >>> natsorted_items(a)
+        [('num2', 'b1'), ('num3', 'b10'), ('num5', 'b2')]
+        >>> natsorted_items(a, by="value")
+        [('num2', 'b1'), ('num5', 'b2'), ('num3', 'b10')]
+
+    """
+    if by == "key":
+        return natsorted(mapping.items(), itemgetter(0), reverse, alg)
+    if by == "value":
+        return natsorted(mapping.items(), itemgetter(1, 0), reverse, alg)
+    msg = f"natsorted_items: 'by' must be 'key' or 'value', got {by!r}"
+    raise ValueError(msg)
 
 
 def humansorted(
@@ -303,6 +493,8 @@ def humansorted(
     key: Callable[[T], NatsortInType] | None = None,
     reverse: bool = False,
     alg: NSType = ns.DEFAULT,
+    *,
+    locale: str | None = None,
 ) -> list[T]:
     """
     Sort an iterable naturally while properly sorting non-numeric characters.
@@ -328,6 +520,11 @@ def humansorted(
         uses when sorting. For details into these options, please see
         the :class:`ns` class documentation. The default is `ns.LOCALE`.
 
+    locale : str, optional
+        The locale to sort with, for example ``"de_DE"``. The global locale
+        set by :func:`locale.setlocale` is then neither used nor changed.
+        This requires PyICU. If not given, the current global locale is used.
+
     Returns
     -------
     out : list
@@ -352,7 +549,123 @@ def humansorted(
         ['apple', 'Apple', 'banana', 'Banana']
 
     """
-    return natsorted(seq, key, reverse, alg | ns.LOCALE)
+    return natsorted(seq, key, reverse, alg | ns.LOCALE, locale=locale)
+
+
+def humansorted_locales(
+    seq: Iterable[T],
+    locales: Iterable[str],
+    key: Callable[[T], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+) -> dict[str, list[T]]:
+    """
+    Sort an iterable naturally for each of several locales.
+
+    This gives the same result as calling ``humansorted(seq, locale=loc)``
+    for each locale, but each string is only normalized, split and
+    converted to numbers once for all the locales that format numbers
+    the same way - only the locale transformation of the non-numeric
+    components is done for every locale.
+
+    Parameters
+    ----------
+    seq : iterable
+        The input to sort.
+
+    locales : iterable of str
+        The locales to sort with, for example ``["de_DE", "sv_SE"]``.
+        This requires PyICU.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the sequence.
+        It is **not** applied recursively.
+        It should accept a single argument and return a single value.
+
+    reverse : {{True, False}}, optional
+        Return the lists in reversed sorted order. The default is
+        `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.LOCALE`.
+
+    Returns
+    -------
+    out : dict
+        The sorted input for each locale, keyed by locale.
+
+    See Also
+    --------
+    humansorted
+
+    Examples
+    --------
+    Sort the same input for several locales::
+
+        >>> a = ['z 1.000', 'ä 999', 'z 999']
+        >>> orders = humansorted_locales(a, ['de_DE', 'sv_SE'])  # doctest: +SKIP
+        >>> orders['de_DE']  # doctest: +SKIP
+        ['ä 999', 'z 999', 'z 1.000']
+        >>> orders['sv_SE']  # doctest: +SKIP
+        ['z 1.000', 'z 999', 'ä 999']
+
+    """
+    alg = alg | ns.LOCALE
+    locales = list(dict.fromkeys(locales))
+    seq = list(seq)
+    if alg & ns.PRESORT:
+        seq.sort(reverse=reverse, key=str)
+    values = seq if key is None else [key(x) for x in seq]
+
+    keys: dict[str, list[NatsortOutType]] = {loc: [] for loc in locales}
+    if locales:
+        parse = _natsort_multi_keygen(alg, locales)
+        fallbacks = [natsort_keygen(alg=alg, locale=loc) for loc in locales]
+        for value in values:
+            if type(value) is str and not alg & ns.PATH:
+                locale_keys = parse(value)
+            else:
+                locale_keys = [natkey(value) for natkey in fallbacks]
+            for loc, natkey_value in zip(locales, locale_keys):
+                keys[loc].append(natkey_value)
+
+    index = range(len(seq))
+    return {
+        loc: [seq[i] for i in sorted(index, key=keys[loc].__getitem__, reverse=reverse)]
+        for loc in locales
+    }
+
+
+def _natsort_multi_keygen(alg: NSType, locales: list[str]) -> utils.StrMultiParser:
+    """Return a function that generates the natsort keys of a str for each locale."""
+    alg, sep, pre_sep = _keygen_setup(alg, locale=locales[0])
+
+    # Locales that format numbers the same way share an input transformation.
+    get_locale_state = natsort.compat.locale.get_locale_state
+    input_transforms: dict[object, utils.StrToStr] = {}
+    for loc in locales:
+        input_transforms.setdefault(
+            get_locale_state(loc),
+            utils.input_string_transform_factory(alg, locale=loc),
+        )
+
+    return utils.parse_string_multi_factory(
+        alg,
+        sep,
+        splitter=utils.string_splitter_factory(alg),
+        input_transforms=[input_transforms[get_locale_state(loc)] for loc in locales],
+        # The locale transformation is done separately for each locale.
+        component_transform=utils.string_component_transform_factory(
+            alg & ~ns.LOCALEALPHA
+        ),
+        collations=[
+            lru_cache(maxsize=16384)(natsort.compat.locale.get_strxfrm(loc))
+            for loc in locales
+        ],
+        final_transform=utils.final_data_transform_factory(alg, sep, pre_sep),
+    )
 
 
 def realsorted(
@@ -418,6 +731,8 @@ def index_natsorted(
     key: Callable[[T], NatsortInType] | None = None,
     reverse: bool = False,
     alg: NSType = ns.DEFAULT,
+    *,
+    locale: str | None = None,
 ) -> list[int]:
     """
     Determine the list of the indexes used to sort the input sequence.
@@ -446,6 +761,10 @@ def index_natsorted(
         uses when sorting. For details into these options, please see
         the :class:`ns` class documentation. The default is `ns.INT`.
 
+    locale : str, optional
+        The locale to sort with when `alg` includes ``ns.LOCALE``.
+        See :func:`natsort_keygen` for details.
+
     Returns
     -------
     out : tuple
@@ -473,20 +792,24 @@ def index_natsorted(
         ['baz', 'foo', 'bar']
 
     """
-    newkey: Callable[[tuple[int, T]], NatsortInType]
-    if key is None:
-        newkey = itemgetter(1)
-    else:
-
-        def newkey(x: tuple[int, T]) -> NatsortInType:
-            return key(itemgetter(1)(x))
-
     # Pair the index and sequence together, then sort by element
     index_seq_pair = list(enumerate(seq))
     if alg & ns.PRESORT:
         index_seq_pair.sort(reverse=reverse, key=lambda x: str(itemgetter(1)(x)))
-    index_seq_pair.sort(reverse=reverse, key=natsort_keygen(newkey, alg))
-    return [x for x, _ in index_seq_pair]
+    elements = [x for _, x in index_seq_pair]
+    order = None
+    if _profiles.get():
+        natkey = natsort_keygen(key, alg, locale=locale)
+        order = _profiled_order(elements, natkey, reverse)
+    # Apply the key only once, however many strategies are tried.
+    values = elements if key is None else [key(x) for x in elements]
+    if order is None and alg & ns.DEDUPE:
+        order = _dedupe_order(values, reverse, alg, locale=locale)
+    if order is None and alg & ns.TEMPLATE:
+        order = _template_order(values, reverse, alg, locale=locale)
+    if order is None:
+        order = _keyed_order(values, reverse, alg, locale=locale)
+    return [index_seq_pair[i][0] for i in order]
 
 
 def index_humansorted(
@@ -494,6 +817,8 @@ def index_humansorted(
     key: Callable[[T], NatsortInType] | None = None,
     reverse: bool = False,
     alg: NSType = ns.DEFAULT,
+    *,
+    locale: str | None = None,
 ) -> list[int]:
     """
     Get the list of indexes of ``humansorted``.
@@ -519,6 +844,9 @@ def index_humansorted(
         uses when sorting. For details into these options, please see
         the :class:`ns` class documentation. The default is `ns.LOCALE`.
 
+    locale : str, optional
+        The locale to sort with. See :func:`humansorted` for details.
+
     Returns
     -------
     out : tuple
@@ -542,7 +870,7 @@ def index_humansorted(
         [2, 0, 3, 1]
 
     """
-    return index_natsorted(seq, key, reverse, alg | ns.LOCALE)
+    return index_natsorted(seq, key, reverse, alg | ns.LOCALE, locale=locale)
 
 
 def index_realsorted(
@@ -678,6 +1006,186 @@ def numeric_regex_chooser(alg: NSType) -> str:
     return utils.regex_chooser(alg).pattern[1:-1]
 
 
+def _template_order(
+    values: Sequence[Any],
+    reverse: bool,
+    alg: NSType,
+    *,
+    locale: str | None = None,
+) -> list[int] | None:
+    """
+    Return the order of indexes that sorts *values*, using ``ns.TEMPLATE``.
+
+    *values* are the elements to sort after applying the user's key.
+    Those that match the template inferred from *values* are sorted by the
+    tuple of their numeric components. The remaining elements are inserted
+    into that order by bisection using the full natsort key, so that the
+    result is identical to that of a plain stable sort. If no template
+    can be inferred (or too many elements do not match it) *None* is
+    returned and the caller should fall back to a plain sort.
+    """
+    if alg & (ns.FLOAT | ns.PATH | ns.UNGROUPLETTERS):
+        return None
+
+    alg = _keygen_setup(alg, locale=locale)[0]
+    parser = utils.parse_template_factory(
+        alg,
+        utils.string_splitter_factory(alg),
+        utils.input_string_transform_factory(alg, locale=locale),
+    )
+    template = utils.infer_template(values, parser)
+    if template is None:
+        return None
+
+    # Split the input into elements that match the template and those
+    # that do not. Give up if the template does not describe the input well.
+    slots: dict[int, tuple[int, ...]] = {}
+    outliers: list[int] = []
+    for i, x in enumerate(values):
+        parsed = parser(x) if type(x) is str else None
+        if parsed is None or parsed[0] != template:
+            outliers.append(i)
+        else:
+            slots[i] = parsed[1]
+    if len(outliers) * 8 > len(values):
+        return None
+    order = sorted(slots, key=slots.__getitem__, reverse=reverse)
+    if not outliers:
+        return order
+    natkey = natsort_keygen(alg=alg, locale=locale)
+    return _insert_outliers(order, outliers, values, reverse, natkey)
+
+
+# Inputs shorter than this are not worth generating keys for in batches.
+_BATCH_MINIMUM = 256
+# Number of strings to split at once - bounds the extra memory used.
+_BATCH_SIZE = 4096
+
+
+def _keyed_order(
+    values: Sequence[Any],
+    reverse: bool,
+    alg: NSType,
+    *,
+    locale: str | None = None,
+) -> list[int]:
+    """Return the order of indexes that sorts *values* by their natsort keys."""
+    keys = _natsort_keys(values, alg, locale=locale)
+    return sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+
+
+def _natsort_keys(
+    values: Sequence[Any],
+    alg: NSType,
+    *,
+    locale: str | None = None,
+) -> list[NatsortOutType]:
+    """
+    Return the natsort key of each of *values*.
+
+    If every value is a *str*, the keys are generated in batches, unless
+    there are only a few values or ``ns.PATH`` is given.
+    """
+    if (
+        len(values) < _BATCH_MINIMUM
+        or alg & ns.PATH
+        or not all(type(x) is str for x in values)
+    ):
+        return list(map(natsort_keygen(alg=alg, locale=locale), values))
+    keys: list[NatsortOutType] = []
+    batch_key = _natsort_batch_keygen(alg, locale=locale)
+    for i in range(0, len(values), _BATCH_SIZE):
+        keys.extend(batch_key(cast("list[str]", values[i : i + _BATCH_SIZE])))
+    return keys
+
+
+def _tied_groups(keys: Sequence[Any], reverse: bool) -> list[list[int]]:
+    """Return the indexes of *keys* in sorted order, grouping equal keys."""
+    groups: list[list[int]] = []
+    for i in sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse):
+        if groups and keys[i] == keys[groups[-1][0]]:
+            groups[-1].append(i)
+        else:
+            groups.append([i])
+    return groups
+
+
+def _dedupe_order(
+    values: Sequence[Any],
+    reverse: bool,
+    alg: NSType,
+    *,
+    locale: str | None = None,
+) -> list[int] | None:
+    """
+    Return the order of indexes that sorts *values*, keying each distinct one once.
+
+    *values* are the elements to sort after applying the user's key. The
+    indexes of equal values are collected in one bucket per distinct
+    value. Equal values have equal natsort keys, so the distinct values
+    are sorted by key and the buckets are concatenated in that order.
+    Buckets of distinct values with equal keys are merged so the sort
+    stays stable. If a value is not hashable, *None* is returned and the
+    caller should fall back to another strategy.
+    """
+    buckets: dict[Any, list[int]] = {}
+    try:
+        for i, x in enumerate(values):
+            bucket = buckets.get(x)
+            if bucket is None:
+                buckets[x] = [i]
+            else:
+                bucket.append(i)
+    except TypeError:
+        return None
+    distinct = list(buckets)
+    keys = _natsort_keys(distinct, alg, locale=locale)
+    order: list[int] = []
+    for group in _tied_groups(keys, reverse):
+        if len(group) == 1:
+            order.extend(buckets[distinct[group[0]]])
+        else:
+            order.extend(sorted(i for j in group for i in buckets[distinct[j]]))
+    return order
+
+
+def _insert_outliers(
+    order: list[int],
+    outliers: list[int],
+    values: Sequence[Any],
+    reverse: bool,
+    natkey: Callable[[Any], NatsortOutType],
+) -> list[int]:
+    """Merge the outliers into *order* by bisecting with the full natsort key."""
+    keys: dict[int, NatsortOutType] = {}
+
+    def get_key(i: int) -> NatsortOutType:
+        if i not in keys:
+            keys[i] = natkey(values[i])
+        return keys[i]
+
+    # The sorted outliers are inserted at increasing positions, so each
+    # search starts where the previous one ended and the result is built
+    # in one pass instead of inserting into the middle of a list.
+    # Ties are broken by input position to preserve sort stability.
+    merged: list[int] = []
+    lo = 0
+    for i in sorted(outliers, key=get_key, reverse=reverse):
+        start, hi, ikey = lo, len(order), get_key(i)
+        while lo < hi:
+            mid = (lo + hi) // 2
+            jkey = get_key(order[mid])
+            before = jkey > ikey if reverse else jkey < ikey
+            if before or (jkey == ikey and order[mid] < i):
+                lo = mid + 1
+            else:
+                hi = mid
+        merged.extend(order[start:lo])
+        merged.append(i)
+    merged.extend(order[lo:])
+    return merged
+
+
 def _split_apply(
     v: Any,  # noqa: ANN401
     key: Callable[[T], NatsortInType] | None = None,
@@ -719,7 +1227,7 @@ else:
     # which will give good results in most cases (e.g. when there aren't
     # a bunch of special characters).
     try:
-        import icu
+        from natsort.compat.locale import get_icu_collator
 
     except ImportError:
         # No ICU installed
@@ -733,12 +1241,7 @@ else:
         def os_sort_keygen(  # noqa: D103
             key: Callable[[Any], NatsortInType] | None = None,
         ) -> Callable[[Any], NatsortOutType]:
-            loc = natsort.compat.locale.get_icu_locale()
-            collator = icu.Collator.createInstance(loc)
-            collator.setAttribute(
-                icu.UCollAttribute.NUMERIC_COLLATION,
-                icu.UCollAttributeValue.ON,
-            )
+            collator = get_icu_collator(numeric=True)
             return lambda x: tuple(map(collator.getSortKey, _split_apply(x, key)))
 
 
@@ -848,4 +1351,179 @@ def os_sorted(
     """
     if presort:
         seq = sorted(seq, reverse=reverse, key=str)
+    if _profiles.get():
+        seq = list(seq)
+        return [seq[i] for i in _profiled_order(seq, os_sort_keygen(key), reverse)]
     return sorted(seq, reverse=reverse, key=os_sort_keygen(key))
+
+
+class Profile:
+    """
+    What natsort did to sort, as recorded by :func:`profile`.
+
+    Attributes
+    ----------
+    calls : int
+        The number of sorts.
+    keys : int
+        The number of keys computed.
+    comparisons : int
+        The number of comparisons of two keys.
+    key_time : float
+        The time spent computing keys, in seconds.
+    sort_time : float
+        The time spent sorting the keys, in seconds.
+    key_bytes : int
+        An estimate of the memory used by the keys, in bytes. Objects that
+        are shared by several keys (e.g. interned strings) are counted once
+        in each sort.
+
+    """
+
+    __slots__ = (
+        "_depth",
+        "_length",
+        "calls",
+        "comparisons",
+        "key_bytes",
+        "key_time",
+        "keys",
+        "sort_time",
+    )
+
+    def __init__(self) -> None:  # noqa: D107
+        self.calls = self.keys = self.comparisons = self.key_bytes = 0
+        self.key_time = self.sort_time = 0.0
+        self._depth = self._length = 0
+
+    def __repr__(self) -> str:  # noqa: D105
+        return "\n".join(
+            [
+                f"sorts:             {self.calls}",
+                f"keys computed:     {self.keys}",
+                f"comparisons:       {self.comparisons}",
+                f"mean key length:   {self.mean_length:.2f}",
+                f"mean key depth:    {self.mean_depth:.2f}",
+                f"key memory:        {self.key_bytes} bytes",
+                f"key time:          {self.key_time * 1e3:.3f} ms",
+                f"sort time:         {self.sort_time * 1e3:.3f} ms",
+            ]
+        )
+
+    @property
+    def mean_length(self) -> float:
+        """The mean number of elements of the keys (not counting nested tuples)."""
+        return self._length / self.keys if self.keys else 0.0
+
+    @property
+    def mean_depth(self) -> float:
+        """The mean depth of nested tuples of the keys (1 if not nested)."""
+        return self._depth / self.keys if self.keys else 0.0
+
+
+# The profiles that are currently recording in this context, so that
+# profiling in one thread or task does not affect the sorts of another.
+_profiles: ContextVar[tuple[Profile, ...]] = ContextVar("_profiles", default=())
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """
+    Record how natsort sorts, to understand where the time goes.
+
+    While in the ``with`` block, each call to :func:`natsorted`,
+    :func:`index_natsorted`, :func:`os_sorted` and the functions built on
+    them (e.g. :func:`humansorted` and :func:`realsorted`) records the
+    number of keys computed and comparisons made, the length, depth
+    and estimated memory of the keys, and the time spent computing keys
+    and sorting them.
+
+    While recording, keys are computed one at a time by the key returned
+    by :func:`natsort_keygen` (or :func:`os_sort_keygen`), rather than in
+    batches or with ``ns.TEMPLATE``, and counting the comparisons needs
+    sorting twice, so sorting is slower. The results are the same.
+    Only the sorts of the current thread (or :mod:`asyncio` task) are
+    recorded, and the sorts of other threads are not slowed down.
+
+    Yields
+    ------
+    profile : Profile
+        The counts and times, which keep adding up until the ``with``
+        block is left.
+
+    Examples
+    --------
+    Count the keys and comparisons needed to sort a list::
+
+        >>> with profile() as p:
+        ...     natsorted(["a10", "a2", "a1"])
+        ['a1', 'a2', 'a10']
+        >>> p.keys, p.comparisons, p.mean_length
+        (3, 2, 2.0)
+
+    """
+    recording = Profile()
+    token = _profiles.set((*_profiles.get(), recording))
+    try:
+        yield recording
+    finally:
+        _profiles.reset(token)
+
+
+class _CountedKey:
+    """A key that counts how many times it is compared in a shared counter."""
+
+    __slots__ = ("counter", "key")
+
+    def __init__(self, key: Any, counter: list[int]) -> None:  # noqa: ANN401
+        self.key = key
+        self.counter = counter
+
+    def __lt__(self, other: _CountedKey) -> bool:
+        self.counter[0] += 1
+        return bool(self.key < other.key)
+
+
+def _key_shape(key: Any, seen: set[int]) -> tuple[int, int]:  # noqa: ANN401
+    """Return the depth of nested tuples in *key* and the size of unseen objects."""
+    if id(key) in seen:
+        return 0, 0
+    seen.add(id(key))
+    size = sys.getsizeof(key)
+    if type(key) is not tuple:
+        return 0, size
+    depth = 0
+    for x in key:
+        x_depth, x_size = _key_shape(x, seen)
+        depth = max(depth, x_depth)
+        size += x_size
+    return depth + 1, size
+
+
+def _profiled_order(
+    values: Sequence[Any],
+    natkey: Callable[[Any], NatsortOutType],
+    reverse: bool,
+) -> list[int]:
+    """Return the order of indexes that sorts *values*, and record how."""
+    start = time.perf_counter()
+    keys = [natkey(x) for x in values]
+    keyed = time.perf_counter()
+    order = sorted(range(len(keys)), key=keys.__getitem__, reverse=reverse)
+    done = time.perf_counter()
+
+    # Sort again with keys that count the comparisons. This is not timed.
+    counter = [0]
+    sorted([_CountedKey(k, counter) for k in keys], reverse=reverse)
+    seen: set[int] = set()
+    shapes = [_key_shape(k, seen) for k in keys]
+    for recording in _profiles.get():
+        recording.calls += 1
+        recording.keys += len(keys)
+        recording.comparisons += counter[0]
+        recording.key_time += keyed - start
+        recording.sort_time += done - keyed
+        recording.key_bytes += sum(size for _, size in shapes)
+        recording._depth += sum(depth for depth, _ in shapes)  # noqa: SLF001
+        recording._length += sum(map(len, keys))  # noqa: SLF001
+    return order
@@ -119,6 +119,26 @@ class ns(enum.IntEnum):  # noqa: N801
         without `PRESORT` the order of these two values would depend on
         the order they appeared in the input (because Python's `sorted`
         is a stable sorting algorithm).
+    TEMPLATE, TP
+        Before sorting, sample the input and infer a template of constant
+        text and numeric fields that every element shares (e.g. the
+        ``frame_####.exr`` in an image sequence). Elements matching the
+        template are sorted by a compact tuple of integers instead of the
+        full `natsort` key, which is much cheaper; elements that do not
+        match are placed using the full key. The result is identical to
+        sorting without `TEMPLATE`. Only has an effect for `INT` sorting
+        of `str` input without `PATH` or `UNGROUPLETTERS`, and only when
+        used with :func:`natsorted` or :func:`index_natsorted` (or their
+        wrappers).
+    DEDUPE, DD
+        Compute the `natsort` key of each distinct element only once, and
+        sort the elements by collecting equal ones in a bucket for each
+        distinct element. This is much faster if the input has many
+        repeated elements, which must be hashable (otherwise the input is
+        sorted as usual); *key* is still applied to every element. The
+        result is identical to sorting without `DEDUPE`. Only has an
+        effect when used with :func:`natsorted` or :func:`index_natsorted`
+        (or their wrappers).
 
     Notes
     -----
@@ -149,6 +169,8 @@ class ns(enum.IntEnum):  # noqa: N801
     COMPATIBILITYNORMALIZE = CN = 1 << next(_counter)
     NUMAFTER = NA = 1 << next(_counter)
     PRESORT = PS = 1 << next(_counter)
+    TEMPLATE = TP = 1 << next(_counter)
+    DEDUPE = DD = 1 << next(_counter)
 
     # Following were previously options but are now defaults.
     DEFAULT = 0
@@ -0,0 +1,228 @@
+"""
+Natural sorting of NumPy arrays.
+
+This module requires NumPy, which natsort does not otherwise depend on.
+
+Each distinct value of the array is keyed only once: the values are
+dictionary-encoded into integer codes, the distinct values are ranked
+by their natsort key, and the rank of every element is sorted with a
+stable :func:`numpy.argsort`. The result is the same as that of
+:func:`~natsort.index_natsorted`, but arrays with many repeated values
+(e.g. the labels of a data set) are sorted much faster.
+
+Examples
+--------
+>>> import numpy as np
+>>> from natsort.numpy import natargsort, natsort_array
+>>> a = np.array(["num3", "num5", "num2", "num5"])
+>>> natargsort(a)
+array([2, 0, 1, 3])
+>>> natsort_array(a)
+array(['num2', 'num3', 'num5', 'num5'], dtype='<U4')
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+import numpy as np
+
+from natsort.natsort import _natsort_keys, _tied_groups
+from natsort.ns_enum import ns
+
+if TYPE_CHECKING:
+    from numpy.typing import ArrayLike, NDArray
+
+    from natsort.ns_enum import NSType
+    from natsort.utils import NatsortInType
+
+# Arrays of these kinds (bool, integer, float, bytes and str) are encoded
+# with numpy.unique, everything else with a dict of the distinct values.
+_UNIQUE_KINDS = frozenset("biufSU")
+
+
+def _rank(
+    values: list[Any],
+    strings: list[str] | None,
+    alg: NSType,
+    locale: str | None,
+) -> NDArray[np.intp]:
+    """
+    Return the rank of each of *values*, where equal keys have equal ranks.
+
+    With ``ns.PRESORT``, ties are broken by *strings*, the same way as
+    pre-sorting by the *str* of each element would.
+    """
+    keys: list[Any] = _natsort_keys(values, alg, locale=locale)
+    if strings is not None:
+        keys = list(zip(keys, strings))
+    ranks = [0] * len(keys)
+    for rank, group in enumerate(_tied_groups(keys, False), 1):
+        for i in group:
+            ranks[i] = rank
+    return np.array(ranks, dtype=np.intp)
+
+
+def _ranks(
+    arr: NDArray[Any],
+    key: Callable[[Any], NatsortInType] | None,
+    alg: NSType,
+    locale: str | None,
+) -> NDArray[np.intp]:
+    """
+    Return the rank of each element of *arr*, keying each distinct value once.
+
+    Elements are merged if they are equal after applying *key*, as their
+    natsort keys are then equal too. *key* itself is applied to every
+    element, since it may tell equal elements apart (e.g. 1 and True).
+    With ``ns.PRESORT``, the *str* of the elements must also be equal.
+    """
+    presort = bool(alg & ns.PRESORT)
+    kind = arr.dtype.kind
+    if key is None and (kind in "SU" or (kind in _UNIQUE_KINDS and not presort)):
+        uniques, codes = np.unique(arr, return_inverse=True)
+        values = uniques.tolist()
+        strings = list(map(str, values)) if presort else None
+        return _rank(values, strings, alg, locale)[codes.reshape(-1)]
+    # The elements themselves (e.g. numpy scalars rather than the Python
+    # numbers of arr.tolist()) are given to the key, as by index_natsorted.
+    elements = list(arr)
+    keyed: list[Any] = elements if key is None else [key(x) for x in elements]
+    tokens = list(zip(keyed, map(str, elements))) if presort else keyed
+    index: dict[Any, int] = {}
+    try:
+        codes_list = [index.setdefault(x, len(index)) for x in tokens]
+    except TypeError:
+        # Unhashable values cannot be merged.
+        distinct, codes_list = tokens, list(range(len(tokens)))
+    else:
+        distinct = list(index)
+    if presort:
+        values, strings = [x for x, _ in distinct], [y for _, y in distinct]
+    else:
+        values, strings = distinct, None
+    return _rank(values, strings, alg, locale)[np.array(codes_list, dtype=np.intp)]
+
+
+def _as_array(arr: ArrayLike) -> NDArray[Any]:
+    """
+    Return *arr* as an array.
+
+    Other sequences are converted to object arrays, so that their elements
+    are sorted as they are rather than converted to a common type (e.g.
+    ``[1.5, "1.25"]`` to strings).
+    """
+    return arr if isinstance(arr, np.ndarray) else np.asarray(arr, dtype=object)
+
+
+def natargsort(
+    arr: ArrayLike,
+    key: Callable[[Any], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+    *,
+    locale: str | None = None,
+) -> NDArray[np.intp]:
+    """
+    Return the indexes that would sort a one-dimensional array naturally.
+
+    This is the NumPy equivalent of :func:`~natsort.index_natsorted`,
+    and gives the same order.
+
+    Parameters
+    ----------
+    arr : array_like
+        The one-dimensional array to sort. Other sequences are sorted as
+        arrays of objects, so their elements keep their own types.
+
+    key : callable, optional
+        A key used to determine how to sort each element of the array.
+        The natsort key is computed once for each distinct value it
+        returns.
+
+    reverse : {{True, False}}, optional
+        Return the indexes in reversed sorted order. Equal elements
+        stay in the order they are in the array. The default is `False`.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    locale : str, optional
+        The locale to sort with when `alg` includes ``ns.LOCALE``.
+        See :func:`~natsort.natsort_keygen` for details.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        The indexes that sort the array, as an array of `numpy.intp`.
+
+    Raises
+    ------
+    ValueError
+        If the array is not one-dimensional.
+
+    See Also
+    --------
+    natsort_array
+    natsort.index_natsorted
+
+    Examples
+    --------
+    Use natargsort to sort other arrays by the sorted order of one array::
+
+        >>> import numpy as np
+        >>> a = np.array(['num3', 'num5', 'num2'])
+        >>> b = np.array([3.0, 5.0, 2.0])
+        >>> index = natargsort(a)
+        >>> b[index]
+        array([2., 3., 5.])
+
+    """
+    arr = _as_array(arr)
+    if arr.ndim != 1:
+        msg = f"natargsort: 'arr' must be one-dimensional, got {arr.ndim} dimensions"
+        raise ValueError(msg)
+    ranks = _ranks(arr, key, alg, locale)
+    if reverse:
+        ranks = -ranks
+    return np.argsort(ranks, kind="stable")
+
+
+def natsort_array(
+    arr: ArrayLike,
+    key: Callable[[Any], NatsortInType] | None = None,
+    reverse: bool = False,
+    alg: NSType = ns.DEFAULT,
+    *,
+    locale: str | None = None,
+) -> NDArray[Any]:
+    """
+    Return a naturally sorted copy of a one-dimensional array.
+
+    This is the NumPy equivalent of :func:`~natsort.natsorted`. The
+    arguments are the same as those of :func:`natargsort`.
+
+    Returns
+    -------
+    out : numpy.ndarray
+        The sorted array, which is an array of objects if *arr* was not
+        an array.
+
+    See Also
+    --------
+    natargsort
+
+    Examples
+    --------
+    ::
+
+        >>> import numpy as np
+        >>> natsort_array(np.array(['2 ft 11 in', '2 ft 7 in', '1 ft 5 in']))
+        array(['1 ft 5 in', '2 ft 7 in', '2 ft 11 in'], dtype='<U10')
+
+    """
+    arr = _as_array(arr)
+    return arr[natargsort(arr, key, reverse, alg, locale=locale)]
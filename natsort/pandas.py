@@ -0,0 +1,131 @@
+"""
+Natural sorting of pandas objects.
+
+This module requires pandas, which natsort does not otherwise depend on.
+
+:func:`natsort_series_key` makes a key for the *key* argument of the
+pandas sorting methods. The values are dictionary-encoded with
+:func:`pandas.factorize`, each distinct value is keyed only once,
+and every value is replaced by the rank of its key, which pandas can
+sort without calling back into Python.
+
+Examples
+--------
+>>> import pandas as pd
+>>> from natsort.pandas import natsort_series_key
+>>> df = pd.DataFrame({"name": ["a10", "a2", "a1"], "size": [3, 2, 1]})
+>>> df.sort_values("name", key=natsort_series_key())
+  name  size
+2   a1     1
+1   a2     2
+0  a10     3
+
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable, TypeVar
+
+import numpy as np
+import pandas as pd
+
+from natsort.ns_enum import ns
+from natsort.numpy import _rank, _ranks
+
+if TYPE_CHECKING:
+    from natsort.ns_enum import NSType
+    from natsort.utils import NatsortInType
+
+PandasObject = TypeVar("PandasObject", "pd.Series[Any]", "pd.Index[Any]")
+
+
+def natsort_series_key(
+    key: Callable[[Any], NatsortInType] | None = None,
+    alg: NSType = ns.DEFAULT,
+    *,
+    locale: str | None = None,
+) -> Callable[[PandasObject], PandasObject]:
+    """
+    Make a key that sorts pandas objects naturally.
+
+    The key is meant for the *key* argument of
+    :meth:`pandas.DataFrame.sort_values`, :meth:`pandas.Series.sort_values`,
+    :meth:`pandas.Index.sort_values` and the ``sort_index`` methods.
+    It replaces each value by the rank of its natsort key, so sorting by
+    several columns, ``ascending`` and ``na_position`` work as usual.
+
+    Parameters
+    ----------
+    key : callable, optional
+        A key used to manipulate each value before its natsort key is
+        computed. The natsort key is computed once for each distinct
+        value it returns.
+
+    alg : ns enum, optional
+        This option is used to control which algorithm `natsort`
+        uses when sorting. For details into these options, please see
+        the :class:`ns` class documentation. The default is `ns.INT`.
+
+    locale : str, optional
+        The locale to sort with when `alg` includes ``ns.LOCALE``.
+        See :func:`~natsort.natsort_keygen` for details.
+
+    Returns
+    -------
+    out : function
+        A function that takes a :class:`pandas.Series` or
+        :class:`pandas.Index` and returns one of the same type, shape
+        and labels holding the rank of each value. Missing values
+        (e.g. `None` and `NaN`) are missing in the result, so pandas
+        places them according to ``na_position``.
+
+    See Also
+    --------
+    natsort.numpy.natargsort
+
+    Examples
+    --------
+    Sort a data frame by a column, and then by its index::
+
+        >>> import pandas as pd
+        >>> df = pd.DataFrame(
+        ...     {"version": ["1.10", "1.9", "1.10"], "n": [1, 2, 3]},
+        ...     index=["r10", "r2", "r1"],
+        ... )
+        >>> key = natsort_series_key()
+        >>> df.sort_values(["version", "n"], key=key)
+            version  n
+        r2      1.9  2
+        r10    1.10  1
+        r1     1.10  3
+        >>> df.sort_index(key=key)
+            version  n
+        r1     1.10  3
+        r2      1.9  2
+        r10    1.10  1
+
+    """
+
+    def series_key(values: PandasObject) -> PandasObject:
+        if key is None and not alg & ns.PRESORT:
+            # Missing values have a code of -1.
+            codes, uniques = pd.factorize(values)
+            found = codes >= 0
+            ranks = _rank(uniques.tolist(), None, alg, locale)[codes[found]]
+        else:
+            # factorize would merge equal values (e.g. 1 and True) that
+            # the key or the str used by ns.PRESORT can tell apart.
+            found = ~np.asarray(pd.isna(values))
+            elements = np.asarray(values, dtype=object)[found]
+            ranks = _ranks(elements, key, alg, locale)
+        result: np.ndarray[Any, Any]
+        if found.all():
+            result = ranks
+        else:
+            result = np.full(len(found), np.nan)
+            result[found] = ranks
+        if isinstance(values, pd.Index):
+            return pd.Index(result, name=values.name)
+        return pd.Series(result, index=values.index, name=values.name)
+
+    return series_key
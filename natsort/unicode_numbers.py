@@ -2,34 +2,53 @@
 
 from __future__ import annotations
 
+import re
 import unicodedata
 
-from natsort.unicode_numeric_hex import numeric_hex
-
-# Convert each hex into the literal Unicode character.
-# Stop if a ValueError is raised in case of a narrow Unicode build.
-# The extra check with unicodedata is in case this Python version
-# does not support some characters.
-numeric_chars = []
-for a in numeric_hex:
-    try:
-        character = chr(a)
-    except ValueError:  # pragma: no cover
-        break
-    if unicodedata.numeric(character, None) is None:
-        continue  # pragma: no cover
-    numeric_chars.append(character)
-
-# The digit characters are a subset of the numerals.
-digit_chars = [a for a in numeric_chars if unicodedata.digit(a, None) is not None]
-
-# The decimal characters are a subset of the numerals
-# (probably of the digits, but let's be safe).
-decimal_chars = [a for a in numeric_chars if unicodedata.decimal(a, None) is not None]
-
-# Create a single string with the above data.
-decimals = "".join(decimal_chars)
-digits = "".join(digit_chars)
-numeric = "".join(numeric_chars)
-digits_no_decimals = "".join([x for x in digits if x not in decimals])
-numeric_no_decimals = "".join([x for x in numeric if x not in decimals])
+from natsort import unicode_numeric_hex as tables
+
+
+def _char_class(chars: str) -> str:
+    """Return the contents of a regular expression character class for chars."""
+    codes = sorted(map(ord, chars))
+    parts = []
+    i = 0
+    while i < len(codes):
+        j = i
+        while j + 1 < len(codes) and codes[j + 1] == codes[j] + 1:
+            j += 1
+        if j - i >= 2:  # noqa: PLR2004
+            parts.append(f"{re.escape(chr(codes[i]))}-{re.escape(chr(codes[j]))}")
+        else:
+            parts.extend(re.escape(chr(c)) for c in codes[i : j + 1])
+        i = j + 1
+    return "".join(parts)
+
+
+if unicodedata.unidata_version == tables.unicode_version:
+    decimals = tables.decimals
+    digits = tables.digits
+    numeric = tables.numeric
+    digits_no_decimals = tables.digits_no_decimals
+    numeric_no_decimals = tables.numeric_no_decimals
+    # Regular expression character classes that match the same characters
+    # as the *_no_decimals strings, with runs of characters as ranges.
+    digits_no_decimals_class = tables.digits_no_decimals_class
+    numeric_no_decimals_class = tables.numeric_no_decimals_class
+else:
+    # Only keep the characters that this Python knows to be numerals,
+    # in case this Python version does not support some characters.
+    known = frozenset(filter(str.isnumeric, tables.numeric))
+    decimals = "".join([a for a in tables.decimals if a in known])
+    digits = "".join([a for a in tables.digits if a in known])
+    numeric = "".join([a for a in tables.numeric if a in known])
+    digits_no_decimals = "".join([a for a in tables.digits_no_decimals if a in known])
+    numeric_no_decimals = "".join([a for a in tables.numeric_no_decimals if a in known])
+    # The pre-generated character classes would also match the characters
+    # that were left out, so they are built again from what is left.
+    digits_no_decimals_class = _char_class(digits_no_decimals)
+    numeric_no_decimals_class = _char_class(numeric_no_decimals)
+
+numeric_chars = list(numeric)
+digit_chars = list(digits)
+decimal_chars = list(decimals)
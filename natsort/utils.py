@@ -40,9 +40,13 @@ and thus has a slightly improved performance at runtime.
 
 from __future__ import annotations
 
+import os
 import re
-from collections.abc import Iterable, Iterator
-from functools import partial, reduce
+import sys
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator, Sequence
+from functools import cache, lru_cache, partial, reduce
 from itertools import chain as ichain
 from operator import methodcaller
 from pathlib import PurePath
@@ -55,17 +59,20 @@ from typing import (
     cast,
     overload,
 )
-from unicodedata import normalize
+from unicodedata import decimal, normalize
 
 from natsort.compat.fastnumbers import try_float, try_int
 from natsort.compat.locale import (
     StrOrBytes,
-    get_decimal_point,
+    get_locale_state,
     get_strxfrm,
-    get_thousands_sep,
 )
 from natsort.ns_enum import NS_DUMB, NSType, ns
-from natsort.unicode_numbers import digits_no_decimals, numeric_no_decimals
+from natsort.unicode_numbers import (
+    decimals,
+    digits_no_decimals_class,
+    numeric_no_decimals_class,
+)
 
 if TYPE_CHECKING:
     from typing_extensions import Protocol
@@ -116,11 +123,21 @@ MatchFn = Callable[[str], Union[Match[str], None]]
 
 # For the string parsing factory
 StrSplitter = Callable[[str], Iterable[str]]
+StrListSplitter = Callable[[str], list[str]]
+StrBatchSplitter = Callable[[list[str]], list[list[str]]]
+StrBatchParser = Callable[[list[str]], list[FinalTransform]]
 StrParser = Callable[[PathArg], FinalTransform]
+StrMultiParser = Callable[[str], list[FinalTransform]]
+Collation = Callable[[str], StrOrBytes]
 
 # For the path parsing factory
 PathSplitter = Callable[[PathArg], tuple[FinalTransform, ...]]
 
+# For the template parsing factory
+Template = tuple[str, ...]
+TemplateParsed = Union[tuple[Template, tuple[int, ...]], None]
+TemplateParser = Callable[[str], TemplateParsed]
+
 # For the natsort key
 NatsortInType = Union[Sortable, None]
 NatsortOutType = tuple[Sortable, ...]
@@ -137,52 +154,318 @@ class NumericalRegularExpressions:
     Not intended to be made an instance - use class methods only.
     """
 
-    # All unicode numeric characters (minus the decimal characters).
-    numeric: str = numeric_no_decimals
-    # All unicode digit characters (minus the decimal characters).
-    digits: str = digits_no_decimals
+    # All unicode numeric characters (minus the decimal characters),
+    # as the contents of a character class.
+    numeric: str = numeric_no_decimals_class
+    # All unicode digit characters (minus the decimal characters),
+    # as the contents of a character class.
+    digits: str = digits_no_decimals_class
     # Regular expression to match exponential component of a float.
     exp: str = r"(?:[eE][-+]?\d+)?"
     # Regular expression to match a floating point number.
     float_num: str = r"(?:\d+\.?\d*|\.\d+)"
 
     @classmethod
-    def _construct_regex(cls, fmt: str) -> Pattern[str]:
+    def _construct_regex(cls, fmt: str, *, ascii_only: bool) -> Pattern[str]:
         """Given a format string, construct the regex with class attributes."""
+        if ascii_only:
+            # Drop the alternative that matches non-ASCII numeric characters.
+            fmt = fmt.replace("|[{digits}]", "").replace("|[{numeric}]", "")
+            return re.compile(fmt.format(**vars(cls)), flags=re.ASCII)
         return re.compile(fmt.format(**vars(cls)), flags=re.UNICODE)
 
     @classmethod
-    def int_sign(cls) -> Pattern[str]:
+    def int_sign(cls, *, ascii_only: bool = False) -> Pattern[str]:
         """Regular expression to match a signed int."""
-        return cls._construct_regex(r"([-+]?\d+|[{digits}])")
+        return cls._construct_regex(r"([-+]?\d+|[{digits}])", ascii_only=ascii_only)
 
     @classmethod
-    def int_nosign(cls) -> Pattern[str]:
+    def int_nosign(cls, *, ascii_only: bool = False) -> Pattern[str]:
         """Regular expression to match an unsigned int."""
-        return cls._construct_regex(r"(\d+|[{digits}])")
+        return cls._construct_regex(r"(\d+|[{digits}])", ascii_only=ascii_only)
 
     @classmethod
-    def float_sign_exp(cls) -> Pattern[str]:
+    def float_sign_exp(cls, *, ascii_only: bool = False) -> Pattern[str]:
         """Regular expression to match a signed float with exponent."""
-        return cls._construct_regex(r"([-+]?{float_num}{exp}|[{numeric}])")
+        return cls._construct_regex(
+            r"([-+]?{float_num}{exp}|[{numeric}])", ascii_only=ascii_only
+        )
 
     @classmethod
-    def float_nosign_exp(cls) -> Pattern[str]:
+    def float_nosign_exp(cls, *, ascii_only: bool = False) -> Pattern[str]:
         """Regular expression to match an unsigned float with exponent."""
-        return cls._construct_regex(r"({float_num}{exp}|[{numeric}])")
+        return cls._construct_regex(
+            r"({float_num}{exp}|[{numeric}])", ascii_only=ascii_only
+        )
 
     @classmethod
-    def float_sign_noexp(cls) -> Pattern[str]:
+    def float_sign_noexp(cls, *, ascii_only: bool = False) -> Pattern[str]:
         """Regular expression to match a signed float without exponent."""
-        return cls._construct_regex(r"([-+]?{float_num}|[{numeric}])")
+        return cls._construct_regex(
+            r"([-+]?{float_num}|[{numeric}])", ascii_only=ascii_only
+        )
 
     @classmethod
-    def float_nosign_noexp(cls) -> Pattern[str]:
+    def float_nosign_noexp(cls, *, ascii_only: bool = False) -> Pattern[str]:
         """Regular expression to match an unsigned float without exponent."""
-        return cls._construct_regex(r"({float_num}|[{numeric}])")
+        return cls._construct_regex(r"({float_num}|[{numeric}])", ascii_only=ascii_only)
+
+
+# Python versions without sys.get_int_max_str_digits have no digit limit.
+_int_max_str_digits: Callable[[], int] = getattr(
+    sys, "get_int_max_str_digits", lambda: 0
+)
 
 
-def regex_chooser(alg: NSType) -> Pattern[str]:
+class DigitString:
+    """
+    An integer represented by its string of digits.
+
+    Used in place of *int* for very long runs of digits, so that they can be
+    ordered without the cost of converting to *int* (which is quadratic in
+    the number of digits, and not possible at all beyond the limit set by
+    :func:`sys.set_int_max_str_digits`). Two instances are compared by
+    sign, then number of significant digits, then the digits themselves.
+    Comparison with *int* and *float* is also supported, and the result is
+    always the same as if the digits had been converted to *int*.
+
+    Parameters
+    ----------
+    x : str
+        A string of decimal digits, optionally with a leading sign.
+        Unicode decimal digits are allowed.
+
+    Examples
+    --------
+        >>> DigitString("0012") < DigitString("120") < 121
+        True
+        >>> DigitString("-0012") == -12
+        True
+
+    """
+
+    __slots__ = ("_int", "digits", "negative")
+
+    def __init__(self, x: str) -> None:  # noqa: D107
+        digits = x[1:] if x[0] in "+-" else x
+        if not digits.isascii():
+            digits = digits.translate(_decimal_table())
+        self.digits = digits.lstrip("0") or "0"
+        self.negative = x[0] == "-" and self.digits != "0"
+        self._int: int | None = None
+
+    def __repr__(self) -> str:  # noqa: D105
+        sign = "-" if self.negative else ""
+        return f"{type(self).__name__}({sign + self.digits!r})"
+
+    def __int__(self) -> int:
+        """Convert to *int* in chunks, which is not subject to any digit limit."""
+        if self._int is None:
+            # Each chunk must be within the digit limit, which can be set as
+            # low as 640 digits (or to 0, meaning that there is no limit).
+            size = min(DigitString._chunk, _int_max_str_digits() or DigitString._chunk)
+            value = 0
+            for i in range(0, len(self.digits), size):
+                chunk = self.digits[i : i + size]
+                value = value * 10 ** len(chunk) + int(chunk)
+            self._int = -value if self.negative else value
+        return self._int
+
+    def __hash__(self) -> int:  # noqa: D105
+        return hash(int(self))
+
+    def __eq__(self, other: object) -> bool:  # noqa: D105
+        result = self._cmp(other)
+        return NotImplemented if result is NotImplemented else result == 0
+
+    def __lt__(self, other: object) -> bool:  # noqa: D105
+        result = self._cmp(other)
+        return NotImplemented if result is NotImplemented else result == -1
+
+    def __le__(self, other: object) -> bool:  # noqa: D105
+        result = self._cmp(other)
+        return NotImplemented if result is NotImplemented else result in (-1, 0)
+
+    def __gt__(self, other: object) -> bool:  # noqa: D105
+        result = self._cmp(other)
+        return NotImplemented if result is NotImplemented else result == 1
+
+    def __ge__(self, other: object) -> bool:  # noqa: D105
+        result = self._cmp(other)
+        return NotImplemented if result is NotImplemented else result in (0, 1)
+
+    def _cmp(self, other: object) -> Any:  # noqa: ANN401, PLR0911
+        """Return -1, 0, or 1 as *self* <, ==, or > *other* (None if NaN)."""
+        if isinstance(other, DigitString):
+            if self.negative != other.negative:
+                return -1 if self.negative else 1
+            a = (len(self.digits), self.digits)
+            b = (len(other.digits), other.digits)
+            result = (a > b) - (a < b)
+            return -result if self.negative else result
+        if not isinstance(other, (int, float)):
+            return NotImplemented
+        if other != other:
+            return None
+        if len(self.digits) <= DigitString._small:
+            # Cheap to convert, so compare natively.
+            value = int(self)
+            return (value > other) - (value < other)
+        sign = -1 if self.negative else 1
+        if isinstance(other, float):
+            if abs(other) == float("inf"):
+                return -1 if other > 0 else 1
+            # A float this large is an integer, and a float with a fraction
+            # is far smaller than self, so truncating it is exact enough.
+            other = int(other)
+        # A large integer - only convert if it has the same number of digits.
+        if abs(other) < 10 ** (len(self.digits) - 1):
+            return sign
+        if abs(other) >= 10 ** len(self.digits):
+            return -1 if other > 0 else 1
+        value = int(self)
+        return (value > other) - (value < other)
+
+    # Number of digits above which instances are created by natsort.
+    threshold = 128
+    # Number of digits below which conversion to int is considered cheap.
+    _small = 300
+    # Number of digits to convert at a time, unless the digit limit is lower.
+    _chunk = 4000
+
+
+class Remainder:
+    """
+    The rest of a string that was too long to parse completely.
+
+    It takes the place of a number in a key, so that it can follow the
+    parsed beginning of the string, and is greater than any number. Two
+    instances are compared by their text, so that strings that only
+    differ after the parsed beginning are still ordered deterministically.
+
+    Parameters
+    ----------
+    text : str
+        The part of the string that was not parsed.
+
+    Examples
+    --------
+        >>> 10**100 < Remainder("a") < Remainder("b")
+        True
+
+    """
+
+    __slots__ = ("text",)
+
+    def __init__(self, text: str) -> None:  # noqa: D107
+        self.text = text
+
+    def __repr__(self) -> str:  # noqa: D105
+        return f"{type(self).__name__}({self.text!r})"
+
+    def __hash__(self) -> int:  # noqa: D105
+        return hash(self.text)
+
+    def __eq__(self, other: object) -> bool:  # noqa: D105
+        return isinstance(other, Remainder) and self.text == other.text
+
+    def __lt__(self, other: object) -> bool:  # noqa: D105
+        return isinstance(other, Remainder) and self.text < other.text
+
+    def __le__(self, other: object) -> bool:  # noqa: D105
+        return isinstance(other, Remainder) and self.text <= other.text
+
+    def __gt__(self, other: object) -> bool:  # noqa: D105
+        return not isinstance(other, Remainder) or self.text > other.text
+
+    def __ge__(self, other: object) -> bool:  # noqa: D105
+        return not isinstance(other, Remainder) or self.text >= other.text
+
+
+class KeyStats:
+    """
+    Call counts and cumulative times of the stages of parsing strings.
+
+    Give an instance as the *stats* argument of :func:`natsort_keygen` to
+    find out which stage of turning strings into keys is slow. The stages
+    are, in order,
+
+    - ``"normalize"``: unicode normalization of the input,
+    - ``"input_transform"``: e.g. case changes or removing thousands
+      separators, and the unicode decomposition used with ``ns.LOCALE``,
+    - ``"split"``: splitting into numbers and non-numbers,
+    - ``"component_transform"``: converting numbers, e.g. with
+      ``try_int`` or ``try_float``, and the locale transformation,
+    - ``"sep_inserter"``: separating adjacent numbers,
+    - ``"final_transform"``: e.g. building the tuple and ``ns.UNGROUPLETTERS``.
+
+    Attributes
+    ----------
+    calls : collections.Counter
+        The number of times each stage was run.
+    time_ns : collections.Counter
+        The cumulative time spent in each stage, in nanoseconds.
+    components : int
+        The number of components the strings were split into.
+
+    Examples
+    --------
+        >>> from natsort import natsort_keygen
+        >>> stats = KeyStats()
+        >>> key = natsort_keygen(stats=stats)
+        >>> sorted(["a10", "a2", "b1"], key=key)
+        ['a2', 'a10', 'b1']
+        >>> stats.calls["split"], stats.components
+        (3, 6)
+
+    """
+
+    __slots__ = ("calls", "components", "time_ns")
+
+    stages = (
+        "normalize",
+        "input_transform",
+        "split",
+        "component_transform",
+        "sep_inserter",
+        "final_transform",
+    )
+
+    def __init__(self) -> None:  # noqa: D107
+        self.calls: Counter[str] = Counter()
+        self.time_ns: Counter[str] = Counter()
+        self.components = 0
+
+    def __repr__(self) -> str:  # noqa: D105
+        total = sum(self.time_ns.values())
+        lines = [f"{'stage':<20}{'calls':>10}{'time (ms)':>12}{'share':>8}"]
+        lines.extend(
+            f"{stage:<20}{self.calls[stage]:>10}{self.time_ns[stage] / 1e6:>12.3f}"
+            f"{self.time_ns[stage] / (total or 1):>8.1%}"
+            for stage in self.stages
+        )
+        return "\n".join(lines)
+
+    def reset(self) -> None:
+        """Forget the counts and times recorded so far."""
+        self.calls.clear()
+        self.time_ns.clear()
+        self.components = 0
+
+    def record(self, *ticks: int) -> None:
+        """Record one run of each stage, given the clock before and after each."""
+        for stage, start, end in zip(self.stages, ticks, ticks[1:]):
+            self.calls[stage] += 1
+            self.time_ns[stage] += end - start
+
+
+@cache
+def _decimal_table() -> dict[int, str]:
+    """Return a translation table from unicode decimals to ASCII digits."""
+    return {ord(x): str(decimal(x)) for x in decimals}
+
+
+def regex_chooser(alg: NSType, *, ascii_only: bool = False) -> Pattern[str]:
     """
     Select an appropriate regex for the type of number of interest.
 
@@ -190,6 +473,10 @@ def regex_chooser(alg: NSType) -> Pattern[str]:
     ----------
     alg : ns enum
         Used to indicate the regular expression to select.
+    ascii_only : bool, optional
+        If True, return a regex that only matches ASCII numbers.
+        It splits ASCII strings identically to the default regex
+        but is significantly faster. The default is False.
 
     Returns
     -------
@@ -202,14 +489,118 @@ def regex_chooser(alg: NSType) -> Pattern[str]:
     else:
         alg &= ns.INT | ns.SIGNED
 
-    return {
-        ns.INT: NumericalRegularExpressions.int_nosign(),
-        ns.FLOAT: NumericalRegularExpressions.float_nosign_exp(),
-        ns.INT | ns.SIGNED: NumericalRegularExpressions.int_sign(),
-        ns.FLOAT | ns.SIGNED: NumericalRegularExpressions.float_sign_exp(),
-        ns.FLOAT | ns.NOEXP: NumericalRegularExpressions.float_nosign_noexp(),
-        ns.FLOAT | ns.SIGNED | ns.NOEXP: NumericalRegularExpressions.float_sign_noexp(),
+    regex = {
+        ns.INT: NumericalRegularExpressions.int_nosign,
+        ns.FLOAT: NumericalRegularExpressions.float_nosign_exp,
+        ns.INT | ns.SIGNED: NumericalRegularExpressions.int_sign,
+        ns.FLOAT | ns.SIGNED: NumericalRegularExpressions.float_sign_exp,
+        ns.FLOAT | ns.NOEXP: NumericalRegularExpressions.float_nosign_noexp,
+        ns.FLOAT | ns.SIGNED | ns.NOEXP: NumericalRegularExpressions.float_sign_noexp,
     }[alg]
+    return regex(ascii_only=ascii_only)
+
+
+def string_splitter_factory(alg: NSType, engine: str = "auto") -> StrListSplitter:
+    """
+    Create a function that will split a *str* into numbers and non-numbers.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Used to indicate the type of number of interest.
+    engine : {"auto", "unicode", "ascii"}, optional
+        The splitting engine to use. "unicode" uses the regex from
+        *regex_chooser*, which handles all Unicode numeric characters.
+        "ascii" uses a faster regex that only handles ASCII numbers,
+        and so must only be given ASCII input. "auto" chooses "ascii"
+        for each input that is ASCII, otherwise "unicode".
+        The default is "auto".
+
+    Returns
+    -------
+    func : callable
+        A function that accepts string input and returns a list that
+        alternates between non-numbers and numbers, starting and ending
+        with a (possibly empty) non-number. Intended to be used as
+        the *splitter* argument to *parse_string_factory*.
+
+    Raises
+    ------
+    ValueError
+        If *engine* is not one of the accepted values.
+
+    See Also
+    --------
+    regex_chooser
+    parse_string_factory
+
+    """
+    if engine not in ("auto", "unicode", "ascii"):
+        msg = f"string_splitter_factory: invalid engine {engine!r}"
+        raise ValueError(msg)
+    unicode_split = regex_chooser(alg).split
+    ascii_split = regex_chooser(alg, ascii_only=True).split
+    if engine == "unicode":
+        return unicode_split
+    if engine == "ascii":
+        return ascii_split
+
+    def func(
+        x: str,
+        _ascii_split: StrListSplitter = ascii_split,
+        _unicode_split: StrListSplitter = unicode_split,
+    ) -> list[str]:
+        return _ascii_split(x) if x.isascii() else _unicode_split(x)
+
+    return func
+
+
+def string_batch_splitter_factory(alg: NSType) -> StrBatchSplitter:
+    """
+    Create a function that will split many *str* into numbers and non-numbers.
+
+    Splitting each string individually has a high fixed overhead for
+    short strings. Instead, the strings are joined with a separator,
+    split with a single pass of the regex from *regex_chooser*, and the
+    result is cut back into one list per input string using only *str*
+    methods.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Used to indicate the type of number of interest.
+
+    Returns
+    -------
+    func : callable
+        A function that accepts a list of strings and returns a list with
+        the output of *string_splitter_factory* for each string.
+        Strings that contain the null character or the start-of-heading
+        character (which are used internally) cannot be split as a batch
+        and are split one at a time instead.
+
+    See Also
+    --------
+    string_splitter_factory
+
+    """
+    unicode_split = regex_chooser(alg).split
+    ascii_split = regex_chooser(alg, ascii_only=True).split
+    splitter = string_splitter_factory(alg)
+    sep, mark = "\0", "\x01"
+
+    def func(x: list[str]) -> list[list[str]]:
+        if not x:
+            return []
+        buffer = sep.join(x)
+        if mark in buffer or buffer.count(sep) != len(x) - 1:
+            return [splitter(y) for y in x]
+        split = ascii_split if buffer.isascii() else unicode_split
+        # Mark the boundaries between components so that after splitting
+        # on the separator each string can be split into its components.
+        return [y.split(mark) for y in mark.join(split(buffer)).split(sep)]
+
+    return func
 
 
 def _no_op(x: Any) -> Any:  # noqa: ANN401
@@ -336,6 +727,17 @@ def natsort_key(
         return string_func(val)
     if isinstance(val, bytes):
         return bytes_func(val)
+    if type(val) is tuple or type(val) is list:
+        # Fast path for the very common case of a flat sequence of strings
+        # (e.g. the items of a dict) - only recurse for other elements.
+        return tuple(
+            [
+                string_func(x)
+                if type(x) is str
+                else natsort_key(x, None, string_func, bytes_func, num_func)
+                for x in val
+            ]
+        )
     if isinstance(val, Iterable):
         # Must be parsed recursively, but do not apply the key recursively.
         return tuple(
@@ -448,6 +850,10 @@ def parse_string_factory(  # noqa: PLR0913
     input_transform: StrToStr,
     component_transform: StrTransformer,
     final_transform: FinalTransformer,
+    *,
+    stats: KeyStats | None = None,
+    max_length: int | None = None,
+    on_truncate: Callable[[str], object] | None = None,
 ) -> StrParser:
     """
     Create a function that will split and format a *str* into a tuple.
@@ -474,6 +880,18 @@ def parse_string_factory(  # noqa: PLR0913
         must accept a tuple and a string argument - the tuple
         should be the result of applying the above functions, and the
         string is the original input value. It must return a tuple.
+    stats : KeyStats, optional
+        If given, the returned function records the number of calls and
+        time spent in each stage of parsing in this object. Otherwise
+        (the default) the stages are not timed, and cost nothing extra.
+    max_length : int, optional
+        If given, only the first *max_length* characters of longer strings
+        are parsed, and the rest is added to the tuple as a
+        :class:`Remainder` to break ties. By default strings are parsed
+        completely. Only strings no longer than *max_length* are recorded
+        in *stats*.
+    on_truncate : callable, optional
+        Called with each string that is longer than *max_length*.
 
     Returns
     -------
@@ -493,6 +911,28 @@ def parse_string_factory(  # noqa: PLR0913
     final_data_transform_factory
 
     """
+    if max_length is not None:
+        parse = parse_string_factory(
+            alg,
+            sep,
+            splitter,
+            input_transform,
+            component_transform,
+            final_transform,
+            stats=stats,
+        )
+        return _truncate_factory(
+            alg,
+            sep,
+            splitter=splitter,
+            input_transform=input_transform,
+            component_transform=component_transform,
+            final_transform=final_transform,
+            parse=parse,
+            max_length=max_length,
+            on_truncate=on_truncate,
+        )
+
     # Sometimes we store the "original" input before transformation,
     # sometimes after.
     orig_after_xfrm = not (alg & NS_DUMB and alg & ns.LOCALEALPHA)
@@ -500,6 +940,14 @@ def parse_string_factory(  # noqa: PLR0913
     normalize_input = _normalize_input_factory(alg)
     compose_input = _compose_input_factory(alg) if alg & ns.LOCALEALPHA else _no_op
 
+    # Only strings long enough to contain a long run of digits need to be
+    # checked for them, so the common case does not pay for the check.
+    long_threshold = DigitString.threshold
+    if alg & ns.FLOAT:
+        long_component_transform = component_transform
+    else:
+        long_component_transform = long_int_transform_factory(component_transform)
+
     def func(x: PathArg) -> FinalTransform:
         if isinstance(x, PurePath):
             # While paths are technically not strings, it is natural for them
@@ -513,14 +961,259 @@ def parse_string_factory(  # noqa: PLR0913
         c = compose_input(b)  # Decompose unicode if using LOCALE
         d = splitter(c)  # Split string into components.
         e = filter(None, d)  # Remove empty strings.
-        f = component_transform(e)  # Apply transform on components.
+        if len(c) <= long_threshold:
+            f = component_transform(e)  # Apply transform on components.
+        else:
+            f = long_component_transform(e)
         g = sep_inserter(f, sep)  # Insert '' between numbers.
         return final_transform(g, original)  # Apply the final transform.
 
+    if stats is None:
+        return func
+
+    # The same stages as above, but each is run to completion in turn
+    # (rather than lazily) so that it can be timed on its own.
+    def timed_func(
+        x: PathArg, _clock: Callable[[], int] = time.perf_counter_ns
+    ) -> FinalTransform:
+        if isinstance(x, PurePath):
+            x = str(x)
+        t0 = _clock()
+        a = normalize_input(x)
+        t1 = _clock()
+        b, original = input_transform(a), original_func(a)
+        c = compose_input(b)
+        t2 = _clock()
+        e = [y for y in splitter(c) if y]
+        t3 = _clock()
+        if len(c) <= long_threshold:
+            f = list(component_transform(e))
+        else:
+            f = list(long_component_transform(e))
+        t4 = _clock()
+        g = list(sep_inserter(iter(f), sep))
+        t5 = _clock()
+        result = final_transform(g, original)
+        stats.record(t0, t1, t2, t3, t4, t5, _clock())
+        stats.components += len(e)
+        return result
+
+    return timed_func
+
+
+def _truncate_factory(  # noqa: PLR0913
+    alg: NSType,
+    sep: StrOrBytes,
+    *,
+    splitter: StrSplitter,
+    input_transform: StrToStr,
+    component_transform: StrTransformer,
+    final_transform: FinalTransformer,
+    parse: StrParser,
+    max_length: int,
+    on_truncate: Callable[[str], object] | None,
+) -> StrParser:
+    """Wrap *parse* so that it only parses the beginning of long strings."""
+    orig_after_xfrm = not (alg & NS_DUMB and alg & ns.LOCALEALPHA)
+    original_func = input_transform if orig_after_xfrm else _no_op
+    normalize_input = _normalize_input_factory(alg)
+    compose_input = _compose_input_factory(alg) if alg & ns.LOCALEALPHA else _no_op
+    if not alg & ns.FLOAT:
+        component_transform = long_int_transform_factory(component_transform)
+
+    def func(x: PathArg) -> FinalTransform:
+        if isinstance(x, PurePath):
+            x = str(x)
+        if len(x) <= max_length:
+            return parse(x)
+        if on_truncate is not None:
+            on_truncate(x)
+        # The same stages as parse_string_factory, on the beginning only.
+        a = normalize_input(x[:max_length])
+        b, original = input_transform(a), original_func(a)
+        c = compose_input(b)
+        e = filter(None, splitter(c))
+        g = list(sep_inserter(component_transform(e), sep))
+        # The remainder takes the place of a number, which are at odd indexes.
+        if not len(g) % 2:
+            g.append(sep)
+        g.append(Remainder(x[max_length:]))
+        return final_transform(g, original)
+
+    return func
+
+
+def parse_string_batch_factory(  # noqa: PLR0913
+    alg: NSType,
+    sep: StrOrBytes,
+    *,
+    batch_splitter: StrBatchSplitter,
+    input_transform: StrToStr,
+    component_transform: StrTransformer,
+    final_transform: FinalTransformer,
+) -> StrBatchParser:
+    """
+    Create a function that will split and format many *str* into tuples.
+
+    This is the batch equivalent of *parse_string_factory*, and accepts
+    the same arguments except for *batch_splitter*.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Indicate how to format and split the *str*.
+    sep : str
+        The string character to be inserted between adjacent numeric
+        objects in the returned tuple.
+    batch_splitter : callable
+        The output of *string_batch_splitter_factory*.
+    input_transform : callable
+        A function to apply to the string input *before* applying
+        the *batch_splitter* function. Must return a string.
+    component_transform : callable
+        A function that is operated elementwise on the output of
+        *splitter*. It must accept a single string and return either
+        a string or a number.
+    final_transform : callable
+        A function to operate on the return value as a whole. It
+        must accept a tuple and a string argument - the tuple
+        should be the result of applying the above functions, and the
+        string is the original input value. It must return a tuple.
+
+    Returns
+    -------
+    func : callable
+        A function that accepts a list of strings and returns a list
+        of the same tuples that the function returned by
+        *parse_string_factory* would return for each string.
+
+    See Also
+    --------
+    parse_string_factory
+    string_batch_splitter_factory
+
+    """
+    orig_after_xfrm = not (alg & NS_DUMB and alg & ns.LOCALEALPHA)
+    original_func = input_transform if orig_after_xfrm else _no_op
+    normalize_input = _normalize_input_factory(alg)
+    compose_input = _compose_input_factory(alg) if alg & ns.LOCALEALPHA else _no_op
+    long_threshold = DigitString.threshold
+    if alg & ns.FLOAT:
+        long_component_transform = component_transform
+    else:
+        long_component_transform = long_int_transform_factory(component_transform)
+
+    def func(x: list[str]) -> list[FinalTransform]:
+        a = list(map(normalize_input, x))
+        b, original = list(map(input_transform, a)), list(map(original_func, a))
+        c = list(map(compose_input, b))
+        out = []
+        for cc, d, orig in zip(c, batch_splitter(c), original):
+            e = filter(None, d)
+            if len(cc) <= long_threshold:
+                f = component_transform(e)
+            else:
+                f = long_component_transform(e)
+            out.append(final_transform(sep_inserter(f, sep), orig))
+        return out
+
     return func
 
 
-def parse_path_factory(str_split: StrParser) -> PathSplitter:
+def parse_string_multi_factory(  # noqa: PLR0913
+    alg: NSType,
+    sep: StrOrBytes,
+    *,
+    splitter: StrSplitter,
+    input_transforms: Sequence[StrToStr],
+    component_transform: StrTransformer,
+    collations: Sequence[Collation],
+    final_transform: FinalTransformer,
+) -> StrMultiParser:
+    """
+    Create a function that will split and format a *str* for many locales.
+
+    Each locale is given by an input transformation and a collation.
+    The *str* is split and converted to numbers only once for all the
+    locales whose input transformation gives the same result, and only
+    the non-numeric components are then transformed by each collation.
+    Otherwise, this accepts the same arguments as *parse_string_factory*.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Indicate how to format and split the *str*.
+    sep : str
+        The string character to be inserted between adjacent numeric
+        objects in the returned tuple.
+    splitter : callable
+        A function the will accept a string and returns an iterable
+        of strings where the numbers are separated from the non-numbers.
+    input_transforms : sequence of callable
+        For each locale, a function to apply to the string input *before*
+        applying the *splitter* function. Must return a string. Locales
+        that share the same function only apply it once.
+    component_transform : callable
+        A function that is operated elementwise on the output of
+        *splitter*. It must accept a single string and return either
+        a string or a number, and must not apply a locale transformation.
+    collations : sequence of callable
+        For each locale, the locale transformation, e.g. the output of
+        *get_strxfrm*. It is applied to the non-numeric components.
+    final_transform : callable
+        A function to operate on the return value as a whole. It
+        must accept a tuple and a string argument - the tuple
+        should be the result of applying the above functions, and the
+        string is the original input value. It must return a tuple.
+
+    Returns
+    -------
+    func : callable
+        A function that accepts a string and returns a list with one
+        tuple for each locale, in the same order as *collations*.
+
+    See Also
+    --------
+    parse_string_factory
+
+    """
+    orig_after_xfrm = not (alg & NS_DUMB and alg & ns.LOCALEALPHA)
+    normalize_input = _normalize_input_factory(alg)
+    compose_input = _compose_input_factory(alg) if alg & ns.LOCALEALPHA else _no_op
+    long_threshold = DigitString.threshold
+    if alg & ns.FLOAT:
+        long_component_transform = component_transform
+    else:
+        long_component_transform = long_int_transform_factory(component_transform)
+    transforms = list(dict.fromkeys(input_transforms))
+    which = [transforms.index(t) for t in input_transforms]
+
+    def parse(b: str) -> list[StrBytesNum]:
+        c = compose_input(b)
+        e = filter(None, splitter(c))
+        if len(c) <= long_threshold:
+            return list(component_transform(e))
+        return list(long_component_transform(e))
+
+    def func(x: str) -> list[FinalTransform]:
+        a = normalize_input(x)
+        inputs = [transform(a) for transform in transforms]
+        # Most strings are not changed differently by different locales.
+        parsed = {b: parse(b) for b in dict.fromkeys(inputs)}
+        out = []
+        for i, collate in zip(which, collations):
+            f = [collate(y) if type(y) is str else y for y in parsed[inputs[i]]]
+            original = inputs[i] if orig_after_xfrm else a
+            out.append(final_transform(sep_inserter(iter(f), sep), original))
+        return out
+
+    return func
+
+
+def parse_path_factory(
+    str_split: StrParser,
+    cache_size: int = 4096,
+) -> PathSplitter:
     """
     Create a function that will properly split and format a path.
 
@@ -528,6 +1221,11 @@ def parse_path_factory(str_split: StrParser) -> PathSplitter:
     ----------
     str_split : callable
         The output of the *parse_string_factory* function.
+    cache_size : int, optional
+        The number of parsed directory components and extensions to
+        remember. Paths in the same directory then share the parsed
+        directory components instead of parsing them again. Use 0
+        to disable the cache. The default is 4096.
 
     Returns
     -------
@@ -544,7 +1242,108 @@ def parse_path_factory(str_split: StrParser) -> PathSplitter:
     parse_string_factory
 
     """
-    return lambda x: tuple(map(str_split, path_splitter(x)))
+    if not cache_size:
+        return lambda x: tuple(map(str_split, path_splitter(x)))
+
+    # The directories and extensions are shared by many paths, so they
+    # are memoized. The base name is usually unique, so it is not.
+    component_split = lru_cache(maxsize=cache_size)(str_split)
+
+    def func(x: PathArg) -> tuple[FinalTransform, ...]:
+        path_parts, base_parts = _split_path(x, treat_base=True)
+        return (
+            *map(component_split, path_parts),
+            *map(str_split, base_parts[:1]),
+            *map(component_split, base_parts[1:]),
+        )
+
+    return func
+
+
+def parse_template_factory(
+    alg: NSType,
+    splitter: StrListSplitter,
+    input_transform: StrToStr,
+) -> TemplateParser:
+    """
+    Create a function that will split a *str* into its template and slots.
+
+    Parameters
+    ----------
+    alg : ns enum
+        Indicate how to format the *str*.
+    splitter : callable
+        The output of the *string_splitter_factory* function.
+        It must return a list that alternates between non-numbers and
+        numbers, starting and ending with a (possibly empty) non-number.
+    input_transform : callable
+        The same function that was given to *parse_string_factory*.
+
+    Returns
+    -------
+    func : callable
+        A function that accepts string input and returns a tuple
+        of the non-numeric components (the "template") and a tuple of
+        the numeric components converted to *int* (the "slots"). If
+        a numeric component cannot be converted with *int*, *None*
+        is returned instead.
+
+    See Also
+    --------
+    parse_string_factory
+    infer_template
+
+    """
+    normalize_input = _normalize_input_factory(alg)
+    compose_input = _compose_input_factory(alg) if alg & ns.LOCALEALPHA else _no_op
+
+    def func(x: str) -> TemplateParsed:
+        tokens = splitter(compose_input(input_transform(normalize_input(x))))
+        try:
+            return tuple(tokens[::2]), tuple(map(int, tokens[1::2]))
+        except ValueError:
+            return None
+
+    return func
+
+
+def infer_template(
+    values: Sequence[Any],
+    parser: TemplateParser,
+    sample_size: int = 64,
+) -> Template | None:
+    """
+    Infer the template shared by the elements of a sequence from a sample.
+
+    Parameters
+    ----------
+    values : sequence
+        The values from which to infer the template.
+    parser : callable
+        The output of the *parse_template_factory* function.
+    sample_size : int, optional
+        The approximate number of evenly spaced elements of *values*
+        to inspect. The default is 64.
+
+    Returns
+    -------
+    template : tuple | None
+        The most common template among the sampled elements, or *None*
+        if *values* is empty or more than one in eight sampled elements
+        do not share that template (e.g. are not of type *str*).
+
+    See Also
+    --------
+    parse_template_factory
+
+    """
+    sample = values[:: max(1, len(values) // sample_size)]
+    parsed = (parser(x) if type(x) is str else None for x in sample)
+    counts = Counter(x[0] for x in parsed if x is not None)
+    if not counts:
+        return None
+    template, count = counts.most_common(1)[0]
+    return template if (len(sample) - count) * 8 <= len(sample) else None
 
 
 def sep_inserter(iterator: Iterator[Any], sep: StrOrBytes) -> Iterator[Any]:
@@ -569,7 +1368,7 @@ def sep_inserter(iterator: Iterator[Any], sep: StrOrBytes) -> Iterator[Any]:
         # Get the first element. A StopIteration indicates an empty iterator.
         # Since we are controlling the types of the input, 'type' is used
         # instead of 'isinstance' for the small speed advantage it offers.
-        types = (int, float)
+        types = (int, float, DigitString)
         first = next(iterator)
         if type(first) in types:
             yield sep
@@ -593,7 +1392,11 @@ def sep_inserter(iterator: Iterator[Any], sep: StrOrBytes) -> Iterator[Any]:
         return
 
 
-def input_string_transform_factory(alg: NSType) -> StrToStr:
+def input_string_transform_factory(
+    alg: NSType,
+    *,
+    locale: str | None = None,
+) -> StrToStr:
     """
     Create a function to transform a string.
 
@@ -601,6 +1404,9 @@ def input_string_transform_factory(alg: NSType) -> StrToStr:
     ----------
     alg : ns enum
         Indicate how to format the *str*.
+    locale : str, optional
+        The locale that determines the thousands separator and decimal
+        point. If not given, the current global locale is used.
 
     Returns
     -------
@@ -626,45 +1432,66 @@ def input_string_transform_factory(alg: NSType) -> StrToStr:
         function_chain.append(methodcaller("casefold"))
 
     if alg & ns.LOCALENUM:
-        # Create a regular expression that will remove thousands separators.
-        strip_thousands = r"""
-            (?<=[0-9]{{1}})  # At least 1 number
-            (?<![0-9]{{4}})  # No more than 3 numbers
-            {nodecimal}      # Cannot follow decimal
-            {thou}           # The thousands separator
-            (?=[0-9]{{3}}    # Three numbers must follow
-             ([^0-9]|$)      # But a non-number after that
-            )
-        """
-        nodecimal = r""
-        if alg & ns.FLOAT:
-            # Make a regular expression component that will ensure no
-            # separators are removed after a decimal point.
-            d = re.escape(get_decimal_point())
-            nodecimal += r"(?<!" + d + r"[0-9])"
-            nodecimal += r"(?<!" + d + r"[0-9]{2})"
-            nodecimal += r"(?<!" + d + r"[0-9]{3})"
-        strip_thousands = strip_thousands.format(
-            thou=re.escape(get_thousands_sep()),
-            nodecimal=nodecimal,
-        )
-        strip_thousands_re = re.compile(strip_thousands, flags=re.VERBOSE)
-        function_chain.append(partial(strip_thousands_re.sub, ""))
-
-        # Create a regular expression that will change the decimal point to
-        # a period if not already a period.
-        decimal = get_decimal_point()
-        if alg & ns.FLOAT and decimal != ".":
-            switch_decimal = r"(?<=[0-9]){decimal}|{decimal}(?=[0-9])"
-            switch_decimal = switch_decimal.format(decimal=re.escape(decimal))
-            switch_decimal_re = re.compile(switch_decimal)
-            function_chain.append(partial(switch_decimal_re.sub, "."))
+        state = get_locale_state(locale)
+        decimal = state.decimal_point if alg & ns.FLOAT else None
+        function_chain.extend(_locale_number_transforms(state.thousands_sep, decimal))
 
     # Return the chained functions.
     return chain_functions(function_chain)
 
 
-def string_component_transform_factory(alg: NSType) -> StrTransformer:
+@cache
+def _locale_number_transforms(
+    thousands_sep: str,
+    decimal_point: str | None,
+) -> tuple[StrToStr, ...]:
+    """
+    Return the functions that make numbers in a locale look like Python's.
+
+    The *decimal_point* is only given if the numbers are floats.
+    These are cached because compiling the expressions is slow.
+    """
+    # Create a regular expression that will remove thousands separators.
+    strip_thousands = r"""
+        (?<=[0-9]{{1}})  # At least 1 number
+        (?<![0-9]{{4}})  # No more than 3 numbers
+        {nodecimal}      # Cannot follow decimal
+        {thou}           # The thousands separator
+        (?=[0-9]{{3}}    # Three numbers must follow
+         ([^0-9]|$)      # But a non-number after that
+        )
+    """
+    nodecimal = r""
+    if decimal_point is not None:
+        # Make a regular expression component that will ensure no
+        # separators are removed after a decimal point.
+        d = re.escape(decimal_point)
+        nodecimal += r"(?<!" + d + r"[0-9])"
+        nodecimal += r"(?<!" + d + r"[0-9]{2})"
+        nodecimal += r"(?<!" + d + r"[0-9]{3})"
+    strip_thousands = strip_thousands.format(
+        thou=re.escape(thousands_sep),
+        nodecimal=nodecimal,
+    )
+    strip_thousands_re = re.compile(strip_thousands, flags=re.VERBOSE)
+    transforms: list[StrToStr] = [partial(strip_thousands_re.sub, "")]
+
+    # Create a regular expression that will change the decimal point to
+    # a period if not already a period.
+    if decimal_point is not None and decimal_point != ".":
+        switch_decimal = r"(?<=[0-9]){decimal}|{decimal}(?=[0-9])"
+        switch_decimal = switch_decimal.format(decimal=re.escape(decimal_point))
+        switch_decimal_re = re.compile(switch_decimal)
+        transforms.append(partial(switch_decimal_re.sub, "."))
+    return tuple(transforms)
+
+
+def string_component_transform_factory(
+    alg: NSType,
+    locale_cache_size: int = 16384,
+    *,
+    locale: str | None = None,
+) -> StrTransformer:
     """
     Create a function to either transform a string or convert to a number.
 
@@ -672,12 +1499,21 @@ def string_component_transform_factory(alg: NSType) -> StrTransformer:
     ----------
     alg : ns enum
         Indicate how to format the *str*.
+    locale_cache_size : int, optional
+        With ``ns.LOCALEALPHA``, the number of locale-transformed strings
+        to remember so that repeated words are transformed only once.
+        The default is 16384.
+    locale : str, optional
+        The locale used to transform strings with ``ns.LOCALEALPHA``.
+        If not given, the current global locale is used.
 
     Returns
     -------
     func : callable
         A function to be used as the *component_transform* argument to
-        *parse_string_factory*.
+        *parse_string_factory*. With ``ns.LOCALEALPHA``, it has a
+        ``cache_info`` attribute that reports how often the locale
+        transformation was reused, as for :func:`functools.lru_cache`.
 
     See Also
     --------
@@ -695,16 +1531,69 @@ def string_component_transform_factory(alg: NSType) -> StrTransformer:
     if group_letters:
         func_chain.append(groupletters)
     if use_locale:
-        func_chain.append(get_strxfrm())
+        func_chain.append(get_strxfrm(locale))
 
     # Return the correct chained functions.
     kwargs: dict[str, float | Callable[[str], StrOrBytes] | bool]
-    kwargs = {"on_fail": chain_functions(func_chain)} if func_chain else {}
+    kwargs = {}
+    cache_info = None
+    if func_chain:
+        on_fail = chain_functions(func_chain)
+        if use_locale:
+            # The locale transformation is expensive and the same words tend
+            # to appear in many inputs, so remember the recent results. A key
+            # is made for one locale, so they stay valid as long as it is used.
+            cached = lru_cache(maxsize=locale_cache_size)(on_fail)
+            on_fail, cache_info = cached, cached.cache_info
+        kwargs["on_fail"] = on_fail
     kwargs["map"] = True
+    transform: partial[Any]
     if alg & ns.FLOAT:
         kwargs["nan"] = nan_val
-        return cast("StrTransformer", partial(try_float, **kwargs))
-    return cast("StrTransformer", partial(try_int, **kwargs))
+        transform = partial(try_float, **kwargs)
+    else:
+        transform = partial(try_int, **kwargs)
+    if cache_info is not None:
+        transform.cache_info = cache_info  # type: ignore[attr-defined]
+    return cast("StrTransformer", transform)
+
+
+def long_int_transform_factory(component_transform: StrTransformer) -> StrTransformer:
+    """
+    Create a function to transform strings that may contain long integers.
+
+    Parameters
+    ----------
+    component_transform : callable
+        The output of *string_component_transform_factory*.
+
+    Returns
+    -------
+    func : callable
+        A function to be used in place of *component_transform* that
+        converts runs of more than ``DigitString.threshold`` digits into
+        *DigitString* objects rather than *int*, and otherwise
+        behaves the same as *component_transform*.
+
+    See Also
+    --------
+    DigitString
+    string_component_transform_factory
+
+    """
+
+    def func(
+        x: Iterable[str],
+        _transform: StrTransformer = component_transform,
+        _threshold: int = DigitString.threshold,
+    ) -> Iterator[StrBytesNum | DigitString]:
+        for y in x:
+            if len(y) > _threshold and (y[1:] if y[0] in "+-" else y).isdecimal():
+                yield DigitString(y)
+            else:
+                yield from _transform((y,))
+
+    return cast("StrTransformer", func)
 
 
 def final_data_transform_factory(
@@ -866,13 +1755,66 @@ def do_decoding(s: Any, encoding: str) -> Any:
     return s
 
 
-# noinspection PyIncorrectDocstring
-def path_splitter(
+def _posix_path_parts(s: str) -> tuple[str, ...]:
+    """Return the same components as ``PurePosixPath(s).parts``."""
+    if s[:1] == "/":
+        # Like pathlib, preserve exactly two leading slashes but no more.
+        root = "//" if s[:2] == "//" and s[2:3] != "/" else "/"
+        return (root, *[x for x in s.split("/") if x and x != "."])
+    return tuple([x for x in s.split("/") if x and x != "."])
+
+
+def _path_suffixes(name: str) -> list[str]:
+    """Return the same suffixes as ``PurePath(name).suffixes``."""
+    if name.endswith(".") or ".." in name or "/" in name or "\\" in name:
+        # Corner cases with rules that differ between Python versions.
+        return PurePath(name).suffixes
+    return ["." + x for x in name.lstrip(".").split(".")[1:]]
+
+
+def _split_path(
     s: PathArg,
     *,
-    treat_base: bool = True,
+    treat_base: bool,
     _d_match: MatchFn = re.compile(r"\.\d").match,
-) -> Iterator[str]:
+    _posix: bool = os.name != "nt",
+) -> tuple[Sequence[str], list[str]]:
+    """Split a path into its directory components and its base components."""
+    if isinstance(s, PurePath):
+        parts = s.parts
+    elif _posix:
+        parts = _posix_path_parts(s)
+    else:
+        parts = PurePath(s).parts
+
+    # Split the path into parts.
+    try:
+        *path_parts, base = parts
+    except ValueError:
+        path_parts = []
+        base = str(PurePath(s))
+
+    suffixes = []
+    if treat_base:
+        # Now, split off the file extensions until
+        #  - we reach a decimal number at the beginning of the suffix
+        #  - more than two suffixes have been seen
+        #  - a suffix is more than five characters (including leading ".")
+        #  - there are no more extensions
+        suffix_threshold = 5
+        for i, suffix in enumerate(reversed(_path_suffixes(base))):
+            if _d_match(suffix) or i > 1 or len(suffix) > suffix_threshold:
+                break
+            suffixes.append(suffix)
+        suffixes.reverse()
+
+    # Remove the suffixes from the base component
+    base = base.replace("".join(suffixes), "")
+    return path_parts, [base, *suffixes] if base else suffixes
+
+
+# noinspection PyIncorrectDocstring
+def path_splitter(s: PathArg, *, treat_base: bool = True) -> Iterator[str]:
     """
     Split a string into its path components.
 
@@ -892,39 +1834,17 @@ def path_splitter(
     split : tuple
         The path split by directory components and extensions.
 
+    Notes
+    -----
+    On POSIX systems, a *str* is split with string operations that give
+    the same result as :mod:`pathlib` would, because constructing a
+    :class:`pathlib.PurePath` for every input is comparatively slow.
+
     Examples
     --------
         >>> tuple(path_splitter("this/thing.ext"))
         ('this', 'thing', '.ext')
 
     """
-    if not isinstance(s, PurePath):
-        s = PurePath(s)
-
-    # Split the path into parts.
-    try:
-        *path_parts, base = s.parts
-    except ValueError:
-        path_parts = []
-        base = str(s)
-
-    suffixes = []
-    if treat_base:
-        # Now, split off the file extensions until
-        #  - we reach a decimal number at the beginning of the suffix
-        #  - more than two suffixes have been seen
-        #  - a suffix is more than five characters (including leading ".")
-        #  - there are no more extensions
-        suffix_threshold = 5
-        for i, suffix in enumerate(reversed(PurePath(base).suffixes)):
-            if _d_match(suffix) or i > 1 or len(suffix) > suffix_threshold:
-                break
-            suffixes.append(suffix)
-        suffixes.reverse()
-
-    # Remove the suffixes from the base component
-    base = base.replace("".join(suffixes), "")
-    base_component = [base] if base else []
-
     # Join all path comonents in an iterator
-    return filter(None, ichain(path_parts, base_component, suffixes))
+    return filter(None, ichain(*_split_path(s, treat_base=treat_base)))
@@ -0,0 +1,232 @@
+"""These test the benchmark suite, using tiny corpora."""
+
+from __future__ import annotations
+
+import json
+import statistics
+from importlib.util import find_spec
+from typing import TYPE_CHECKING
+
+import pytest
+
+from natsort.bench import (
+    BASELINE,
+    BENCHMARKS,
+    CORPORA,
+    KEY_BENCHMARKS,
+    Benchmark,
+    Comparison,
+    compare_results,
+    load_results,
+    run_benchmarks,
+    write_results,
+)
+from natsort.bench import __main__ as bench_main
+from natsort.bench.__main__ import main
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from natsort.bench.suite import Result
+
+
+@pytest.mark.parametrize("kind", CORPORA)
+def test_corpora_are_reproducible(kind: str) -> None:
+    corpus = CORPORA[kind]
+    assert len(corpus(50)) == 50
+    # Compare the reprs, as NaN is not equal to itself.
+    assert repr(corpus(50, seed=3)) == repr(corpus(50, seed=3))
+    assert repr(corpus(50, seed=3)) != repr(corpus(50, seed=4))
+
+
+@pytest.mark.parametrize("duplicates", [0.5, 0.9, 0.99])
+def test_corpora_repeat_the_given_fraction_of_items(duplicates: float) -> None:
+    items = CORPORA["filenames"](1000, duplicates=duplicates)
+    assert len(items) == 1000
+    # Some of the distinct items may be equal by chance.
+    assert len(set(items)) <= 1000 - int(1000 * duplicates)
+
+
+@pytest.mark.parametrize("duplicates", [-0.1, 1.0])
+def test_corpora_raise_for_invalid_duplicates(duplicates: float) -> None:
+    with pytest.raises(ValueError, match="duplicates must be"):
+        CORPORA["filenames"](10, duplicates=duplicates)
+
+
+def test_unicode_digits_corpus_uses_non_ascii_numerals() -> None:
+    items = CORPORA["unicode_digits"](100)
+    assert any(not c.isascii() and c.isnumeric() for item in items for c in item)
+
+
+def test_main_prints_a_corpus(capsys: pytest.CaptureFixture[str]) -> None:
+    main("corpus", "versions", "-n", "3", "--seed", "1")
+    assert capsys.readouterr().out.splitlines() == CORPORA["versions"](3, seed=1)
+
+
+def test_benchmark_names_are_unique() -> None:
+    names = [bench.name for bench in BENCHMARKS]
+    assert len(names) == len(set(names))
+
+
+@pytest.mark.parametrize("bench", BENCHMARKS, ids=lambda bench: bench.name)
+def test_every_benchmark_runs(bench: Benchmark) -> None:
+    results = run_benchmarks([bench], size=5, repeat=2, min_time=0)
+    (result,) = results["benchmarks"]
+    if bench.requires is not None and find_spec(bench.requires) is None:
+        assert result["skipped"] == f"requires {bench.requires}"
+    elif bench.memory:
+        assert result["stats"]["bytes"] > 0
+    else:
+        assert result["stats"]["rounds"] == 2
+        assert result["stats"]["min"] <= result["stats"]["median"]
+
+
+def test_run_benchmarks_only_runs_the_selected_benchmarks() -> None:
+    results = run_benchmarks(size=5, repeat=1, min_time=0, select=["keygen[DEFAULT]"])
+    assert [r["name"] for r in results["benchmarks"]] == ["keygen[DEFAULT]"]
+    assert results["version"]
+    assert results["machine_info"]["python_version"]
+
+
+def test_main_writes_the_results_as_json(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str]
+) -> None:
+    path = tmp_path / "results.json"
+    main("run", "-n", "5", "-r", "1", "--min-time", "0", "-k", "key[", "-o", str(path))
+    results = json.loads(path.read_text(encoding="utf-8"))
+    names = [r["name"] for r in results["benchmarks"]]
+    assert names
+    assert all("key[" in name for name in names)
+    assert "items/s" in capsys.readouterr().out
+
+
+def make_results(calibration: float, **times: float) -> Result:
+    return {
+        "machine_info": {"calibration": calibration},
+        "benchmarks": [
+            {"name": name, "params": {"size": 10}, "stats": {"min": time}}
+            for name, time in times.items()
+        ],
+    }
+
+
+def test_compare_results_normalizes_by_the_calibration() -> None:
+    baseline = make_results(1.0, a=2.0, b=3.0, c=4.0)
+    current = make_results(0.5, b=1.5, a=1.5, d=1.0)
+    assert compare_results(baseline, current) == [
+        Comparison("b", 3.0, 3.0),
+        Comparison("a", 2.0, 3.0),
+    ]
+    assert Comparison("a", 2.0, 3.0).change == 50
+
+
+@pytest.mark.parametrize("calibrate", [False, True])
+def test_run_benchmarks_calibrates_with_the_median_of_several_runs(
+    calibrate: bool,
+) -> None:
+    benchmarks = [b for b in BENCHMARKS if b.name in KEY_BENCHMARKS[:2]]
+    results = run_benchmarks(
+        benchmarks, size=5, repeat=3, min_time=0, calibrate=calibrate
+    )
+    machine_info = results["machine_info"]
+    assert len(machine_info["calibrations"]) == 4
+    assert machine_info["calibration"] == statistics.median(
+        machine_info["calibrations"]
+    )
+    assert all(
+        ("calibrated" in bench["stats"]) == calibrate for bench in results["benchmarks"]
+    )
+
+
+def test_compare_results_prefers_the_calibrated_time_of_each_benchmark() -> None:
+    baseline = make_results(1.0, a=2.0)
+    current = make_results(1.0, a=2.0)
+    current["benchmarks"][0]["stats"]["calibrated"] = 1.0
+    assert compare_results(baseline, current) == [Comparison("a", 2.0, 1.0)]
+
+
+def test_compare_results_ignores_benchmarks_of_a_different_size() -> None:
+    baseline = make_results(1.0, a=2.0)
+    current = make_results(1.0, a=2.0)
+    current["benchmarks"][0]["params"]["size"] = 20
+    assert compare_results(baseline, current) == []
+
+
+@pytest.mark.parametrize(
+    ("name", "value"),
+    [
+        ("icu", True),
+        ("fastnumbers", True),
+        ("python_version", "3.12.1"),
+        ("python_implementation", "PyPy"),
+    ],
+)
+def test_compare_results_refuses_results_from_another_environment(
+    name: str, value: object
+) -> None:
+    baseline = make_results(1.0, a=2.0)
+    current = make_results(1.0, a=2.0)
+    environment = {
+        "icu": False,
+        "fastnumbers": False,
+        "python_version": "3.11.7",
+        "python_implementation": "CPython",
+    }
+    baseline["machine_info"].update(environment)
+    current["machine_info"].update(environment, **{name: value})
+    with pytest.raises(ValueError, match=f"different environments: {name} "):
+        compare_results(baseline, current)
+    # Only the Python minor version must be the same.
+    current["machine_info"].update(environment, python_version="3.11.9")
+    assert compare_results(baseline, current) == [Comparison("a", 2.0, 2.0)]
+
+
+def test_main_compare_fails_if_slower_than_the_baseline(tmp_path: Path) -> None:
+    path = tmp_path / "baseline.json"
+    options = ("-n", "5", "-r", "1", "--min-time", "0", "-b", "keygen[DEFAULT]")
+    main("compare", *options, "--baseline", str(path), "--update")
+    baseline = load_results(path)
+    assert [r["name"] for r in baseline["benchmarks"]] == ["keygen[DEFAULT]"]
+    assert baseline["benchmarks"][0]["stats"]["calibrated"] > 0
+
+    main("compare", *options, "--baseline", str(path), "--threshold", "1e9")
+
+    # Make the baseline much faster than any machine can be.
+    baseline["benchmarks"][0]["stats"]["calibrated"] = 1e-12
+    write_results(baseline, path)
+    with pytest.raises(SystemExit, match=r"keygen\[DEFAULT\]"):
+        main("compare", *options, "--baseline", str(path))
+
+    baseline["machine_info"]["icu"] = not baseline["machine_info"]["icu"]
+    write_results(baseline, path)
+    with pytest.raises(SystemExit, match="different environments: icu"):
+        main("compare", *options, "--baseline", str(path), "--threshold", "1e9")
+
+
+@pytest.mark.parametrize(
+    ("command", "expected"), [("run", (5, 0.1)), ("compare", (10, 0.2))]
+)
+def test_main_compare_times_more_and_longer_rounds_than_run(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    command: str,
+    expected: tuple[int, float],
+) -> None:
+    calls: list[tuple[int, float]] = []
+
+    def fake_run_benchmarks(
+        *_: object, repeat: int, min_time: float, **__: object
+    ) -> Result:
+        calls.append((repeat, min_time))
+        return make_results(1.0)
+
+    monkeypatch.setattr(bench_main, "run_benchmarks", fake_run_benchmarks)
+    options = ("--baseline", str(tmp_path / "baseline.json"), "--update")
+    main(command, *(options if command == "compare" else ()))
+    assert calls == [expected]
+
+
+def test_stored_baseline_has_the_key_benchmarks() -> None:
+    baseline = load_results(BASELINE)
+    names = [r["name"] for r in baseline["benchmarks"]]
+    assert sorted(names) == sorted(KEY_BENCHMARKS)
@@ -0,0 +1,40 @@
+"""These test the natsort.compat.locale functions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from natsort.compat import locale as natsort_locale
+
+if TYPE_CHECKING:
+    from pytest_mock import MockerFixture
+
+
+def test_get_locale_state_is_looked_up_once_per_locale(mocker: MockerFixture) -> None:
+    natsort_locale.clear_locale_cache()
+    spy = mocker.spy(natsort_locale, "get_decimal_point")
+    state = natsort_locale.get_locale_state()
+    assert state == (
+        natsort_locale.dumb_sort(),
+        natsort_locale.get_thousands_sep(),
+        natsort_locale.get_decimal_point(),
+    )
+    assert natsort_locale.get_locale_state() is state
+    assert spy.call_count == 2  # Once for the state, once for the comparison
+
+
+def test_clear_locale_cache_forgets_locale_state() -> None:
+    natsort_locale.clear_locale_cache()
+    state = natsort_locale.get_locale_state()
+    natsort_locale.clear_locale_cache()
+    assert natsort_locale.get_locale_state() is not state
+    assert natsort_locale.get_locale_state() == state
+
+
+def test_locale_states_are_kept_for_a_bounded_number_of_locales() -> None:
+    natsort_locale.clear_locale_cache()
+    for i in range(100):
+        natsort_locale._locale_state(None, ("global locale", i))  # noqa: SLF001
+    info = natsort_locale._locale_state.cache_info()  # noqa: SLF001
+    assert info.maxsize is not None
+    assert info.currsize == info.maxsize < 100
@@ -0,0 +1,139 @@
+"""These test the DigitString class."""
+
+from __future__ import annotations
+
+import operator
+import sys
+from typing import Callable
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats, integers, sampled_from
+
+from natsort import natsort_keygen, natsorted, ns
+from natsort.utils import DigitString
+
+Comparison = Callable[[object, object], bool]
+operators = [
+    operator.lt,
+    operator.le,
+    operator.eq,
+    operator.ne,
+    operator.gt,
+    operator.ge,
+]
+comparisons = sampled_from(operators)
+big_integers = integers(-(10**700), 10**700)
+
+
+def to_digit_string(x: int, zeros: int = 0) -> DigitString:
+    sign = "-" if x < 0 else ""
+    return DigitString(sign + "0" * zeros + str(abs(x)))
+
+
+@given(big_integers, big_integers, integers(0, 3), comparisons)
+def test_digit_string_compares_the_same_as_int(
+    x: int,
+    y: int,
+    zeros: int,
+    op: Comparison,
+) -> None:
+    assert op(to_digit_string(x, zeros), to_digit_string(y)) is op(x, y)
+
+
+@given(big_integers, big_integers, comparisons)
+def test_digit_string_compares_the_same_as_int_with_int(
+    x: int,
+    y: int,
+    op: Comparison,
+) -> None:
+    assert op(to_digit_string(x), y) is op(x, y)
+    assert op(y, to_digit_string(x)) is op(y, x)
+
+
+@given(big_integers, floats(allow_nan=False), comparisons)
+def test_digit_string_compares_the_same_as_int_with_float(
+    x: int,
+    y: float,
+    op: Comparison,
+) -> None:
+    assert op(to_digit_string(x), y) is op(x, y)
+    assert op(y, to_digit_string(x)) is op(y, x)
+
+
+@pytest.mark.parametrize(
+    "x",
+    [
+        10**300,
+        10**308,
+        int(1e308),
+        int(1e308) + 1,
+        int(1.7976931348623157e308),
+        10**309 - 1,
+        10**309,
+    ],
+)
+@pytest.mark.parametrize("y", [1e300, 1e308, 1.7976931348623157e308, float("inf")])
+@pytest.mark.parametrize("sign", [1, -1])
+@pytest.mark.parametrize("op", operators)
+def test_digit_string_compares_exactly_with_the_largest_floats(
+    x: int,
+    y: float,
+    sign: int,
+    op: Comparison,
+) -> None:
+    assert op(to_digit_string(sign * x), sign * y) is op(sign * x, sign * y)
+    assert op(sign * y, to_digit_string(sign * x)) is op(sign * y, sign * x)
+
+
+def test_natsorted_orders_long_digit_runs_against_the_largest_floats() -> None:
+    given = ["1" + "0" * 300, 1e308, "2" + "0" * 308]
+    assert natsorted(given) == ["1" + "0" * 300, 1e308, "2" + "0" * 308]
+
+
+@given(big_integers)
+def test_digit_string_converts_to_equal_int_with_equal_hash(x: int) -> None:
+    assert int(to_digit_string(x, 2)) == x
+    assert hash(to_digit_string(x, 2)) == hash(x)
+
+
+def test_digit_string_handles_negative_zero_and_unicode_digits() -> None:
+    assert DigitString("-000") == DigitString("0") == 0
+    assert DigitString("١٢٣") == 123
+
+
+def test_natsort_key_uses_digit_string_only_for_long_digit_runs() -> None:
+    long_number = "9" * (DigitString.threshold + 1)
+    key = natsort_keygen()
+    assert key("a123") == ("a", 123)
+    assert key("a" + long_number + "b") == ("a", DigitString(long_number), "b")
+    assert type(key("a" + long_number)[1]) is DigitString
+    assert type(natsort_keygen(alg=ns.FLOAT)("a" + long_number)[1]) is float
+
+
+@pytest.mark.parametrize("alg", [ns.INT, ns.SIGNED])
+def test_natsorted_sorts_numbers_above_the_int_digit_limit(alg: ns) -> None:
+    given = ["x" + "7" * 6000, "x" + "7" * 5999, "x5", "x" + "8" * 5999, 10**5]
+    expected = [10**5, given[2], given[1], given[3], given[0]]
+    assert natsorted(given, alg=alg) == expected
+
+
+@pytest.mark.skipif(
+    not hasattr(sys, "set_int_max_str_digits"), reason="Python has no digit limit"
+)
+def test_digit_string_converts_to_int_below_a_lowered_digit_limit() -> None:
+    limit = sys.get_int_max_str_digits()
+    sys.set_int_max_str_digits(640)
+    try:
+        given = DigitString("1" * 1000)
+        expected = (10**1000 - 1) // 9
+        assert int(given) == expected
+        assert hash(given) == hash(expected)
+        assert given == expected
+        assert natsorted(["a" + "1" * 1000, "a2", "a" + "1" * 999]) == [
+            "a2",
+            "a" + "1" * 999,
+            "a" + "1" * 1000,
+        ]
+    finally:
+        sys.set_int_max_str_digits(limit)
@@ -0,0 +1,157 @@
+"""These test the natsort.fs functions."""
+
+from __future__ import annotations
+
+import glob
+import os
+from typing import TYPE_CHECKING
+
+import pytest
+
+from natsort import natsorted, ns
+from natsort.fs import natglob, natscandir, natwalk
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+@pytest.fixture
+def tree(tmp_path: Path) -> Path:
+    for name in ("b10", "b2", "b1"):
+        (tmp_path / name).mkdir()
+        for i in (10, 9, 1):
+            (tmp_path / name / f"f{i}.txt").touch()
+    for name in ("a10.txt", "a9.txt", "c1"):
+        (tmp_path / name).touch()
+    return tmp_path
+
+
+def test_natscandir_returns_dir_entries_in_natural_order(tree: Path) -> None:
+    given = natscandir(tree, alg=ns.DEFAULT)
+    assert all(isinstance(x, os.DirEntry) for x in given)
+    expected = ["a9.txt", "a10.txt", "b1", "b2", "b10", "c1"]
+    assert [x.name for x in given] == expected
+
+
+def test_natscandir_reverse_and_dirs_first(tree: Path) -> None:
+    given = natscandir(tree, alg=ns.DEFAULT, reverse=True, dirs_first=True)
+    expected = ["b10", "b2", "b1", "c1", "a10.txt", "a9.txt"]
+    assert [x.name for x in given] == expected
+
+
+def test_natscandir_uses_os_sort_order_by_default(tree: Path) -> None:
+    given = natscandir(tree, dirs_first=True)
+    assert [x.name for x in given][:3] == ["b1", "b2", "b10"]
+
+
+@pytest.mark.parametrize("max_workers", [None, 3])
+def test_natwalk_visits_directories_in_natural_order(
+    tree: Path,
+    max_workers: int | None,
+) -> None:
+    given = [
+        (path, [d.name for d in dirs], [f.name for f in files])
+        for path, dirs, files in natwalk(tree, max_workers=max_workers)
+    ]
+    expected = [(str(tree), ["b1", "b2", "b10"], ["a9.txt", "a10.txt", "c1"])]
+    expected += [
+        (str(tree / d), [], ["f1.txt", "f9.txt", "f10.txt"])
+        for d in ("b1", "b2", "b10")
+    ]
+    assert given == expected
+
+
+@pytest.mark.parametrize("max_workers", [None, 3])
+def test_natwalk_does_not_visit_pruned_directories(
+    tree: Path,
+    max_workers: int | None,
+) -> None:
+    visited = []
+    for path, dirs, _ in natwalk(tree, reverse=True, max_workers=max_workers):
+        visited.append(path)
+        dirs[:] = [d for d in dirs if d.name != "b2"]
+    assert visited == [str(tree), str(tree / "b10"), str(tree / "b1")]
+
+
+def test_natwalk_reports_errors_to_onerror(tmp_path: Path) -> None:
+    errors: list[OSError] = []
+    assert list(natwalk(tmp_path / "missing", onerror=errors.append)) == []
+    assert len(errors) == 1
+    assert isinstance(errors[0], FileNotFoundError)
+
+
+@pytest.fixture
+def deep_tree(tmp_path: Path) -> Path:
+    for d in ("a1/b2", "a1/b10/c", "a10", "a2.d/x", "a1/.hidden"):
+        (tmp_path / d).mkdir(parents=True)
+    for f in (
+        "a1/f10.txt",
+        "a1/f9.txt",
+        "a1/b2/f1.txt",
+        "a1/b10/c/f1.tar.gz",
+        "a1/.hidden/f1.txt",
+        "a2.d/x/f3.txt",
+        "a2.d.txt",
+        "a10/.f1.txt",
+        "a9.txt",
+    ):
+        (tmp_path / f).touch()
+    return tmp_path
+
+
+@pytest.mark.parametrize(
+    "pattern",
+    [
+        "*",
+        "*/",
+        "a1/*.txt",
+        "*/*/*",
+        "a1/b*/*",
+        "a1",
+        "a1/b2/f1.txt",
+        "a1/b2/",
+        "missing/*",
+        "a10/.*",
+        "a1/.hidden/*",
+        "**",
+        "**/",
+        "**/*.txt",
+        "a1/**",
+        "a1/**/f1*",
+        "**/c/**",
+        "a1/**/*.gz",
+    ],
+)
+@pytest.mark.parametrize("recursive", [True, False])
+def test_natglob_yields_natsorted_glob_results(
+    deep_tree: Path,
+    pattern: str,
+    recursive: bool,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(deep_tree)
+    expected = natsorted(glob.glob(pattern, recursive=recursive), alg=ns.PATH)  # noqa: PTH207
+    assert list(natglob(pattern, recursive=recursive)) == expected
+
+
+def test_natglob_does_not_repeat_matches_of_repeated_recursive_pattern(
+    deep_tree: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.chdir(deep_tree)
+    result = list(natglob("a1/**/**/*.gz", recursive=True))
+    assert result == [
+        str(deep_tree.joinpath("a1", "b10", "c", "f1.tar.gz").relative_to(deep_tree))
+    ]
+
+
+def test_natglob_handles_absolute_patterns(deep_tree: Path) -> None:
+    pattern = str(deep_tree / "a1" / "**" / "*.txt")
+    expected = natsorted(glob.glob(pattern, recursive=True), alg=ns.PATH)  # noqa: PTH207
+    assert list(natglob(pattern, recursive=True)) == expected
+
+
+def test_natglob_yields_lazily(deep_tree: Path) -> None:
+    result = natglob(str(deep_tree / "**"), recursive=True)
+    assert next(result) == str(deep_tree) + os.sep
+    assert next(result) == str(deep_tree / "a1")
@@ -0,0 +1,44 @@
+"""These test that importing natsort does not import the heavy submodules."""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+
+HEAVY_MODULES = (
+    "natsort.natsort",
+    "natsort.utils",
+    "natsort.compat.locale",
+    "natsort.compat.fastnumbers",
+    "natsort.unicode_numbers",
+    "icu",
+)
+
+
+def run_import(code: str) -> set[str]:
+    """Run code in a new interpreter and return the names of imported modules."""
+    code += "\nimport sys; print(*sys.modules)"
+    result = subprocess.run(  # noqa: S603
+        [sys.executable, "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return set(result.stdout.split())
+
+
+def test_import_natsort_does_not_import_the_sorting_functions() -> None:
+    modules = run_import("import natsort")
+    assert "natsort" in modules
+    assert modules.isdisjoint(HEAVY_MODULES)
+
+
+def test_natsort_attributes_are_imported_on_first_use() -> None:
+    modules = run_import("import natsort; natsort.natsorted")
+    assert "natsort.natsort" in modules
+
+
+def test_natsort_ns_does_not_import_the_sorting_functions() -> None:
+    modules = run_import("from natsort import ns, FLOAT")
+    assert "natsort.ns_enum" in modules
+    assert modules.isdisjoint(HEAVY_MODULES)
@@ -49,3 +49,19 @@ def test_natsort_key_with_key_argument_applies_key_before_processing(x: str) ->
     ] == len(
         x,
     )
+
+
+@given(lists(elements=text() | binary() | integers() | lists(text()), max_size=10))
+def test_natsort_key_with_flat_sequence_gives_same_result_as_any_iterable(
+    x: list[Any],
+) -> None:
+    def num_func(y: Any) -> tuple[str, Any]:  # noqa: ANN401
+        return ("", y)
+
+    def bytes_func(y: bytes) -> tuple[bytes]:
+        return (y,)
+
+    generic: Any = iter(x)
+    expected = natsort_key(generic, None, str_func, bytes_func, num_func)
+    assert natsort_key(x, None, str_func, bytes_func, num_func) == expected
+    assert natsort_key(tuple(x), None, str_func, bytes_func, num_func) == expected
@@ -9,9 +9,15 @@ import os
 from typing import TYPE_CHECKING
 
 import pytest
+from hypothesis import given
+from hypothesis.strategies import floats, integers, lists, text
 
-from natsort import natsort_key, natsort_keygen, natsorted, ns
-from natsort.compat.locale import get_strxfrm, null_string_locale
+from natsort import KeyStats, natsort_key, natsort_keygen, natsorted, ns
+from natsort.compat.locale import (
+    clear_locale_cache,
+    get_strxfrm,
+    null_string_locale,
+)
 
 if TYPE_CHECKING:
     from pytest_mock import MockerFixture
@@ -60,6 +66,24 @@ def test_natsort_keygen_returns_natsort_key_that_parses_input(
     assert ns_key("a-5.034e1") == expected
 
 
+@pytest.mark.parametrize(
+    "alg", [ns.DEFAULT, ns.REAL, ns.PATH, ns.IGNORECASE, ns.UNGROUPLETTERS]
+)
+def test_natsort_keygen_with_stats_records_the_stages_of_parsing_strings(
+    arbitrary_input: list[str | float], alg: NSType
+) -> None:
+    stats = KeyStats()
+    ns_key = natsort_keygen(alg=alg, stats=stats)
+    expected = natsort_keygen(alg=alg)
+    assert [ns_key(x) for x in arbitrary_input] == [
+        expected(x) for x in arbitrary_input
+    ]
+    # With PATH, each part of a path is parsed separately.
+    assert stats.calls["split"] == (4 if alg & ns.PATH else 2)
+    assert set(stats.calls) == set(KeyStats.stages)
+    assert all(stage in repr(stats) for stage in KeyStats.stages)
+
+
 @pytest.mark.parametrize(
     ("alg", "expected"),
     [
@@ -176,6 +200,7 @@ def test_natsort_keygen_with_locale(
         expected = tuple(tuple(tuple(subsub) for subsub in sub) for sub in expected_tmp)
 
     mocker.patch("natsort.compat.locale.dumb_sort", return_value=is_dumb)
+    clear_locale_cache()
     ns_key = natsort_keygen(alg=alg)
     assert ns_key(arbitrary_input) == expected
 
@@ -193,5 +218,67 @@ def test_natsort_keygen_with_locale_bytes(
 ) -> None:
     expected = (b"6A-5.034e+1",)
     mocker.patch("natsort.compat.locale.dumb_sort", return_value=is_dumb)
+    clear_locale_cache()
     ns_key = natsort_keygen(alg=alg)
     assert ns_key(bytes_input) == expected
+
+
+@pytest.mark.usefixtures("with_locale_en_us")
+def test_natsort_keygen_with_locale_reports_reused_locale_transforms() -> None:
+    ns_key = natsort_keygen(alg=ns.LOCALE)
+    sorted(["apple 2", "pear", "apple 10", "Apple"], key=ns_key)
+    info = ns_key.cache_info()  # type: ignore[attr-defined]
+    assert (info.hits, info.misses) == (1, 3)
+    assert not hasattr(natsort_keygen(), "cache_info")
+
+
+@pytest.mark.parametrize(
+    "alg", [ns.DEFAULT, ns.REAL, ns.PATH, ns.IGNORECASE, ns.UNGROUPLETTERS]
+)
+@given(
+    x=lists(text() | integers() | floats(allow_nan=False)), max_length=integers(1, 10)
+)
+def test_natsort_keygen_with_max_length_gives_keys_that_can_be_sorted(
+    x: list[str | float], max_length: int, alg: NSType
+) -> None:
+    key = natsort_keygen(alg=alg, max_length=max_length)
+    result = sorted(x, key=key)
+    # Strings that are not truncated are ordered as usual.
+    full_key = natsort_keygen(alg=alg)
+    short = [y for y in result if not isinstance(y, str) or len(y) <= max_length]
+    assert short == sorted(short, key=full_key)
+
+
+def test_natsort_keygen_with_max_length_breaks_ties_by_the_rest_of_the_string() -> None:
+    truncated: list[str] = []
+    key = natsort_keygen(max_length=4, on_truncate=truncated.append)
+    # The remainders ("22", "3", "z" and "10") are compared as text.
+    values = ["a1 b22", "a1 b3", "a1 bz", "a1 b", "a1 b10", "a1 b"]
+    expected = ["a1 b", "a1 b", "a1 b10", "a1 b22", "a1 b3", "a1 bz"]
+    assert sorted(values, key=key) == expected
+    assert truncated == ["a1 b22", "a1 b3", "a1 bz", "a1 b10"]
+
+
+def test_natsort_keygen_with_invalid_max_length_raises_value_error() -> None:
+    with pytest.raises(ValueError, match="'max_length' argument"):
+        natsort_keygen(max_length=0)
+
+
+@pytest.mark.parametrize(
+    ("engine", "expected"),
+    [
+        ("auto", ("a", 1, "b", 2)),
+        ("unicode", ("a", 1, "b", 2)),
+        ("ascii", ("a۱b", 2)),
+    ],
+)
+def test_natsort_keygen_splits_with_the_given_engine(
+    engine: str, expected: FinalTransform
+) -> None:
+    assert natsort_keygen(engine=engine)("a۱b2") == expected
+    assert natsort_keygen(engine=engine)("a1b2") == ("a", 1, "b", 2)
+
+
+def test_natsort_keygen_with_invalid_engine_raises_value_error() -> None:
+    with pytest.raises(ValueError, match="'engine' argument"):
+        natsort_keygen(engine="fast")
@@ -8,11 +8,14 @@ from __future__ import annotations
 import math
 from operator import itemgetter
 from pathlib import PurePosixPath
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Callable
 
 import pytest
+from hypothesis import given
+from hypothesis.strategies import booleans, integers, lists, sampled_from
 
-from natsort import as_utf8, natsorted, ns
+import natsort.natsort
+from natsort import as_utf8, index_natsorted, natsort_keygen, natsorted, ns
 
 if TYPE_CHECKING:
     from natsort.ns_enum import NSType
@@ -393,6 +396,15 @@ def test_natsorted_sorts_mixed_ascii_and_non_ascii_numbers() -> None:
     assert natsorted(given, alg=ns.IGNORECASE) == expected
 
 
+@pytest.mark.parametrize("alg", [ns.INT, ns.FLOAT, ns.REAL])
+def test_natsorted_only_parses_the_numerals_this_python_knows(alg: NSType) -> None:
+    # U+4E24 only became numeric in a later unicode version than some
+    # Pythons use, so they must treat it as a letter.
+    given = ["a\u4e24", "a3"]
+    expected = given if "\u4e24".isnumeric() else given[::-1]
+    assert natsorted(given, alg=alg) == expected
+
+
 def test_natsort_sorts_consistently_with_presort() -> None:
     # Demonstrate the problem:
     # Sorting is order-dependent for values that have different
@@ -420,3 +432,160 @@ def test_natsort_sorts_consistently_with_presort() -> None:
     given = ["a1", "a1.45", "a01", "a1.4500"]
     result = natsorted(given, alg=ns.FLOAT | ns.PRESORT)
     assert result == expected
+
+
+@given(
+    lists(integers(0, 10000), max_size=50),
+    lists(sampled_from(["frame", "frame_1.exr", "x", "frame_01.exr"]), max_size=3),
+    sampled_from([ns.DEFAULT, ns.SIGNED, ns.IGNORECASE, ns.NUMAFTER]),
+    booleans(),
+)
+def test_natsorted_with_template_gives_identical_result_to_natsorted(
+    numbers: list[int],
+    outliers: list[str],
+    alg: NSType,
+    reverse: bool,
+) -> None:
+    given = [f"Frame_{x:04d}.exr" for x in numbers] + outliers
+    expected = natsorted(given, reverse=reverse, alg=alg)
+    assert natsorted(given, reverse=reverse, alg=alg | ns.TEMPLATE) == expected
+
+
+def test_natsorted_with_template_is_stable_for_equal_slot_values() -> None:
+    given = ["a01b2", "a1b2", "a1b02", "a001b2", "a1", "a0b9"]
+    expected = ["a0b9", "a1", "a01b2", "a1b2", "a1b02", "a001b2"]
+    assert natsorted(given, alg=ns.TEMPLATE) == expected
+    assert natsorted(given, reverse=True, alg=ns.TEMPLATE) == natsorted(
+        given,
+        reverse=True,
+    )
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_natsorted_with_template_merges_many_outliers(reverse: bool) -> None:
+    given = [f"Frame_{i * 7 % 900:04d}.exr" for i in range(900)]
+    given += [f"Frame_{i * 3 % 100}" for i in range(100)] + ["Frame_0500.exr"] * 5
+    expected = natsorted(given, reverse=reverse)
+    assert natsorted(given, reverse=reverse, alg=ns.TEMPLATE) == expected
+    expected_index = index_natsorted(given, reverse=reverse)
+    assert index_natsorted(given, reverse=reverse, alg=ns.TEMPLATE) == expected_index
+
+
+@pytest.mark.parametrize(
+    ("alg", "key"),
+    [
+        (ns.DEFAULT, str.upper),
+        (ns.TEMPLATE, str.upper),
+        (ns.TEMPLATE | ns.PATH, str.upper),
+        (ns.DEDUPE, str.upper),
+        (ns.DEDUPE | ns.TEMPLATE, str.upper),
+        # Lists cannot be deduped, so every strategy falls back.
+        (ns.DEDUPE | ns.TEMPLATE, lambda x: [x]),
+    ],
+)
+@pytest.mark.parametrize("size", [10, 420])
+def test_natsorted_calls_the_key_once_for_each_element(
+    alg: NSType, key: Callable[[str], Any], size: int
+) -> None:
+    # Too few elements match a template, so ns.TEMPLATE falls back.
+    given = [f"x{i % 7}y{i % 3}" if i % 2 else f"{i}z" for i in range(size)]
+    calls: list[str] = []
+
+    def counted_key(x: str) -> Any:  # noqa: ANN401
+        calls.append(x)
+        return key(x)
+
+    expected = natsorted(given, key=key)
+    assert natsorted(given, key=counted_key, alg=alg) == expected
+    assert len(calls) == size
+    calls.clear()
+    expected_index = index_natsorted(given, key=key)
+    assert index_natsorted(given, key=counted_key, alg=alg) == expected_index
+    assert len(calls) == size
+
+
+def test_natsorted_with_template_falls_back_when_input_has_no_template() -> None:
+    given = ["b10", 1, "a2", "b9", "c"]
+    expected = [1, "a2", "b9", "b10", "c"]
+    assert natsorted(given, alg=ns.TEMPLATE) == expected
+
+
+@pytest.mark.parametrize(
+    "alg",
+    [ns.DEFAULT, ns.REAL, ns.IGNORECASE, ns.LOWERCASEFIRST | ns.NUMAFTER, ns.PATH],
+)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_natsorted_of_long_input_gives_identical_result_to_sorted_with_key(
+    alg: NSType,
+    reverse: bool,
+) -> None:
+    prefixes = ["a", "A", "b-", "", "img_", "۱", "x ", "1.5e", "c\0"]
+    given = [f"{p}{i % 37}{p[::-1]}{i % 5}" for i in range(300) for p in prefixes]
+    key = natsort_keygen(alg=alg)
+    expected = sorted(given, key=key, reverse=reverse)
+    assert natsorted(given, reverse=reverse, alg=alg) == expected
+    expected_index = sorted(
+        range(len(given)),
+        key=lambda i: key(given[i]),
+        reverse=reverse,
+    )
+    assert index_natsorted(given, reverse=reverse, alg=alg) == expected_index
+
+
+@given(
+    lists(sampled_from(["a10", "A10", "a2", "a02", "a2.0", "b", "", "a-1"])),
+    sampled_from([ns.DEFAULT, ns.IGNORECASE, ns.REAL, ns.PRESORT, ns.TEMPLATE]),
+    booleans(),
+)
+def test_natsorted_with_dedupe_gives_identical_result_to_natsorted(
+    given: list[str], alg: NSType, reverse: bool
+) -> None:
+    expected = natsorted(given, reverse=reverse, alg=alg)
+    assert natsorted(given, reverse=reverse, alg=alg | ns.DEDUPE) == expected
+    expected_index = index_natsorted(given, reverse=reverse, alg=alg)
+    result = index_natsorted(given, reverse=reverse, alg=alg | ns.DEDUPE)
+    assert result == expected_index
+
+
+@pytest.mark.parametrize("key", [None, str, repr])
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.PRESORT])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_natsorted_with_dedupe_does_not_merge_values_the_key_tells_apart(
+    key: Callable[[Any], Any] | None, alg: NSType, reverse: bool
+) -> None:
+    given = [True, "a", 1, 1.0, 0, -0.0, 0.0, float("nan"), None, 1]
+    expected = natsorted(given, key=key, reverse=reverse, alg=alg)
+    result = natsorted(given, key=key, reverse=reverse, alg=alg | ns.DEDUPE)
+    assert repr(result) == repr(expected)
+    expected_index = index_natsorted(given, key=key, reverse=reverse, alg=alg)
+    result_index = index_natsorted(given, key=key, reverse=reverse, alg=alg | ns.DEDUPE)
+    assert result_index == expected_index
+
+
+def test_natsorted_with_dedupe_keys_each_distinct_value_once(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    keyed: list[list[Any]] = []
+    natsort_keys = natsort.natsort._natsort_keys  # noqa: SLF001
+
+    def spy(seq: list[Any], *args: Any, **kwargs: Any) -> list[Any]:  # noqa: ANN401
+        keyed.append(list(seq))
+        return natsort_keys(seq, *args, **kwargs)
+
+    monkeypatch.setattr("natsort.natsort._natsort_keys", spy)
+    given = ["a10", "a2", "a10", "a2", "A2"]
+    assert natsorted(given, alg=ns.DEDUPE) == ["A2", "a2", "a2", "a10", "a10"]
+    assert natsorted(given, key=str.lower, alg=ns.DEDUPE) == [
+        "a2",
+        "a2",
+        "A2",
+        "a10",
+        "a10",
+    ]
+    assert keyed == [["a10", "a2", "A2"], ["a10", "a2"]]
+
+
+def test_natsorted_with_dedupe_falls_back_for_unhashable_elements() -> None:
+    given = [["a", 10], ["a", 2], ["a", 2]]
+    assert natsorted(given, alg=ns.DEDUPE) == [["a", 2], ["a", 2], ["a", 10]]
+    assert index_natsorted(given, alg=ns.DEDUPE) == [1, 2, 0]
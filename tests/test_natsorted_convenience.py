@@ -5,7 +5,10 @@ See the README or the natsort homepage for more details.
 
 from __future__ import annotations
 
+import locale
+from concurrent.futures import ThreadPoolExecutor
 from operator import itemgetter
+from typing import TYPE_CHECKING
 
 import pytest
 
@@ -14,15 +17,27 @@ from natsort import (
     as_utf8,
     decoder,
     humansorted,
+    humansorted_locales,
     index_humansorted,
     index_natsorted,
     index_realsorted,
     natsorted,
+    natsorted_items,
     ns,
     order_by_index,
     realsorted,
 )
 
+if TYPE_CHECKING:
+    from natsort.ns_enum import NSType
+
+try:
+    import icu  # noqa: F401
+except ImportError:
+    has_icu = False
+else:
+    has_icu = True
+
 
 @pytest.fixture
 def version_list() -> list[str]:
@@ -69,6 +84,79 @@ def test_humansorted_is_identical_to_natsorted_with_locale_alg(
     assert humansorted(fruit_list) == natsorted(fruit_list, alg=ns.LOCALE)
 
 
+@pytest.mark.skipif(not has_icu, reason="requires ICU")
+def test_humansorted_with_explicit_locale_does_not_use_global_locale() -> None:
+    orig = locale.getlocale()
+    given = ["z 1.000", "ä 999", "z 999", "a 2"]
+    # German: "." is the thousands separator and "ä" sorts with "a".
+    de = ["a 2", "ä 999", "z 999", "z 1.000"]
+    # Swedish: "." is not a thousands separator and "ä" sorts after "z".
+    sv = ["a 2", "z 1.000", "z 999", "ä 999"]
+    assert humansorted(given, locale="de_DE") == de
+    assert humansorted(given, locale="sv_SE") == sv
+    assert index_humansorted(given, locale="sv_SE") == [3, 0, 2, 1]
+    long_sv = [x for x in sv for _ in range(100)]
+    assert humansorted(given * 100, locale="sv_SE") == long_sv
+    assert locale.getlocale() == orig
+
+    # Sorts with different locales can run at the same time.
+    with ThreadPoolExecutor(4) as pool:
+        results = list(
+            pool.map(
+                lambda loc: humansorted(given, locale=loc),
+                ["de_DE", "sv_SE"] * 50,
+            ),
+        )
+    assert results == [de, sv] * 50
+
+
+@pytest.mark.skipif(not has_icu, reason="requires ICU")
+@pytest.mark.parametrize("loc", ["de_AT", "en_US.UTF-8", "C", "root"])
+def test_humansorted_with_explicit_locale_accepts_locales_icu_knows(loc: str) -> None:
+    assert humansorted(["a10", "a2"], locale=loc) == ["a2", "a10"]
+
+
+@pytest.mark.skipif(not has_icu, reason="requires ICU")
+@pytest.mark.parametrize("loc", ["xx_YY", "not a locale"])
+def test_humansorted_with_unknown_explicit_locale_raises_value_error(loc: str) -> None:
+    with pytest.raises(ValueError, match="unknown locale"):
+        humansorted(["a10", "a2"], locale=loc)
+
+
+@pytest.mark.skipif(not has_icu, reason="requires ICU")
+def test_humansorted_with_explicit_locale_uses_its_decimal_point() -> None:
+    given = ["x1,5", "x1,25"]
+    assert humansorted(given, alg=ns.FLOAT, locale="de_DE") == ["x1,25", "x1,5"]
+
+
+@pytest.mark.skipif(not has_icu, reason="requires ICU")
+@pytest.mark.parametrize(
+    "alg",
+    [ns.DEFAULT, ns.FLOAT, ns.GROUPLETTERS, ns.NUMAFTER | ns.IGNORECASE, ns.PATH],
+)
+@pytest.mark.parametrize("reverse", [True, False])
+def test_humansorted_locales_is_humansorted_for_each_locale(
+    alg: NSType,
+    reverse: bool,
+) -> None:
+    given = ["z 1.000", "ä 999", "z 999", "a 2", "x1,5", "x1,25", "Apple", "apple"]
+    locales = ["de_DE", "sv_SE", "en_US", "da_DK"]
+    result = humansorted_locales(given, locales, reverse=reverse, alg=alg)
+    assert list(result) == locales
+    for loc in locales:
+        assert result[loc] == humansorted(given, reverse=reverse, alg=alg, locale=loc)
+
+
+@pytest.mark.skipif(not has_icu, reason="requires ICU")
+def test_humansorted_locales_applies_key_to_any_input() -> None:
+    given = [("b", "ä 2"), ("a", 5), ("c", "z 1"), ("d", b"a")]
+    result = humansorted_locales(given, ["de_DE", "sv_SE"], key=itemgetter(1))
+    assert result == {
+        "de_DE": [("a", 5), ("b", "ä 2"), ("c", "z 1"), ("d", b"a")],
+        "sv_SE": [("a", 5), ("c", "z 1"), ("b", "ä 2"), ("d", b"a")],
+    }
+
+
 def test_index_natsorted_returns_integer_list_of_sort_order_for_input_list() -> None:
     given = ["num3", "num5", "num2"]
     other = ["foo", "bar", "baz"]
@@ -78,6 +166,33 @@ def test_index_natsorted_returns_integer_list_of_sort_order_for_input_list() ->
     assert [other[i] for i in index] == ["baz", "foo", "bar"]
 
 
+def test_natsorted_items_sorts_by_key_by_default() -> None:
+    given = {"num3": "b10", "num5": "b2", "num2": "b1"}
+    expected = [("num2", "b1"), ("num3", "b10"), ("num5", "b2")]
+    assert natsorted_items(given) == expected
+    assert natsorted_items(given, reverse=True) == expected[::-1]
+
+
+def test_natsorted_items_sorts_by_key_only() -> None:
+    # The values cannot be ordered, and are not needed to break ties.
+    values = [object(), object(), object()]
+    given = dict(zip(["a1", "a01", "a0"], values))
+    expected = [("a0", values[2]), ("a1", values[0]), ("a01", values[1])]
+    assert natsorted_items(given) == expected
+    assert natsorted_items(given, reverse=True) == expected[1:] + expected[:1]
+
+
+def test_natsorted_items_sorts_by_value_then_key() -> None:
+    given = {"num3": "b10", "num5": "b2", "num2": "b1", "num10": "b02"}
+    expected = [("num2", "b1"), ("num5", "b2"), ("num10", "b02"), ("num3", "b10")]
+    assert natsorted_items(given, by="value") == expected
+
+
+def test_natsorted_items_raises_on_invalid_by() -> None:
+    with pytest.raises(ValueError, match="'by' must be 'key' or 'value'"):
+        natsorted_items({}, by="item")
+
+
 def test_index_natsorted_reverse() -> None:
     given = ["num3", "num5", "num2"]
     assert index_natsorted(given, reverse=True) == index_natsorted(given)[::-1]
@@ -96,6 +211,13 @@ def test_index_natsorted_can_presort() -> None:
     assert result == expected
 
 
+def test_index_natsorted_with_template_gives_identical_result() -> None:
+    given = [("b", "img_10.png"), ("a", "img_2.png"), ("c", "img_1.png"), ("d", 5)]
+    expected = index_natsorted(given, key=itemgetter(1))
+    result = index_natsorted(given, key=itemgetter(1), alg=ns.TEMPLATE)
+    assert result == expected == [3, 2, 1, 0]
+
+
 def test_index_realsorted_is_identical_to_index_natsorted_with_real_alg(
     float_list: list[str],
 ) -> None:
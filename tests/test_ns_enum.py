@@ -22,6 +22,8 @@ from natsort import ns
         ("COMPATIBILITYNORMALIZE", 0x0800),
         ("NUMAFTER", 0x1000),
         ("PRESORT", 0x2000),
+        ("TEMPLATE", 0x4000),
+        ("DEDUPE", 0x8000),
         ("DEFAULT", 0x0000),
         ("INT", 0x0000),
         ("UNSIGNED", 0x0000),
@@ -47,6 +49,8 @@ from natsort import ns
         ("CN", 0x0800),
         ("NA", 0x1000),
         ("PS", 0x2000),
+        ("TP", 0x4000),
+        ("DD", 0x8000),
     ],
 )
 def test_ns_enum(given: str, expected: int) -> None:
@@ -0,0 +1,148 @@
+"""These test the natsort.numpy functions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+import pytest
+from hypothesis import given
+from hypothesis.strategies import floats, integers, lists, sampled_from, text
+
+from natsort import index_natsorted, natsorted, ns
+
+np = pytest.importorskip("numpy")
+
+from natsort.numpy import natargsort, natsort_array  # noqa: E402
+
+if TYPE_CHECKING:
+    from natsort.ns_enum import NSType
+
+
+@pytest.fixture
+def labels() -> list[str]:
+    return [f"item{i * 7 % 50}" for i in range(300)] + ["Item3", "item03", "a"]
+
+
+def test_natargsort_returns_an_array_of_indexes() -> None:
+    given_ = natargsort(np.array(["num3", "num5", "num2"]))
+    assert given_.dtype == np.intp
+    assert given_.tolist() == [2, 0, 1]
+
+
+def test_natsort_array_returns_the_sorted_array() -> None:
+    given_ = natsort_array(np.array(["a10", "a2", "a1"]))
+    assert given_.dtype == np.dtype("<U3")
+    assert given_.tolist() == ["a1", "a2", "a10"]
+
+
+@pytest.mark.parametrize(
+    "alg",
+    [
+        ns.DEFAULT,
+        ns.IGNORECASE,
+        ns.LOWERCASEFIRST | ns.PRESORT,
+        ns.REAL,
+        ns.PATH,
+        ns.TEMPLATE,
+        ns.PRESORT,
+    ],
+)
+@pytest.mark.parametrize("reverse", [False, True])
+def test_natargsort_matches_index_natsorted(
+    labels: list[str], alg: NSType, reverse: bool
+) -> None:
+    expected = index_natsorted(labels, reverse=reverse, alg=alg)
+    assert natargsort(labels, reverse=reverse, alg=alg).tolist() == expected
+
+
+@pytest.mark.parametrize("reverse", [False, True])
+def test_natargsort_matches_index_natsorted_with_a_key(
+    labels: list[str], reverse: bool
+) -> None:
+    expected = index_natsorted(labels, key=str.upper, reverse=reverse)
+    given_ = natargsort(labels, key=str.upper, reverse=reverse)
+    assert given_.tolist() == expected
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.PRESORT])
+@pytest.mark.parametrize("reverse", [False, True])
+@pytest.mark.parametrize("key", [repr, str, lambda x: type(x).__name__])
+def test_natargsort_matches_index_natsorted_when_key_tells_equal_values_apart(
+    alg: NSType, reverse: bool, key: Callable[[Any], Any]
+) -> None:
+    values: list[Any] = [True, "a", 1, 1.0, 0, -0.0, 0.0, False, 1]
+    expected = index_natsorted(values, key=key, reverse=reverse, alg=alg)
+    arr = np.array(values, dtype=object)
+    assert natargsort(arr, key=key, reverse=reverse, alg=alg).tolist() == expected
+    # The key is given the numpy scalars of the array.
+    float_arr = np.array([0.0, -0.0, 1.0, 0.0])
+    expected = index_natsorted(float_arr, key=repr, reverse=reverse, alg=alg)
+    given_ = natargsort(float_arr, key=repr, reverse=reverse, alg=alg)
+    assert given_.tolist() == expected
+
+
+def test_natargsort_applies_the_key_to_the_elements_of_the_array() -> None:
+    arr = np.array([0.0, float("nan"), 2.0, 2.0, float("nan"), -0.0])
+    expected = index_natsorted(arr, key=repr, alg=ns.REAL)
+    assert expected == [0, 5, 2, 3, 1, 4]
+    assert natargsort(arr, key=repr, alg=ns.REAL).tolist() == expected
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.PRESORT, ns.NANLAST])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_natargsort_matches_index_natsorted_for_mixed_objects(
+    alg: NSType, reverse: bool
+) -> None:
+    values: list[Any] = [1, "a5", 0.0, -0.0, float("nan"), None, 1.0, True, "a5", 2]
+    expected = index_natsorted(values, reverse=reverse, alg=alg)
+    arr = np.array(values, dtype=object)
+    assert natargsort(arr, reverse=reverse, alg=alg).tolist() == expected
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.FLOAT])
+def test_natargsort_sorts_the_elements_of_a_list_as_they_are(alg: NSType) -> None:
+    values: list[Any] = [1.5, "1.25", "a2", 10]
+    expected = index_natsorted(values, alg=alg)
+    assert natargsort(values, alg=alg).tolist() == expected
+    assert natsort_array(values, alg=alg).tolist() == natsorted(values, alg=alg)
+
+
+def test_natargsort_handles_unhashable_objects() -> None:
+    values = [["a", 10], ["a", 2], ["a", 2]]
+    arr = np.empty(len(values), dtype=object)
+    arr[:] = values
+    assert natargsort(arr).tolist() == index_natsorted(values)
+
+
+def test_natargsort_handles_bytes_arrays() -> None:
+    values = [b"a10", b"a2", b"a1", b"a2"]
+    assert natargsort(np.array(values)).tolist() == index_natsorted(values)
+
+
+def test_natargsort_handles_empty_arrays() -> None:
+    assert natargsort(np.array([], dtype=str)).tolist() == []
+
+
+def test_natargsort_raises_for_arrays_that_are_not_one_dimensional() -> None:
+    with pytest.raises(ValueError, match="must be one-dimensional, got 2"):
+        natargsort(np.array([["a1", "a2"], ["a3", "a4"]]))
+
+
+@given(lists(text().map(lambda x: x.replace("\0", "")) | sampled_from(["a1", "a01"])))
+def test_natargsort_matches_index_natsorted_for_strings(x: list[str]) -> None:
+    assert natargsort(np.array(x, dtype=str)).tolist() == index_natsorted(x)
+
+
+@given(lists(integers() | floats(allow_nan=True)))
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.PRESORT])
+def test_natargsort_matches_index_natsorted_for_numbers(
+    alg: NSType, x: list[float]
+) -> None:
+    arr = np.array(x, dtype=object)
+    assert natargsort(arr, alg=alg).tolist() == index_natsorted(x, alg=alg)
+
+
+@given(lists(floats(allow_nan=True)))
+def test_natsort_array_matches_natsorted_for_float_arrays(x: list[float]) -> None:
+    given_ = natsort_array(np.array(x, dtype=float))
+    assert repr(given_.tolist()) == repr(natsorted(x))
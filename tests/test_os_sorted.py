@@ -11,7 +11,7 @@ import pytest
 import natsort
 
 try:
-    import icu  # noqa: F401
+    from natsort.compat.locale import _collator, get_icu_collator
 except ImportError:
     has_icu = False
 else:
@@ -222,3 +222,24 @@ else:
 def test_os_sorted_corpus() -> None:
     result = natsort.os_sorted(given)
     assert result == expected
+
+
+@pytest.mark.skipif(not has_icu, reason="requires ICU")
+def test_icu_collator_is_created_once_per_locale_and_option() -> None:
+    numeric = get_icu_collator(numeric=True)
+    assert get_icu_collator(numeric=True) is numeric
+    assert get_icu_collator() is get_icu_collator()
+    assert get_icu_collator() is not numeric
+    assert numeric.getSortKey("a2") < numeric.getSortKey("a10")
+
+
+@pytest.mark.skipif(not has_icu, reason="requires ICU")
+def test_icu_collators_are_kept_for_a_bounded_number_of_locales() -> None:
+    for loc in ["de_DE", "sv_SE", "en_US", "fr_FR", "da_DK"] * 10:
+        for numeric in (False, True):
+            get_icu_collator(loc, numeric=numeric)
+    for i in range(100):
+        get_icu_collator(f"de_{i:03d}")
+    maxsize = _collator.cache_info().maxsize
+    assert maxsize is not None
+    assert _collator.cache_info().currsize <= maxsize
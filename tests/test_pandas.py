@@ -0,0 +1,112 @@
+"""These test the natsort.pandas functions."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Callable
+
+import pytest
+
+from natsort import index_natsorted, natsorted, ns
+
+pd = pytest.importorskip("pandas")
+
+from natsort.pandas import natsort_series_key  # noqa: E402
+
+if TYPE_CHECKING:
+    from natsort.ns_enum import NSType
+
+
+@pytest.fixture
+def labels() -> list[str]:
+    return [f"item{i * 7 % 50}" for i in range(300)] + ["Item3", "item03", "a"]
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.IGNORECASE, ns.REAL, ns.PATH])
+def test_natsort_series_key_sorts_series_like_natsorted(
+    labels: list[str], alg: NSType
+) -> None:
+    series = pd.Series(labels)
+    given = series.sort_values(key=natsort_series_key(alg=alg), kind="stable")
+    assert given.tolist() == natsorted(labels, alg=alg)
+    assert given.index.tolist() == index_natsorted(labels, alg=alg)
+
+
+def test_natsort_series_key_keeps_the_labels_and_name() -> None:
+    series = pd.Series(["a10", "a2", "a2"], index=["x", "y", "z"], name="n")
+    given = natsort_series_key()(series)
+    assert given.tolist() == [2, 1, 1]
+    assert given.index.tolist() == ["x", "y", "z"]
+    assert given.name == "n"
+
+
+def test_natsort_series_key_applies_key(labels: list[str]) -> None:
+    series = pd.Series(labels)
+    given = series.sort_values(key=natsort_series_key(str.upper), kind="stable")
+    assert given.tolist() == natsorted(labels, key=str.upper)
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.PRESORT])
+@pytest.mark.parametrize("key", [None, repr])
+def test_natsort_series_key_does_not_merge_values_the_key_tells_apart(
+    alg: NSType, key: Callable[[Any], Any] | None
+) -> None:
+    values: list[Any] = [True, "a", 1, 1.0, 0, False, 1]
+    series = pd.Series(values, dtype=object)
+    given = series.sort_values(key=natsort_series_key(key, alg), kind="stable")
+    assert given.index.tolist() == index_natsorted(values, key=key, alg=alg)
+
+
+def test_natsort_series_key_sorts_data_frames_by_several_columns() -> None:
+    df = pd.DataFrame(
+        {"a": ["x10", "x2", "x10", "x2"], "b": ["v1.10", "v1.9", "v1.9", "v1.10"]}
+    )
+    given = df.sort_values(["a", "b"], key=natsort_series_key())
+    assert given.index.tolist() == [1, 3, 2, 0]
+    given = df.sort_values(["a", "b"], key=natsort_series_key(alg=ns.REAL))
+    assert given.index.tolist() == [3, 1, 0, 2]
+    given = df.sort_values(["a", "b"], ascending=False, key=natsort_series_key())
+    assert given.index.tolist() == [0, 2, 3, 1]
+
+
+def test_natsort_series_key_sorts_indexes() -> None:
+    index = pd.Index(["r10", "r2", "r1"], name="row")
+    key = natsort_series_key()
+    assert key(index).tolist() == [3, 2, 1]
+    assert key(index).name == "row"
+    assert index.sort_values(key=key).tolist() == ["r1", "r2", "r10"]
+    df = pd.DataFrame({"n": [1, 2, 3]}, index=index)
+    assert df.sort_index(key=key)["n"].tolist() == [3, 2, 1]
+
+
+def test_natsort_series_key_sorts_multi_indexes_by_level() -> None:
+    index = pd.MultiIndex.from_tuples([("a10", "b2"), ("a2", "b10"), ("a2", "b1")])
+    series = pd.Series([1, 2, 3], index=index)
+    assert series.sort_index(key=natsort_series_key()).tolist() == [3, 2, 1]
+
+
+@pytest.mark.parametrize(("na_position", "expected"), [("last", 0), ("first", 2)])
+def test_natsort_series_key_leaves_missing_values_to_pandas(
+    na_position: str, expected: int
+) -> None:
+    series = pd.Series(["a10", None, "a2", float("nan")], dtype=object)
+    given = series.sort_values(key=natsort_series_key(), na_position=na_position)
+    values: list[Any] = given.tolist()
+    assert values[expected : expected + 2] == ["a2", "a10"]
+    assert given.isna().sum() == 2
+
+
+@pytest.mark.parametrize("key", [None, str])
+def test_natsort_series_key_handles_only_missing_values(
+    key: Callable[[Any], Any] | None,
+) -> None:
+    series = pd.Series([None, None], dtype=object)
+    assert natsort_series_key(key)(series).isna().all()
+    series = pd.Series(["a10", None, "a2"], dtype=object)
+    assert natsort_series_key(key)(series).tolist()[::2] == [2, 1]
+
+
+def test_natsort_series_key_handles_categorical_and_numeric_data() -> None:
+    series = pd.Series(["b10", "b9", "b10"], dtype="category")
+    assert natsort_series_key()(series).tolist() == [2, 1, 2]
+    series = pd.Series([10.5, -1.0, 2.0])
+    assert natsort_series_key()(series).tolist() == [3, 1, 2]
@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 import unicodedata
-from typing import TYPE_CHECKING, Any, Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, cast
 
 import pytest
 from hypothesis import given
@@ -13,8 +14,11 @@ from natsort.compat.fastnumbers import try_float
 from natsort.ns_enum import NS_DUMB, NSType, ns
 from natsort.utils import (
     FinalTransform,
+    KeyStats,
+    Remainder,
     StrParser,
     parse_string_factory,
+    parse_string_multi_factory,
 )
 from natsort.utils import (
     NumericalRegularExpressions as NumRegex,
@@ -45,7 +49,7 @@ def final_transform(x: Iterable[Any], original: str) -> FinalTransform:
     return t
 
 
-def parse_string_func_factory(alg: NSType) -> StrParser:
+def parse_string_func_factory(alg: NSType, stats: KeyStats | None = None) -> StrParser:
     """A parse_string_factory result with sample arguments."""
     sep = ""
     return parse_string_factory(
@@ -55,6 +59,7 @@ def parse_string_func_factory(alg: NSType) -> StrParser:
         input_transform,
         lambda x: try_float(x, map=True),
         final_transform,
+        stats=stats,
     )
 
 
@@ -108,3 +113,98 @@ def test_parse_string_factory_invariance(
     # Original should have gone through the "input_transform"
     # which is uppercase in these tests.
     assert result.original == orig_func(unicodedata.normalize("NFD", value))
+
+
+@given(x=text())
+def test_parse_string_multi_factory_is_parse_string_factory_for_each_locale(
+    x: str,
+) -> None:
+    sep = ""
+    splitter = NumRegex.int_nosign().split
+    input_transforms = [input_transform, str.lower, input_transform]
+    collations = [str.casefold, str.swapcase, str.lower]
+    parse_multi = parse_string_multi_factory(
+        ns.DEFAULT,
+        sep,
+        splitter=splitter,
+        input_transforms=input_transforms,
+        component_transform=lambda x: try_float(x, map=True),
+        collations=collations,
+        final_transform=final_transform,
+    )
+    expected = [
+        parse_string_factory(
+            ns.DEFAULT,
+            sep,
+            splitter,
+            transform,
+            partial(try_float, map=True, on_fail=collate),
+            final_transform,
+        )(x)
+        for transform, collate in zip(input_transforms, collations)
+    ]
+    result = parse_multi(x)
+    assert result == expected
+    originals = [cast("CustomTuple", r).original for r in result]
+    assert originals == [cast("CustomTuple", e).original for e in expected]
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.LOCALE | NS_DUMB])
+@given(x=text() | lists(integers(), min_size=50).map(str))
+def test_parse_string_factory_with_stats_gives_the_same_result(
+    x: str, alg: NSType
+) -> None:
+    stats = KeyStats()
+    result = parse_string_func_factory(alg, stats)(x)
+    expected = parse_string_func_factory(alg)(x)
+    assert result == expected
+    original = cast("CustomTuple", expected).original
+    assert cast("CustomTuple", result).original == original
+    assert all(stats.calls[stage] == 1 for stage in KeyStats.stages)
+    assert all(stats.time_ns[stage] >= 0 for stage in KeyStats.stages)
+    assert stats.components == len([y for y in NumRegex.int_nosign().split(x) if y])
+
+
+def test_parse_string_factory_without_stats_is_not_timed() -> None:
+    stats = KeyStats()
+    timed = parse_string_func_factory(ns.DEFAULT, stats)
+    assert parse_string_func_factory(ns.DEFAULT).__code__ is not timed.__code__
+    parse_string_func_factory(ns.DEFAULT)("a1b2")
+    assert not stats.calls
+    timed("a1b2")
+    timed("c3")
+    assert stats.calls["final_transform"] == 2
+    assert stats.components == 6
+    stats.reset()
+    assert not stats.calls
+    assert not stats.time_ns
+    assert stats.components == 0
+
+
+@given(x=text(), max_length=integers(min_value=1, max_value=20))
+def test_parse_string_factory_with_max_length_only_parses_the_beginning(
+    x: str, max_length: int
+) -> None:
+    truncated: list[str] = []
+    parse = parse_string_factory(
+        ns.DEFAULT,
+        "",
+        NumRegex.int_nosign().split,
+        input_transform,
+        lambda x: try_float(x, map=True),
+        final_transform,
+        max_length=max_length,
+        on_truncate=truncated.append,
+    )
+    result = parse(x)
+    if len(x) <= max_length:
+        assert result == parse_string_func_factory(ns.DEFAULT)(x)
+        assert not truncated
+    else:
+        assert truncated == [x]
+        assert result[-1] == Remainder(x[max_length:])
+        expected = parse_string_func_factory(ns.DEFAULT)(x[:max_length])
+        assert result[: len(expected)] == expected
+        # Numbers, and the remainder in their place, are at odd indexes.
+        assert all(type(y) is str for y in result[::2])
+        assert all(type(y) is not str for y in result[1::2])
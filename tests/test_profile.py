@@ -0,0 +1,122 @@
+"""These test the natsort.profile context manager."""
+
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING
+
+import pytest
+
+from natsort import (
+    Profile,
+    humansorted,
+    index_natsorted,
+    natsorted,
+    ns,
+    os_sorted,
+    profile,
+)
+
+if TYPE_CHECKING:
+    from natsort.ns_enum import NSType
+
+
+@pytest.fixture
+def words() -> list[str]:
+    return [f"item{i * 7 % 300}" for i in range(300)]
+
+
+@pytest.mark.parametrize("alg", [ns.DEFAULT, ns.TEMPLATE, ns.PATH, ns.PRESORT])
+@pytest.mark.parametrize("reverse", [False, True])
+def test_profile_does_not_change_the_results(
+    words: list[str], alg: NSType, reverse: bool
+) -> None:
+    expected = (
+        natsorted(words, reverse=reverse, alg=alg),
+        index_natsorted(words, reverse=reverse, alg=alg),
+        os_sorted(words, reverse=reverse),
+    )
+    with profile():
+        assert natsorted(words, reverse=reverse, alg=alg) == expected[0]
+        assert index_natsorted(words, reverse=reverse, alg=alg) == expected[1]
+        assert os_sorted(words, reverse=reverse) == expected[2]
+
+
+def test_profile_records_each_sort(words: list[str]) -> None:
+    with profile() as p:
+        natsorted(words)
+        humansorted(words[:10])
+    assert p.calls == 2
+    assert p.keys == 310
+    # The input is not in order, so each key is compared at least once.
+    assert p.comparisons >= 309
+    assert p.mean_length == 2
+    assert p.mean_depth == 1
+    assert p.key_bytes > 0
+    assert p.key_time > 0
+    assert p.sort_time > 0
+    assert "keys computed:     310" in repr(p)
+
+
+def test_profile_records_nested_keys_of_paths() -> None:
+    with profile() as p:
+        natsorted(["a/b1", "a/b10", "a/b2"], alg=ns.PATH)
+    assert p.mean_depth == 2
+    assert p.mean_length == 2
+
+
+def test_profile_counts_every_comparison() -> None:
+    with profile() as p:
+        natsorted(["a3", "a2", "a1"])
+    # Sorting a reversed list of 3 needs 2 comparisons to find the run.
+    assert p.comparisons == 2
+
+
+def test_nested_profiles_record_the_same_sorts(words: list[str]) -> None:
+    with profile() as outer:
+        natsorted(words)
+        with profile() as inner:
+            natsorted(words)
+    assert (outer.calls, inner.calls) == (2, 1)
+    assert outer.comparisons == 2 * inner.comparisons
+
+
+def test_profile_stops_recording_after_the_with_block(words: list[str]) -> None:
+    with profile() as p:
+        pass
+    natsorted(words)
+    assert isinstance(p, Profile)
+    assert p.calls == p.keys == p.comparisons == 0
+    assert p.mean_length == p.mean_depth == 0
+
+
+def test_profiles_of_concurrent_threads_are_separate(words: list[str]) -> None:
+    with profile() as expected:
+        natsorted(words)
+    barrier = threading.Barrier(4)
+    results: list[Profile] = []
+
+    def run() -> None:
+        with profile() as p:
+            barrier.wait()
+            for _ in range(20):
+                natsorted(words)
+        results.append(p)
+
+    threads = [threading.Thread(target=run) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert [p.calls for p in results] == [20] * 4
+    assert [p.comparisons for p in results] == [20 * expected.comparisons] * 4
+
+
+def test_profile_does_not_record_the_sorts_of_other_threads(
+    words: list[str],
+) -> None:
+    with profile() as p:
+        thread = threading.Thread(target=natsorted, args=(words,))
+        thread.start()
+        thread.join()
+    assert p.calls == 0
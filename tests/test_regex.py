@@ -5,9 +5,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 import pytest
+from hypothesis import given
+from hypothesis.strategies import characters, text
 
 from natsort import ns, numeric_regex_chooser
 from natsort.utils import NumericalRegularExpressions as NumRegex
+from natsort.utils import regex_chooser, string_splitter_factory
 
 if TYPE_CHECKING:
     from re import Pattern
@@ -129,3 +132,40 @@ def test_regex_splits_correctly(
 )
 def test_regex_chooser(given: NSType, expected: Pattern[str]) -> None:
     assert numeric_regex_chooser(given) == expected.pattern[1:-1]  # remove parens
+
+
+all_algs = [
+    ns.INT,
+    ns.INT | ns.SIGNED,
+    ns.FLOAT,
+    ns.FLOAT | ns.SIGNED,
+    ns.FLOAT | ns.NOEXP,
+    ns.FLOAT | ns.SIGNED | ns.NOEXP,
+]
+
+
+@pytest.mark.parametrize("alg", all_algs)
+@given(text(alphabet=characters(max_codepoint=127)))
+def test_ascii_only_regex_splits_ascii_identically(alg: NSType, x: str) -> None:
+    expected = regex_chooser(alg).split(x)
+    assert regex_chooser(alg, ascii_only=True).split(x) == expected
+
+
+@pytest.mark.parametrize("alg", all_algs)
+@given(text())
+def test_string_splitter_factory_auto_engine_splits_identically(
+    alg: NSType,
+    x: str,
+) -> None:
+    expected = string_splitter_factory(alg, "unicode")(x)
+    assert string_splitter_factory(alg)(x) == expected
+
+
+def test_string_splitter_factory_ascii_engine_ignores_unicode_numbers() -> None:
+    assert string_splitter_factory(ns.INT, "ascii")("a۱b1") == ["a۱b", "1", ""]
+    assert string_splitter_factory(ns.INT)("a۱b1") == ["a", "۱", "b", "1", ""]
+
+
+def test_string_splitter_factory_raises_on_invalid_engine() -> None:
+    with pytest.raises(ValueError, match="invalid engine"):
+        string_splitter_factory(ns.INT, "fast")
@@ -102,3 +102,16 @@ def test_string_component_transform_factory(
     except (ValueError, OSError) as e:  # handle broken locale lib on OSX.
         if all(x not in str(e) for x in ("is not in range", "Invalid argument")):
             raise
+
+
+def test_string_component_transform_factory_remembers_locale_transforms() -> None:
+    func = string_component_transform_factory(ns.LOCALE)
+    expected = [get_strxfrm()("apple"), 5, get_strxfrm()("apple")]
+    assert list(func(("apple", "5", "apple"))) == expected
+    assert func.cache_info().hits == 1  # type: ignore[attr-defined]
+    assert func.cache_info().misses == 1  # type: ignore[attr-defined]
+
+
+def test_string_component_transform_factory_has_no_cache_without_locale() -> None:
+    func = string_component_transform_factory(ns.GROUPLETTERS)
+    assert not hasattr(func, "cache_info")
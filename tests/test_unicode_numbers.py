@@ -4,18 +4,26 @@ Test the Unicode numbers module.
 
 from __future__ import annotations
 
+import re
+import sys
 import unicodedata
 import warnings
+from typing import Callable
 
+import pytest
+
+from natsort import unicode_numeric_hex
 from natsort.unicode_numbers import (
     decimal_chars,
     decimals,
     digit_chars,
     digits,
     digits_no_decimals,
+    digits_no_decimals_class,
     numeric,
     numeric_chars,
     numeric_no_decimals,
+    numeric_no_decimals_class,
 )
 from natsort.unicode_numeric_hex import numeric_hex
 
@@ -79,3 +87,59 @@ def test_combined_string_contains_all_characters_in_list() -> None:
     assert numeric == "".join(numeric_chars)
     assert digits == "".join(digit_chars)
     assert decimals == "".join(decimal_chars)
+
+
+def test_pregenerated_strings_are_the_characters_this_python_knows() -> None:
+    # This is how the strings used to be built at import time.
+    chars = [chr(a) for a in numeric_hex]
+    expected_numeric = [a for a in chars if unicodedata.numeric(a, None) is not None]
+    assert numeric == "".join(expected_numeric)
+    assert digits == "".join(
+        [a for a in expected_numeric if unicodedata.digit(a, None) is not None]
+    )
+    assert decimals == "".join(
+        [a for a in expected_numeric if unicodedata.decimal(a, None) is not None]
+    )
+    assert digits_no_decimals == "".join([x for x in digits if x not in decimals])
+    assert numeric_no_decimals == "".join([x for x in numeric if x not in decimals])
+
+
+@pytest.mark.skipif(
+    unicodedata.unidata_version != unicode_numeric_hex.unicode_version,
+    reason="the tables were generated for a different unicode version",
+)
+def test_pregenerated_tables_are_up_to_date() -> None:
+    expected = [
+        chr(i)
+        for i in range(sys.maxunicode + 1)
+        if chr(i) not in "0123456789" and unicodedata.numeric(chr(i), None) is not None
+    ]
+    assert numeric == "".join(expected)
+    assert numeric_hex == tuple(map(ord, expected))
+
+
+@pytest.mark.parametrize(
+    ("char_class", "chars", "value"),
+    [
+        (
+            digits_no_decimals_class,
+            unicode_numeric_hex.digits_no_decimals,
+            unicodedata.digit,
+        ),
+        (
+            numeric_no_decimals_class,
+            unicode_numeric_hex.numeric_no_decimals,
+            unicodedata.numeric,
+        ),
+    ],
+)
+def test_character_class_matches_exactly_the_characters(
+    char_class: str,
+    chars: str,
+    value: Callable[[str, None], float | None],
+) -> None:
+    # Only the characters this Python knows to be numerals can be matched.
+    expected = "".join([c for c in chars if value(c, None) is not None])
+    every_char = "".join(map(chr, range(sys.maxunicode + 1)))
+    assert "".join(re.findall(f"[{char_class}]", every_char)) == expected
+    assert len(char_class) < len(expected)
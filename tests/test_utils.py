@@ -196,3 +196,101 @@ def test_path_splitter_splits_path_string_by_sep_and_removes_extension(
         pathlib.Path(z).stem,
         pathlib.Path(z).suffix,
     )
+
+
+def _pathlib_path_splitter(s: str) -> tuple[str, ...]:
+    """Reference implementation of path_splitter that relies on pathlib."""
+    path = pathlib.PurePath(s)
+    *path_parts, base = path.parts or ("",)
+    base = base or str(path)
+    suffixes = []
+    for i, suffix in enumerate(reversed(pathlib.PurePath(base).suffixes)):
+        if suffix[1:2].isdigit() or i > 1 or len(suffix) > 5:
+            break
+        suffixes.append(suffix)
+    suffixes.reverse()
+    base = base.replace("".join(suffixes), "")
+    return tuple(filter(None, chain(path_parts, [base], suffixes)))
+
+
+@pytest.mark.parametrize(
+    "given",
+    ["", "/", "//", "///a", "//a/b", "a//b/./c/", "a/..", "a.", "a..b", ".bashrc"],
+)
+def test_path_splitter_matches_pathlib_example(given: str) -> None:
+    assert tuple(utils.path_splitter(given)) == _pathlib_path_splitter(given)
+
+
+@given(text(alphabet="/.\\ a1Z"))
+def test_path_splitter_matches_pathlib(x: str) -> None:
+    assert tuple(utils.path_splitter(x)) == _pathlib_path_splitter(x)
+
+
+def _characters(x: utils.PathArg) -> tuple[str, ...]:
+    return tuple(str(x))
+
+
+@given(lists(text(alphabet="/.a1"), max_size=8))
+def test_parse_path_factory_cache_does_not_change_result(x: list[str]) -> None:
+    cached = utils.parse_path_factory(_characters)
+    uncached = utils.parse_path_factory(_characters, cache_size=0)
+    assert [cached(y) for y in x] == [uncached(y) for y in x]
+
+
+def test_parse_path_factory_shares_parsed_directory_components() -> None:
+    func = utils.parse_path_factory(_characters)
+    a, b = func("/dir/a.txt"), func("/dir/b.txt")
+    assert a == (("/",), ("d", "i", "r"), ("a",), (".", "t", "x", "t"))
+    assert a[1] is b[1]
+    assert a[3] is b[3]
+
+
+def test_parse_template_factory_splits_into_template_and_slots() -> None:
+    parser = utils.parse_template_factory(
+        ns.INT,
+        utils.string_splitter_factory(ns.INT),
+        utils.input_string_transform_factory(ns.INT),
+    )
+    assert parser("frame_0012.v3.exr") == (("frame_", ".v", ".exr"), (12, 3))
+    assert parser("no numbers") == (("no numbers",), ())
+    assert parser("power²") is None
+
+
+def test_infer_template_requires_most_sampled_strings_to_share_a_template() -> None:
+    parser = utils.parse_template_factory(
+        ns.INT,
+        utils.string_splitter_factory(ns.INT),
+        utils.input_string_transform_factory(ns.INT),
+    )
+    assert utils.infer_template(["a1b", "a22b", "a3b"], parser) == ("a", "b")
+    assert utils.infer_template(["a1b", "a22c", "a3b"], parser) is None
+    assert utils.infer_template(["a1b", 5, "a3b"], parser) is None
+    assert utils.infer_template(["a1b"] * 7 + ["c"], parser) == ("a", "b")
+    assert utils.infer_template([], parser) is None
+
+
+@pytest.mark.parametrize("alg", [ns.INT, ns.SIGNED, ns.FLOAT, ns.REAL | ns.NOEXP])
+@given(lists(text()))
+def test_string_batch_splitter_factory_splits_identically(
+    alg: NSType,
+    x: list[str],
+) -> None:
+    expected = [utils.string_splitter_factory(alg)(y) for y in x]
+    assert utils.string_batch_splitter_factory(alg)(x) == expected
+
+
+@given(x=text(), y=text(), z=integers())
+def test_remainder_is_greater_than_numbers_and_ordered_by_text(
+    x: str, y: str, z: int
+) -> None:
+    a, b = utils.Remainder(x), utils.Remainder(y)
+    assert z < a
+    assert a > z
+    assert not a < z
+    assert (a < b) is (x < y)
+    assert (a <= b) is (x <= y)
+    assert (a > b) is (x > y)
+    assert (a >= b) is (x >= y)
+    assert (a == b) is (x == y)
+    assert a == utils.Remainder(x)
+    assert hash(a) == hash(utils.Remainder(x))